@@ -0,0 +1,41 @@
+import os
+import FreeSimpleGUI as sg
+
+"""
+    Demo - Many Image elements playing animated GIFs
+
+    update_animation decodes GIF frames only when they're about to be shown and keeps at most
+    max_cached_frames of them.  Every Image element showing the same GIF shares one set of decoded frames,
+    so 20 spinners cost about the same as 1.
+
+    Passing time_between_frames=None plays each frame for as long as the GIF itself says to.
+"""
+
+ROWS, COLS = 4, 5
+
+
+def main():
+    gif = os.path.join(os.path.dirname(__file__), 'exampleGIF.gif')
+    sources = [sg.DEFAULT_BASE64_LOADING_GIF] + ([gif] if os.path.exists(gif) else [])
+
+    layout = [
+        [sg.Text(f'{ROWS * COLS} Image elements sharing {len(sources)} decoded GIF(s), played at their own speed')],
+        *[[sg.Image(key=(row, col)) for col in range(COLS)] for row in range(ROWS)],
+        [sg.Button('Exit')],
+    ]
+    window = sg.Window('Shared Animated GIFs', layout, finalize=True)
+
+    while True:
+        event, values = window.read(timeout=10)
+        if event in (sg.WIN_CLOSED, 'Exit'):
+            break
+        for row in range(ROWS):
+            for col in range(COLS):
+                source = sources[(row * COLS + col) % len(sources)]
+                window[(row, col)].update_animation(source, time_between_frames=None, max_cached_frames=30)
+
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
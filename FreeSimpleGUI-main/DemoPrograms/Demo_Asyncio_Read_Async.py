@@ -0,0 +1,54 @@
+import asyncio
+import random
+import FreeSimpleGUI as sg
+
+"""
+    Demo - Window.read_async - running a window and other coroutines on the same asyncio event loop
+
+    Instead of calling window.read(timeout=10) over and over, a coroutine awaits window.read_async().
+    While the window waits for an event the rest of your coroutines keep running.
+
+    The "ticker" coroutine below stands in for a network connection.  It sends what it gets to the window
+    with write_event_value, which returns that event from read_async right away.
+
+    When the window has nothing to do, read_async checks tkinter less and less often (up to every
+    poll_interval milliseconds) so the program uses almost no CPU while it's idle.
+"""
+
+
+async def ticker(window, stop):
+    price = 100.0
+    while not stop.is_set():
+        await asyncio.sleep(random.uniform(0.05, 0.5))
+        price += random.uniform(-1, 1)
+        window.write_event_value('-PRICE-', price)
+
+
+async def main():
+    layout = [
+        [sg.Text('Price'), sg.Text(key='-PRICE-', size=10)],
+        [sg.Text('Clicks'), sg.Text('0', key='-CLICKS-', size=10)],
+        [sg.Button('Click'), sg.Button('Exit')],
+    ]
+    window = sg.Window('asyncio', layout, finalize=True)
+
+    stop = asyncio.Event()
+    task = asyncio.create_task(ticker(window, stop))
+    clicks = 0
+    while True:
+        event, values = await window.read_async()
+        if event in (sg.WIN_CLOSED, 'Exit'):
+            break
+        if event == '-PRICE-':
+            window['-PRICE-'].update(f'{values[event]:.2f}')
+        elif event == 'Click':
+            clicks += 1
+            window['-CLICKS-'].update(clicks)
+
+    stop.set()
+    await task
+    window.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
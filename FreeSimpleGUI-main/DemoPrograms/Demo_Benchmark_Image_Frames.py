@@ -0,0 +1,75 @@
+import io
+import time
+import numpy as np
+from PIL import Image as PILImage
+import FreeSimpleGUI as sg
+
+"""
+    Benchmark - Image element frame rate: update(data=PNG) versus update_pixels
+
+    The usual way to show video or an animated plot is to encode every frame as a PNG and call
+    Image.update(data=png_bytes).  tkinter then decodes the PNG into a brand new PhotoImage.
+
+    Image.update_pixels takes the NumPy array directly and copies the pixels into one PhotoImage that is
+    reused for every frame.  No PNG encode, no PNG decode, no new image each frame.
+
+    Requires numpy and Pillow (Pillow is only used for the PNG path).
+"""
+
+SIZES = ((640, 480), (1280, 720), (1920, 1080))
+SECONDS = 3
+
+
+def make_frames(width, height, count=30):
+    x = np.linspace(0, 2 * np.pi, width, dtype=np.float32)
+    y = np.linspace(0, 2 * np.pi, height, dtype=np.float32)[:, None]
+    frames = []
+    for i in range(count):
+        phase = i * 2 * np.pi / count
+        red = (np.sin(x + phase) * 127 + 128) * np.ones_like(y)
+        green = (np.cos(y + phase) * 127 + 128) * np.ones_like(x)
+        blue = np.full((height, width), i * 255 // count, dtype=np.float32)
+        frames.append(np.dstack((red, green, blue)).astype(np.uint8))
+    return frames
+
+
+def run(window, frames, use_pixels):
+    image = window['-IMAGE-']
+    shown = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < SECONDS:
+        frame = frames[shown % len(frames)]
+        if use_pixels:
+            image.update_pixels(frame)
+        else:
+            png = io.BytesIO()
+            PILImage.fromarray(frame).save(png, format='PNG', compress_level=1)
+            image.update(data=png.getvalue())
+        shown += 1
+        event, values = window.read(timeout=0)
+        if event == sg.WIN_CLOSED:
+            return None
+    return shown / (time.perf_counter() - start)
+
+
+def main():
+    layout = [[sg.Text(key='-STATUS-', size=60)], [sg.Image(key='-IMAGE-')]]
+    window = sg.Window('Image Frame Rate Benchmark', layout, finalize=True)
+    results = []
+    for width, height in SIZES:
+        frames = make_frames(width, height)
+        window['-STATUS-'].update(f'{width}x{height} update(data=PNG)')
+        png_fps = run(window, frames, use_pixels=False)
+        window['-STATUS-'].update(f'{width}x{height} update_pixels')
+        pixels_fps = run(window, frames, use_pixels=True)
+        if png_fps is None or pixels_fps is None:
+            break
+        results.append(f'{width:>5}x{height:<5} PNG: {png_fps:6.1f} fps   update_pixels: {pixels_fps:6.1f} fps   {pixels_fps / png_fps:4.1f}x')
+        print(results[-1])
+    window.close()
+    if results:
+        sg.popup_scrolled('\n'.join(results), title='Results', font='Courier 10', size=(80, 6))
+
+
+if __name__ == '__main__':
+    main()
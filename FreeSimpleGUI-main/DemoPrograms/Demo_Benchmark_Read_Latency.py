@@ -0,0 +1,52 @@
+import time
+import FreeSimpleGUI as sg
+
+"""
+    Benchmark - Window.read latency versus number of elements
+
+    Every call to window.read() builds the values dictionary.  Normally that means walking the entire layout
+    and asking tkinter for the value of every element.  Windows created with incremental_results=True keep a
+    flat list of the value-bearing elements and only ask tkinter for the values that changed.
+
+    This program builds windows of increasing size (Inputs, Checkboxes and Combos spread over Frames and Columns),
+    changes ONE element per read, and reports the average time of a read(timeout=0) for both modes.
+"""
+
+SIZES = (100, 200, 400, 800)
+READS = 200
+
+
+def make_layout(count):
+    rows_per_frame = 20
+    frames = []
+    for f in range(count // (rows_per_frame * 2)):
+        rows = []
+        for r in range(rows_per_frame):
+            n = f * rows_per_frame + r
+            rows.append([sg.Input(str(n), size=6, k=('-IN-', n)), sg.Checkbox('', k=('-CB-', n)) if n % 2 else sg.Combo(['a', 'b', 'c'], 'a', k=('-CB-', n))])
+        frames.append(sg.Frame(f'Frame {f}', [[sg.Column(rows)]]))
+    return [[sg.Column([frames], scrollable=True, size=(800, 600))], [sg.Button('Exit')]]
+
+
+def time_reads(count, incremental):
+    window = sg.Window(f'{count} elements', make_layout(count), incremental_results=incremental, finalize=True)
+    window.read(timeout=0)
+    start = time.perf_counter()
+    for i in range(READS):
+        window[('-IN-', i % (count // 2))].update(str(i))
+        window.read(timeout=0)
+    elapsed = (time.perf_counter() - start) / READS
+    window.close()
+    return elapsed * 1000
+
+
+def main():
+    print(f'{"elements":>10} {"full walk ms":>14} {"incremental ms":>16} {"speedup":>9}')
+    for count in SIZES:
+        full = time_reads(count, False)
+        incremental = time_reads(count, True)
+        print(f'{count:>10} {full:>14.3f} {incremental:>16.3f} {full / incremental:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import threading
+import time
+import FreeSimpleGUI as sg
+
+"""
+    Demo - Benchmark of threads sending events to a window
+
+    A thread writes events as fast as it can for a few seconds while the window reads them and
+    updates a progress bar.  The window reports how many events per second the thread managed to
+    write and how many reads it took the window to get them.
+
+        No coalescing          - every value is its own event, one read each
+        EVENT_COALESCE_LATEST  - values written while the window is busy replace the one that's waiting
+        EVENT_COALESCE_LIST    - values written while the window is busy are collected into a list
+        write_event_values     - the thread writes its events 100 at a time
+
+    The window is only woken up when there's nothing waiting for it, so in every mode the thread is no longer
+    held back by tkinter.
+"""
+
+SECONDS = 3
+MODES = ('No coalescing', 'EVENT_COALESCE_LATEST', 'EVENT_COALESCE_LIST', 'write_event_values')
+
+
+def worker(window, mode, stop):
+    written = 0
+    coalesce = {'EVENT_COALESCE_LATEST': sg.EVENT_COALESCE_LATEST, 'EVENT_COALESCE_LIST': sg.EVENT_COALESCE_LIST}.get(mode)
+    while not stop.is_set():
+        if mode == 'write_event_values':
+            window.write_event_values([('-PROGRESS-', written + i) for i in range(100)])
+            written += 100
+        else:
+            window.write_event_value('-PROGRESS-', written, coalesce=coalesce)
+            written += 1
+    window.write_event_value('-DONE-', written)
+
+
+def main():
+    layout = [
+        [sg.Combo(MODES, default_value=MODES[0], readonly=True, key='-MODE-'), sg.Button('Go'), sg.Button('Exit')],
+        [sg.ProgressBar(100, size=(40, 20), key='-BAR-')],
+        [sg.Multiline(size=(80, 10), key='-RESULTS-', disabled=True)],
+    ]
+    window = sg.Window('Thread Event Benchmark', layout, finalize=True)
+
+    stop = threading.Event()
+    reads = delivered = 0
+    start = 0
+    while True:
+        event, values = window.read()
+        if event in (sg.WIN_CLOSED, 'Exit'):
+            stop.set()
+            break
+        if event == 'Go':
+            stop.clear()
+            reads = delivered = 0
+            start = time.perf_counter()
+            threading.Thread(target=worker, args=(window, values['-MODE-'], stop), daemon=True).start()
+            window.start_thread(lambda: (time.sleep(SECONDS), stop.set()))
+        elif event == '-PROGRESS-':
+            reads += 1
+            value = values[event]
+            delivered += len(value) if isinstance(value, list) else 1
+            window['-BAR-'].update((reads // 100) % 100)
+        elif event == '-DONE-':
+            elapsed = time.perf_counter() - start
+            window['-RESULTS-'].print(
+                f'{values["-MODE-"]:<24} {values[event] / elapsed:>10,.0f} events/s written   '
+                f'{reads / elapsed:>8,.0f} reads/s   {delivered:,} values read before the thread stopped'
+            )
+
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
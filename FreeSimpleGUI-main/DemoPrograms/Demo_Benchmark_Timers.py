@@ -0,0 +1,59 @@
+import statistics
+import threading
+import time
+import FreeSimpleGUI as sg
+
+"""
+    Benchmark - Window timers: jitter, drift and thread count
+
+    Starts TIMERS repeating timers with window.timer_start and reads the timer events for SECONDS seconds.
+    For each timer event the arrival time is compared with when it should have arrived (start + n * period).
+
+    All timers in a program are run by a single scheduler thread, so the thread count stays the same no matter
+    how many timers are running.  Deadlines are absolute so the error doesn't grow the longer a timer runs.
+"""
+
+TIMERS = 50
+PERIOD_MS = 20
+SECONDS = 5
+
+
+def main():
+    layout = [[sg.Text('Running timers...', key='-STATUS-', size=60)], [sg.Button('Exit')]]
+    window = sg.Window('Timer Benchmark', layout, finalize=True)
+
+    threads_before = threading.active_count()
+    start = time.monotonic()
+    timer_ids = [window.timer_start(PERIOD_MS, key=('-TIMER-', i)) for i in range(TIMERS)]
+    threads_running = threading.active_count()
+
+    ticks = {timer_id: 0 for timer_id in timer_ids}
+    errors = []
+    while time.monotonic() - start < SECONDS:
+        event, values = window.read(timeout=100)
+        if event in (sg.WIN_CLOSED, 'Exit'):
+            break
+        if isinstance(event, tuple) and event[0] == '-TIMER-':
+            timer_id = values[event]
+            ticks[timer_id] += 1
+            expected = start + ticks[timer_id] * PERIOD_MS / 1000
+            errors.append((time.monotonic() - expected) * 1000)
+    window.timer_stop_all()
+
+    if errors:
+        last_quarter = errors[len(errors) * 3 // 4 :]
+        report = (
+            f'{TIMERS} timers every {PERIOD_MS} ms for {SECONDS} s\n'
+            f'threads before: {threads_before}  while running: {threads_running}\n'
+            f'events: {len(errors):,} (expected about {TIMERS * SECONDS * 1000 // PERIOD_MS:,})\n'
+            f'lateness ms - mean {statistics.mean(errors):.2f}  stdev {statistics.pstdev(errors):.2f}  max {max(errors):.2f}\n'
+            f'mean lateness in the last quarter (drift check): {statistics.mean(last_quarter):.2f} ms'
+        )
+        print(report)
+        window['-STATUS-'].update(report)
+        window.read()
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
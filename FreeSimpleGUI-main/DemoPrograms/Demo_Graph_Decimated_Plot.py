@@ -0,0 +1,56 @@
+import time
+import numpy as np
+import FreeSimpleGUI as sg
+
+"""
+    Demo - Plotting 1,000,000 samples with decimate
+
+    A Graph that's 800 pixels wide can't show more than 800 columns of a line.  With decimate=True,
+    draw_lines (and update_figure / draw_figures) only draws the first, last, lowest and highest sample
+    that land in each pixel column.  The plot looks the same, spikes and all, but it's thousands of points
+    instead of a million.
+
+    Uncheck Decimate to see how long drawing every sample takes.
+"""
+
+SAMPLES = 1_000_000
+
+
+def make_trace():
+    x = np.arange(SAMPLES)
+    y = np.sin(x / 20_000) * 3 + np.random.normal(0, 0.4, SAMPLES)
+    spikes = np.random.randint(0, SAMPLES, 5)
+    y[spikes] = np.random.choice((-4.8, 4.8), 5)  # single-sample spikes still show up when decimated
+    return np.column_stack((x, y))
+
+
+def main():
+    layout = [
+        [sg.Graph((800, 400), (0, -5), (SAMPLES, 5), background_color='black', key='-GRAPH-')],
+        [sg.Checkbox('Decimate', default=True, key='-DECIMATE-'), sg.Button('New Data'), sg.Button('Exit')],
+        [sg.Text(key='-STATUS-')],
+    ]
+    window = sg.Window('Decimated Plot', layout, finalize=True)
+    graph = window['-GRAPH-']  # type: sg.Graph
+
+    trace = None
+    event, values = 'New Data', {'-DECIMATE-': True}
+    while True:
+        if event in (sg.WIN_CLOSED, 'Exit'):
+            break
+        if event == 'New Data':
+            start = time.perf_counter()
+            if trace is None:
+                trace = graph.draw_lines(make_trace(), color='lime', decimate=values['-DECIMATE-'])
+            else:
+                graph.update_figure(trace, make_trace(), decimate=values['-DECIMATE-'])
+            window.refresh()
+            drawn = len(graph.tk_canvas.coords(trace)) // 2
+            window['-STATUS-'].update(f'{SAMPLES:,} samples, {drawn:,} points drawn in {(time.perf_counter() - start) * 1000:.0f} ms')
+        event, values = window.read()
+
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
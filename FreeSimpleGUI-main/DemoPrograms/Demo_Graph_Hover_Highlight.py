@@ -0,0 +1,70 @@
+import random
+import FreeSimpleGUI as sg
+
+"""
+    Demo - Hover highlighting thousands of figures
+
+    The Graph keeps an index of where its figures are, so these can be called on every mouse movement:
+
+        get_figure_at_location  - the top figure under a point
+        get_nearest_figure      - the figure closest to a point
+        get_figures_in_region   - all figures that overlap a rectangle
+
+    They use the bounding boxes of the figures.  The index is made the first time one of them is called and
+    the drawing, moving and deleting methods keep it up to date after that.
+
+    Move the mouse to highlight the square under it (or the nearest one within 20 pixels).
+    Drag to select every square in a rectangle.
+"""
+
+SQUARES = 5000
+
+
+def main():
+    layout = [
+        [sg.Graph((800, 600), (0, 0), (800, 600), key='-GRAPH-', background_color='white', enable_events=True, drag_submits=True, motion_events=True)],
+        [sg.Text(key='-STATUS-', size=60)],
+    ]
+    window = sg.Window('Hover Highlight', layout, finalize=True)
+    graph = window['-GRAPH-']  # type: sg.Graph
+
+    for _ in range(SQUARES):
+        x, y = random.randint(0, 790), random.randint(10, 600)
+        graph.draw_rectangle((x, y), (x + 8, y - 8), fill_color='lightblue', line_color='steelblue')
+
+    highlighted, selected, drag_start, selection_box = None, [], None, None
+    while True:
+        event, values = window.read()
+        if event == sg.WIN_CLOSED:
+            break
+        location = values['-GRAPH-']
+        if event == '-GRAPH-+MOVE':
+            figure = graph.get_figure_at_location(location) or graph.get_nearest_figure(location, max_distance=20)
+            if figure != highlighted:
+                if highlighted is not None:
+                    graph.tk_canvas.itemconfigure(highlighted, fill='orange' if highlighted in selected else 'lightblue')
+                if figure is not None:
+                    graph.tk_canvas.itemconfigure(figure, fill='red')
+                highlighted = figure
+            window['-STATUS-'].update(f'Mouse at {location}  figure {figure}')
+        elif event == '-GRAPH-':  # dragging
+            if drag_start is None:
+                drag_start = location
+            if selection_box is not None:
+                graph.delete_figure(selection_box)
+            selection_box = graph.draw_rectangle(drag_start, location, line_color='black')
+        elif event == '-GRAPH-+UP' and drag_start is not None:
+            graph.delete_figure(selection_box)
+            for figure in selected:
+                graph.tk_canvas.itemconfigure(figure, fill='lightblue')
+            selected = graph.get_figures_in_region(drag_start, location)
+            for figure in selected:
+                graph.tk_canvas.itemconfigure(figure, fill='orange')
+            window['-STATUS-'].update(f'{len(selected)} squares selected')
+            drag_start = selection_box = None
+
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+import time
+import numpy as np
+import FreeSimpleGUI as sg
+
+"""
+    Demo - Live plot without erasing the Graph
+
+    Erasing a Graph and drawing everything again every frame means thousands of figures are deleted and created
+    each time.  Instead, draw the figures once and then move them:
+
+        update_figure   - gives an existing figure (a 10,000 point line here) new coordinates
+        draw_figures    - draws many figures of one kind at once.  With a group name, calling it again
+                          moves the figures already drawn and only adds or removes figures if the count changes
+
+    Both take NumPy arrays of points as well as lists.
+"""
+
+POINTS = 10_000
+DOTS = 500
+
+
+def main():
+    layout = [
+        [sg.Graph((800, 400), (0, -1.5), (POINTS, 1.5), background_color='black', key='-GRAPH-')],
+        [sg.Text(key='-FPS-', size=30), sg.Button('Exit')],
+    ]
+    window = sg.Window('Retained Graph Figures', layout, finalize=True)
+    graph = window['-GRAPH-']  # type: sg.Graph
+
+    x = np.arange(POINTS)
+    trace = graph.draw_lines(np.column_stack((x, np.sin(x / 500))), color='yellow')
+    graph.draw_line((0, 0), (POINTS, 0), color='gray')
+
+    frames, start, phase = 0, time.perf_counter(), 0.0
+    while True:
+        event, values = window.read(timeout=0)
+        if event in (sg.WIN_CLOSED, 'Exit'):
+            break
+        phase += 0.1
+        y = np.sin(x / 500 + phase) * np.cos(x / 3000 - phase / 3)
+        graph.update_figure(trace, np.column_stack((x, y)))
+
+        dots_x = np.random.randint(0, POINTS, DOTS)
+        dots = np.column_stack((dots_x, y[dots_x] + np.random.normal(0, 0.1, DOTS)))
+        graph.draw_figures('point', dots, fill_color='red', size=40, group='noise')
+
+        frames += 1
+        elapsed = time.perf_counter() - start
+        if elapsed > 1:
+            window['-FPS-'].update(f'{frames / elapsed:.1f} frames per second')
+            frames, start = 0, time.perf_counter()
+
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
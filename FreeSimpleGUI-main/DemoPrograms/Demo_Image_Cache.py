@@ -0,0 +1,36 @@
+import time
+import FreeSimpleGUI as sg
+
+"""
+    Demo - Shared image cache
+
+    Every image given to a Button, Image, Tab, Tree node, ... is decoded once and then shared by everything
+    that uses the same picture, no matter if it came from a file or from base64 data.  Resized variants
+    (image_subsample / image_zoom) are made once too.
+
+    This window has 400 buttons that all use the same icon.  The first window pays for decoding it, opening
+    the window again only costs the time to make the widgets.
+"""
+
+ROWS, COLS = 20, 20
+
+
+def make_window():
+    layout = [[sg.Button(image_data=sg.DEFAULT_BASE64_ICON, image_subsample=2, key=(row, col), border_width=0) for col in range(COLS)] for row in range(ROWS)]
+    layout += [[sg.Text(key='-STATUS-')], [sg.Button('Reopen'), sg.Button('Exit')]]
+    return sg.Window('Image Cache', layout, finalize=True)
+
+
+def main():
+    while True:
+        start = time.perf_counter()
+        window = make_window()
+        window['-STATUS-'].update(f'{ROWS * COLS} image buttons created in {(time.perf_counter() - start) * 1000:.0f} ms')
+        event, values = window.read()
+        window.close()
+        if event != 'Reopen':
+            break
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+import random
+import threading
+import time
+import FreeSimpleGUI as sg
+
+"""
+    Demo - read_all_windows with many windows that threads send events to
+
+    Each of the small windows has a thread sending it readings with write_event_value, some slowly and one
+    very quickly.  read_all_windows returns their events one window at a time, so the fast window can't
+    hold up the others and the buttons still respond right away.
+
+    The main window shows Window.get_event_stats for each window:
+        events            - how many events have been read from it
+        events_per_second - how many it's been getting lately
+        queued            - events its thread has written that haven't been read yet
+"""
+
+WINDOWS = 24
+
+
+def sensor(window, delay, stop):
+    reading = 0
+    while not stop.is_set():
+        time.sleep(delay)
+        reading += random.uniform(-1, 1)
+        window.write_event_value('-READING-', reading)
+
+
+def main():
+    stop = threading.Event()
+    sensors = []
+    for i in range(WINDOWS):
+        layout = [[sg.Text(key='-READING-', size=12)], [sg.Button('Reset')]]
+        window = sg.Window(f'Sensor {i}', layout, location=(100 + (i % 8) * 150, 100 + (i // 8) * 110), finalize=True)
+        delay = 0.0005 if i == 0 else random.uniform(0.05, 1)
+        threading.Thread(target=sensor, args=(window, delay, stop), daemon=True).start()
+        sensors.append(window)
+
+    headings = ['Window', 'Events', 'Events/s', 'Queued']
+    main_window = sg.Window('Dashboard', [[sg.Table([], headings=headings, num_rows=WINDOWS, key='-STATS-')], [sg.Button('Exit')]],
+                            location=(100, 500), finalize=True)
+    main_window.timer_start(500)
+
+    while True:
+        window, event, values = sg.read_all_windows()
+        if window == main_window and event in (sg.WIN_CLOSED, 'Exit'):
+            break
+        if event == sg.EVENT_TIMER:
+            rows = []
+            for sensor_window in sensors:
+                stats = sensor_window.get_event_stats()
+                rows.append([sensor_window.Title, stats['events'], f"{stats['events_per_second']:.1f}", stats['queued']])
+            main_window['-STATS-'].update(rows)
+        elif event == '-READING-':
+            window['-READING-'].update(f'{values[event]:.2f}')
+        elif event == 'Reset':
+            window['-READING-'].update('Reset!')
+
+    stop.set()
+    for window in sensors + [main_window]:
+        window.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+import threading
+import time
+import FreeSimpleGUI as sg
+
+"""
+    Demo - Buffered Multiline output
+
+    A thread prints as fast as it can - tens of thousands of lines a second.  Without buffering every print
+    becomes a separate insert into the tkinter Text widget and the window stops responding.
+
+    With buffered=True the prints are collected and added to the Multiline in one insert every
+    flush_interval milliseconds.  Colors are kept for each print.  max_lines keeps only the newest lines.
+
+    Because printing to a buffered Multiline only adds to the buffer, it's safe to print from a thread.
+"""
+
+
+def chatty_thread(window, stop):
+    count = 0
+    while not stop.is_set():
+        count += 1
+        color = ('red' if count % 100 == 0 else 'green') if count % 10 == 0 else None
+        sg.cprint(f'Line {count:,} from the thread', t=color)
+        if count % 10_000 == 0:
+            window.write_event_value('-COUNT-', count)
+            time.sleep(0.01)
+
+
+def main():
+    layout = [
+        [sg.Text('Output from a very chatty thread')],
+        [sg.Multiline(size=(80, 30), buffered=True, flush_interval=50, max_lines=5000, autoscroll=True, reroute_cprint=True, write_only=True, expand_x=True, expand_y=True, key='-ML-')],
+        [sg.Text(key='-STATUS-', size=40), sg.Button('Start'), sg.Button('Stop'), sg.Button('Exit')],
+    ]
+    window = sg.Window('Buffered Multiline', layout, resizable=True, finalize=True)
+
+    stop = threading.Event()
+    start_time = None
+    while True:
+        event, values = window.read()
+        if event in (sg.WIN_CLOSED, 'Exit'):
+            break
+        if event == 'Start' and start_time is None:
+            stop.clear()
+            start_time = time.perf_counter()
+            threading.Thread(target=chatty_thread, args=(window, stop), daemon=True).start()
+        elif event == 'Stop':
+            stop.set()
+            start_time = None
+        elif event == '-COUNT-' and start_time is not None:
+            rate = values[event] / (time.perf_counter() - start_time)
+            window['-STATUS-'].update(f'{values[event]:,} lines printed, {rate:,.0f} lines/sec')
+
+    stop.set()
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
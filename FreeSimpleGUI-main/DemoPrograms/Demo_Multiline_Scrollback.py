@@ -0,0 +1,52 @@
+import os
+import tempfile
+import time
+import FreeSimpleGUI as sg
+
+"""
+    Demo - Bounded scrollback for a Multiline that stdout is rerouted to
+
+    A program that runs for days and prints into a Multiline will eventually have millions of lines in the
+    tkinter Text widget.  Memory use and redraw time keep growing.
+
+    max_lines (or max_chars) keeps the widget at a fixed size.  Lines are removed from the top in chunks
+    (trim_chunk) so the cost is spread out instead of paid on every print.
+
+    With scrollback_file the removed lines are appended to a file so nothing is lost.  Here the Search
+    button looks through everything that was printed, including what's no longer in the window.
+"""
+
+
+def main():
+    scrollback = os.path.join(tempfile.gettempdir(), 'demo_scrollback.txt')
+    if os.path.exists(scrollback):
+        os.remove(scrollback)
+
+    layout = [
+        [sg.Text('Only the newest 1,000 lines are kept in the window. Older lines are saved to:')],
+        [sg.Text(scrollback)],
+        [sg.Multiline(size=(80, 25), max_lines=1000, trim_chunk=200, scrollback_file=scrollback, reroute_stdout=True, autoscroll=True, write_only=True, key='-ML-')],
+        [sg.Text('Search for'), sg.Input(size=20, key='-SEARCH-'), sg.Button('Search'), sg.Button('Exit')],
+        [sg.Text(key='-STATUS-')],
+    ]
+    window = sg.Window('Multiline Scrollback', layout, finalize=True)
+
+    count = 0
+    while True:
+        event, values = window.read(timeout=10)
+        if event in (sg.WIN_CLOSED, 'Exit'):
+            break
+        for _ in range(100):
+            count += 1
+            print(f'{time.strftime("%H:%M:%S")} log line {count}')
+        if event == 'Search' and values['-SEARCH-']:
+            text = window['-ML-'].get(include_scrollback=True)
+            matches = [line for line in text.splitlines() if values['-SEARCH-'] in line]
+            window['-STATUS-'].update(f'{len(matches)} matches in {count:,} lines. First: {matches[0] if matches else ""}')
+
+    window['-ML-'].restore_stdout()
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
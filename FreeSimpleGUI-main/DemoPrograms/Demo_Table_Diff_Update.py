@@ -0,0 +1,56 @@
+import random
+import FreeSimpleGUI as sg
+
+"""
+    Demo - Refreshing a live Table with diff updates
+
+    A normal Table.update(values=...) deletes every row and inserts them all again.  With diff=True only the
+    rows that changed are rewritten.  With row_id_column set, rows are matched by that column so rows that
+    moved (because the table is sorted by price for example) are moved instead of rewritten.
+
+    Selection and scroll position are kept.  The status line shows how many Treeview operations each
+    update needed (Table.last_update_operations).
+"""
+
+SYMBOLS = [f'SYM{i:04}' for i in range(2000)]
+
+
+def main():
+    prices = {sym: round(random.uniform(1, 500), 2) for sym in SYMBOLS}
+
+    def table_data(sort_by_price):
+        rows = [[sym, prices[sym]] for sym in SYMBOLS]
+        if sort_by_price:
+            rows.sort(key=lambda row: row[1])
+        return rows
+
+    layout = [
+        [sg.Table(table_data(False), headings=['Symbol', 'Price'], num_rows=25, key='-TABLE-', select_mode=sg.TABLE_SELECT_MODE_EXTENDED)],
+        [sg.Radio('Full update', 'MODE', key='-FULL-'), sg.Radio('Diff', 'MODE', key='-DIFF-'), sg.Radio('Diff keyed by symbol', 'MODE', True, key='-KEYED-')],
+        [sg.Checkbox('Sort by price', key='-SORT-')],
+        [sg.Text(size=60, key='-STATUS-')],
+        [sg.Button('Exit')],
+    ]
+    window = sg.Window('Live Table', layout)
+
+    while True:
+        event, values = window.read(timeout=1000)
+        if event in (sg.WIN_CLOSED, 'Exit'):
+            break
+        for sym in random.sample(SYMBOLS, 20):  # a few prices change every second
+            prices[sym] = round(prices[sym] * random.uniform(0.95, 1.05), 2)
+        data = table_data(values['-SORT-'])
+        table = window['-TABLE-']
+        if values['-FULL-']:
+            table.update(values=data)
+        elif values['-DIFF-']:
+            table.update(values=data, diff=True)
+        else:
+            table.update(values=data, row_id_column=0)
+        window['-STATUS-'].update(f'Treeview operations for last update: {table.last_update_operations}')
+
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+import random
+import string
+import time
+import FreeSimpleGUI as sg
+
+"""
+    Demo - Built-in Table sorting and filtering
+
+    enable_sorting=True makes a click on a column heading sort the table by that column (click again to reverse).
+    Table.filter(text) shows only the rows containing the text.  Typing more characters only searches the rows
+    that already matched.
+
+    The table below has 100,000 rows and is virtual, so re-sorting only reloads the visible rows.  Each column's
+    sort order is computed once and reused until the table's values change.
+
+    The rows in the values dictionary are positions in the sorted / filtered table.  get_source_rows() turns
+    them back into rows of the data you passed in.
+"""
+
+ROWS = 100_000
+
+
+def make_data():
+    return [[i, ''.join(random.choices(string.ascii_uppercase, k=6)), f'{random.uniform(0, 1000):.2f}', random.choice(['red', 'green', 'blue', None])] for i in range(ROWS)]
+
+
+def main():
+    data = make_data()
+    layout = [
+        [sg.Text('Filter'), sg.Input(key='-FILTER-', enable_events=True), sg.Checkbox('Name column only', key='-NAME ONLY-', enable_events=True)],
+        [
+            sg.Table(
+                data,
+                headings=['ID', 'Name', 'Price', 'Color'],
+                enable_sorting=True,
+                virtual=True,
+                num_rows=25,
+                enable_events=True,
+                expand_x=True,
+                expand_y=True,
+                key='-TABLE-',
+            )
+        ],
+        [sg.Text(key='-STATUS-', size=80)],
+        [sg.Button('New Data'), sg.Button('Exit')],
+    ]
+    window = sg.Window('Sort and Filter', layout, resizable=True)
+
+    while True:
+        event, values = window.read()
+        if event in (sg.WIN_CLOSED, 'Exit'):
+            break
+        table = window['-TABLE-']
+        if event in ('-FILTER-', '-NAME ONLY-'):
+            start = time.perf_counter()
+            table.filter(values['-FILTER-'], columns=[1] if values['-NAME ONLY-'] else None)
+            shown = len(table.view_rows) if table.view_rows is not None else len(data)
+            window['-STATUS-'].update(f'{shown:,} matching rows in {(time.perf_counter() - start) * 1000:.1f} ms')
+        elif event == '-TABLE-':
+            window['-STATUS-'].update(f'Selected data rows {table.get_source_rows()}')
+        elif event == 'New Data':
+            data = make_data()
+            table.update(values=data)  # the current sort and filter are applied to the new data
+
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
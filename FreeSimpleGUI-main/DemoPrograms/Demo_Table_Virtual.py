@@ -0,0 +1,78 @@
+import random
+import time
+import FreeSimpleGUI as sg
+
+"""
+    Demo - Virtual Table with 1,000,000 rows
+
+    A virtual Table only puts the rows you can see (plus a few above and below) into the tkinter Treeview.
+    The data can be any sequence (a list, a database cursor wrapper, ...) or, as shown here, a function
+    that is called with a row number and returns that row.
+
+    Scrolling, selecting and updating cost the same whether the table has 100 rows or 1,000,000.
+
+    Selected rows are reported as absolute row numbers in values[key] just like a normal Table.
+"""
+
+ROWS = 1_000_000
+headings = ['Row', 'Name', 'Price', 'Qty']
+names = ['Widget', 'Gadget', 'Doohickey', 'Thingamajig', 'Whatsit']
+
+
+def get_row(row):
+    rnd = random.Random(row)  # same row number always gives the same row
+    return [row, rnd.choice(names), f'{rnd.uniform(1, 100):.2f}', rnd.randint(1, 500)]
+
+
+def main():
+    layout = [
+        [sg.Text(f'A table with {ROWS:,} rows')],
+        [
+            sg.Table(
+                values=None,
+                row_callback=get_row,
+                row_count=ROWS,
+                headings=headings,
+                num_rows=25,
+                auto_size_columns=True,
+                alternating_row_color='gray20',
+                select_mode=sg.TABLE_SELECT_MODE_EXTENDED,
+                enable_events=True,
+                expand_x=True,
+                expand_y=True,
+                key='-TABLE-',
+            )
+        ],
+        [sg.Text('Go to row'), sg.Input(size=10, key='-ROW-'), sg.Button('Go'), sg.Button('Select 500000'), sg.Button('Double Rows'), sg.Button('Exit')],
+        [sg.Text(key='-STATUS-')],
+    ]
+
+    start = time.perf_counter()
+    window = sg.Window('Virtual Table', layout, resizable=True, finalize=True)
+    window['-STATUS-'].update(f'Window created in {(time.perf_counter() - start) * 1000:.0f} ms')
+
+    rows = ROWS
+    while True:
+        event, values = window.read()
+        if event in (sg.WIN_CLOSED, 'Exit'):
+            break
+        if event == '-TABLE-':
+            window['-STATUS-'].update(f'Selected rows: {values["-TABLE-"][:10]}')
+        elif event == 'Go':
+            try:
+                window['-TABLE-'].scroll_to_row(int(values['-ROW-']))
+            except ValueError:
+                pass
+        elif event == 'Select 500000':
+            window['-TABLE-'].update(select_rows=[500_000])
+        elif event == 'Double Rows':
+            start = time.perf_counter()
+            rows *= 2
+            window['-TABLE-'].update(row_count=rows)
+            window['-STATUS-'].update(f'Now {rows:,} rows. Update took {(time.perf_counter() - start) * 1000:.1f} ms')
+
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
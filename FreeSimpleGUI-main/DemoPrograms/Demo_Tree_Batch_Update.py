@@ -0,0 +1,67 @@
+import random
+import time
+import FreeSimpleGUI as sg
+
+"""
+    Demo - Streaming a log into a Tree with update_nodes
+
+    Every 50 ms a few hundred log lines "arrive".  Each line is added under its service and its level
+    (service -> level -> message).  Old messages are removed so the tree keeps at most MAX_MESSAGES.
+
+    All of the inserts and deletes for one tick are made with a single call to Tree.update_nodes, which
+    keeps the element's key lookups up to date and doesn't redraw until the whole batch is done.
+"""
+
+SERVICES = ['auth', 'billing', 'search', 'storage', 'web']
+LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR']
+MAX_MESSAGES = 20_000
+PER_TICK = 300
+
+
+def main():
+    treedata = sg.TreeData()
+    for service in SERVICES:
+        treedata.insert('', service, service, [''])
+        for level in LEVELS:
+            treedata.insert(service, (service, level), level, [''])
+
+    layout = [
+        [sg.Text('Log messages streamed into a Tree')],
+        [sg.Tree(treedata, headings=['Time'], col0_width=50, num_rows=25, expand_x=True, expand_y=True, key='-TREE-')],
+        [sg.Text(key='-STATUS-', expand_x=True), sg.Button('Pause'), sg.Button('Exit')],
+    ]
+    window = sg.Window('Log Tree', layout, resizable=True, finalize=True)
+    tree = window['-TREE-']
+
+    messages = []  # keys of the messages in the tree, oldest first
+    counter = 0
+    paused = False
+    while True:
+        event, values = window.read(timeout=50)
+        if event in (sg.WIN_CLOSED, 'Exit'):
+            break
+        if event == 'Pause':
+            paused = not paused
+            window['Pause'].update('Resume' if paused else 'Pause')
+        if paused:
+            continue
+
+        inserts = []
+        for _ in range(PER_TICK):
+            counter += 1
+            parent = (random.choice(SERVICES), random.choice(LEVELS))
+            inserts.append((parent, counter, f'message {counter}', [time.strftime('%H:%M:%S')]))
+            messages.append(counter)
+        deletes = messages[:-MAX_MESSAGES]
+        del messages[:-MAX_MESSAGES]
+
+        start = time.perf_counter()
+        tree.update_nodes(delete=deletes, insert=inserts)
+        elapsed = (time.perf_counter() - start) * 1000
+        window['-STATUS-'].update(f'{len(messages):,} messages. Last batch of {len(inserts) + len(deletes)} changes took {elapsed:.1f} ms')
+
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+import os
+import FreeSimpleGUI as sg
+
+"""
+    Demo - Lazy loading Tree
+
+    A normal Tree needs the entire TreeData built up front.  For a big folder that means walking every
+    sub-folder on the disk before the window even opens.
+
+    With children_callback the Tree asks for the children of a node only when that node is expanded.
+    The callback can return a list or be a generator.  Each child is a tuple:
+        (key, text, values, icon, has_children)
+    Nodes with has_children=True get an expand arrow without their children being read.
+
+    lazy_node_budget limits how many fetched nodes are kept.  When it's exceeded, the folders that were
+    collapsed longest ago forget their contents and read them again the next time they're opened.
+"""
+
+folder_icon = b'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAAsSAAALEgHS3X78AAABnUlEQVQ4y8WSv2rUQRSFv7vZgJFFsQg2EkWb4AvEJ8hqKVilSmFn3iNvIAp21oIW9haihBRKiqwElMVsIJjNrprsOr/5dyzml3UhEQIWHhjmcpn7zblw4B9lJ8Xag9mlmQb3AJzX3tOX8Tngzg349q7t5xcfzpKGhOFHnjx+9qLTzW8wsmFTL2Gzk7Y2O/k9kCbtwUZbV+Zvo8Md3PALrjoiqsKSR9ljpAJpwOsNtlfXfRvoNU8Arr/NsVo0ry5z4dZN5hoGqEzYDChBOoKwS/vSq0XW3y5NAI/uN1cvLqzQur4MCpBGEEd1PQDfQ74HYR+LfeQOAOYAmgAmbly+dgfid5CHPIKqC74L8RDyGPIYy7+QQjFWa7ICsQ8SpB/IfcJSDVMAJUwJkYDMNOEPIBxA/gnuMyYPijXAI3lMse7FGnIKsIuqrxgRSeXOoYZUCI8pIKW/OHA7kD2YYcpAKgM5ABXk4qSsdJaDOMCsgTIYAlL5TQFTyUIZDmev0N/bnwqnylEBQS45UKnHx/lUlFvA3fo+jwR8ALb47/oNma38cuqiJ9AAAAAASUVORK5CYII='
+file_icon = b'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAAsSAAALEgHS3X78AAABU0lEQVQ4y52TzStEURiHn/ecc6XG54JSdlMkNhYWsiILS0lsJaUsLW2Mv8CfIDtr2VtbY4GUEvmIZnKbZsY977Uwt2HcyW1+dTZvt6fn9557BGB+aaNQKBR2ifkbgWR+cX13ubO1svz++niVTA1ArDHDg91UahHFsMxbKWycYsjze4muTsP64vT43v7hSf/A0FgdjQPQWAmco68nB+T+SFSqNUQgcIbN1bn8Z3RwvL22MAvcu8TACFgrpMVZ4aUYcn77BMDkxGgemAGOHIBXxRjBWZMKoCPA2h6qEUSRR2MF6GxUUMUaIUgBCNTnAcm3H2G5YQfgvccYIXAtDH7FoKq/AaqKlbrBj2trFVXfBPAea4SOIIsBeN9kkCwxsNkAqRWy7+B7Z00G3xVc2wZeMSI4S7sVYkSk5Z/4PyBWROqvox3A28PN2cjUwinQC9QyckKALxj4kv2auK0xAAAAAElFTkSuQmCC'
+
+
+def main():
+    starting_path = sg.popup_get_folder('Folder to display', default_path=os.path.expanduser('~'))
+    if not starting_path:
+        return
+
+    def list_folder(key):
+        folder = key or starting_path
+        try:
+            entries = sorted(os.scandir(folder), key=lambda e: (not e.is_dir(), e.name.lower()))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield entry.path, entry.name, [''], folder_icon, True
+            else:
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    size = ''
+                yield entry.path, entry.name, [size], file_icon, False
+
+    layout = [
+        [sg.Text(f'Browsing {starting_path}')],
+        [
+            sg.Tree(
+                children_callback=list_folder,
+                lazy_node_budget=2000,
+                headings=['Size'],
+                auto_size_columns=False,
+                col_widths=[12],
+                num_rows=25,
+                col0_width=40,
+                enable_events=True,
+                expand_x=True,
+                expand_y=True,
+                key='-TREE-',
+            )
+        ],
+        [sg.Text(key='-STATUS-', expand_x=True), sg.Button('Exit')],
+    ]
+
+    window = sg.Window('Lazy Tree', layout, resizable=True, finalize=True)
+
+    while True:
+        event, values = window.read()
+        if event in (sg.WIN_CLOSED, 'Exit'):
+            break
+        if event == '-TREE-':
+            window['-STATUS-'].update(f'{values["-TREE-"]}   ({len(window["-TREE-"].KeyToID) - 1} nodes loaded)')
+
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
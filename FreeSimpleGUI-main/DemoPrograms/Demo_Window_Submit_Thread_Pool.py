@@ -0,0 +1,68 @@
+import random
+import time
+import FreeSimpleGUI as sg
+
+"""
+    Demo - Window.submit - running hundreds of tasks with a limited number of threads
+
+    perform_long_operation starts a new thread every time it's called.  Window.submit hands the function to a
+    pool of worker threads that belongs to the window instead.  At most max_worker_threads of them run at the
+    same time and the rest wait their turn.
+
+    submit returns a concurrent.futures.Future and sends events to the window:
+        end_key       - when the function returns, with the returned value
+        error_key     - if the function raises an exception, with the exception
+        progress_key  - each time the function calls the progress function it was given
+
+    Closing the window cancels every task that hasn't started yet.
+"""
+
+TASKS = 200
+WORKERS = 4
+
+
+def download(number, progress):
+    """ Pretend to download something.  Calls progress with a percentage as it goes """
+    for percent in range(0, 101, 20):
+        time.sleep(random.uniform(0.01, 0.05))
+        progress((number, percent))
+    if random.random() < 0.05:
+        raise ConnectionError(f'Download {number} failed')
+    return number
+
+
+def main():
+    layout = [
+        [sg.Text(f'{TASKS} tasks, {WORKERS} at a time')],
+        [sg.ProgressBar(TASKS, size=(40, 20), key='-TOTAL-')],
+        [sg.Text(key='-CURRENT-', size=50)],
+        [sg.Multiline(size=(60, 10), key='-LOG-', autoscroll=True, disabled=True)],
+        [sg.Button('Start'), sg.Button('Cancel Waiting'), sg.Button('Exit')],
+    ]
+    window = sg.Window('Thread Pool', layout, max_worker_threads=WORKERS, finalize=True)
+
+    futures, finished = [], 0
+    while True:
+        event, values = window.read()
+        if event in (sg.WIN_CLOSED, 'Exit'):
+            break
+        if event == 'Start':
+            finished = 0
+            futures = [window.submit(download, i, end_key='-DONE-', error_key='-ERROR-', progress_key='-PROGRESS-') for i in range(TASKS)]
+        elif event == 'Cancel Waiting':
+            cancelled = sum(future.cancel() for future in futures)
+            window['-LOG-'].print(f'Cancelled {cancelled} tasks that had not started')
+        elif event == '-PROGRESS-':
+            number, percent = values[event]
+            window['-CURRENT-'].update(f'Task {number} is {percent}% done.  {window.pending_tasks()} tasks left')
+        elif event in ('-DONE-', '-ERROR-'):
+            finished += 1
+            window['-TOTAL-'].update(finished)
+            if event == '-ERROR-':
+                window['-LOG-'].print(f'Error: {values[event]}', text_color='red')
+
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,7 @@ import configparser
 import copy
 import ctypes
 import datetime
+import heapq
 import inspect
 import itertools
 import json
@@ -696,6 +697,10 @@ TITLEBAR_DO_NOT_USE_AN_ICON = '__TITLEBAR_NO_ICON__'
 # Key indicating should not create any return values for element
 WRITE_ONLY_KEY = '__WRITE ONLY__'
 
+# How Window.write_event_value combines values written for a key that hasn't been read yet
+EVENT_COALESCE_LATEST = '__COALESCE LATEST__'  # only the newest value is returned
+EVENT_COALESCE_LIST = '__COALESCE LIST__'  # all of the values are returned in a list
+
 MENU_DISABLED_CHARACTER = '!'
 MENU_SHORTCUT_CHARACTER = '&'
 MENU_KEY_SEPARATOR = '::'
@@ -1070,10 +1075,127 @@ class ToolTip:
         self.tipwindow = None
 
 
+class _TimerScheduler:
+    """
+    Not user callable!
+    A single thread that runs every timer in the process.  Timers are kept in a heap ordered by their next
+    deadline.  Deadlines are absolute (start + n * frequency) rather than "sleep, then send" so repeating timers
+    don't drift.  All timers that are due within the same tick are handled in one pass and the events for each
+    window are posted together with a single wakeup.  Stopped timers are dropped from the heap when they reach
+    the top, or all at once when more than half of the heap is stopped timers.  Each heap entry carries the
+    timer's generation from when it was added, so the entry left behind by a timer that was stopped and started
+    again before it was dropped is skipped instead of firing alongside the new one.
+    """
+
+    TICK = 0.001  # timers due within this many seconds of each other fire together
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.heap = []  # type: List[Tuple[float, int, int, _TimerPeriodic]]    # (deadline, sequence, generation, timer)
+        self.sequence = itertools.count()  # breaks ties between equal deadlines
+        self.stopped_in_heap = 0
+        self.thread = None  # type: threading.Thread
+
+    def add(self, timer):
+        """
+        Schedules a timer to fire frequency_ms from now
+
+        :param timer: The timer to schedule
+        :type timer:  (_TimerPeriodic)
+        """
+        if not timer.frequency_ms > 0:  # a period of 0 would fire without end (and can't be divided by)
+            timer.frequency_ms = 1
+        with self.condition:
+            timer.generation += 1
+            heapq.heappush(self.heap, (time.monotonic() + timer.frequency_ms / 1000, next(self.sequence), timer.generation, timer))
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name='FreeSimpleGUI timers', daemon=True)
+                self.thread.start()
+            self.condition.notify()
+
+    def stopped(self):
+        """
+        Called after a scheduled timer was stopped so the heap can be compacted if it's mostly stopped timers
+        """
+        with self.condition:
+            self.stopped_in_heap += 1
+            if self.stopped_in_heap > len(self.heap) // 2:
+                self.heap[:] = [entry for entry in self.heap if self._live(entry)]  # in place, _next_due holds on to the list
+                heapq.heapify(self.heap)
+                self.stopped_in_heap = 0
+
+    @staticmethod
+    def _live(entry):
+        """
+        :return: True if the heap entry is the current one of a running timer
+        :rtype:  (bool)
+        """
+        timer = entry[3]
+        return timer.running and entry[2] == timer.generation
+
+    def _next_due(self):
+        """
+        Waits until at least one timer is due.  Must be called with the condition held.
+
+        :return: The timers that are due, in deadline order
+        :rtype:  List[_TimerPeriodic]
+        """
+        heap = self.heap
+        while True:
+            while heap and not self._live(heap[0]):
+                heapq.heappop(heap)
+                self.stopped_in_heap = max(0, self.stopped_in_heap - 1)
+            if not heap:
+                self.condition.wait()
+                continue
+            now = time.monotonic()
+            wait = heap[0][0] - now
+            if wait <= self.TICK:
+                break
+            self.condition.wait(wait)
+
+        due = []
+        while heap and heap[0][0] <= now + self.TICK:
+            entry = heapq.heappop(heap)
+            deadline, _, generation, timer = entry
+            if not self._live(entry):
+                self.stopped_in_heap = max(0, self.stopped_in_heap - 1)
+                continue
+            due.append(timer)
+            if timer.repeating:
+                period = timer.frequency_ms / 1000
+                deadline += period
+                if deadline <= now:  # fell behind (machine was asleep, etc). Skip the missed ticks
+                    deadline += ((now - deadline) // period + 1) * period
+                heapq.heappush(heap, (deadline, next(self.sequence), generation, timer))
+            else:
+                timer.running = False
+                _TimerPeriodic.active_timers.pop(timer.id, None)
+        return due
+
+    def _run(self):
+        while True:
+            try:  # one bad timer mustn't stop the timers of every other window
+                with self.condition:
+                    due = self._next_due()
+                events_by_window = {}
+                for timer in due:
+                    events_by_window.setdefault(id(timer.window), (timer.window, []))[1].append((timer.key, timer.id))
+                for window, events in events_by_window.values():
+                    try:
+                        window.write_event_values(events)
+                    except Exception:  # window is gone
+                        _TimerPeriodic.stop_all_timers_for_window(window)
+            except Exception as e:
+                warnings.warn(f'Error in the timer thread: {e!r}', UserWarning)
+
+
 class _TimerPeriodic:
     id_counter = 1
     # Dictionary containing the active timers.  Format is {id : _TimerPeriodic object}
     active_timers = {}  # type: dict[int:_TimerPeriodic]
+    # Every timer is run by this one scheduler thread
+    scheduler = _TimerScheduler()
 
     def __init__(self, window, frequency_ms, key=EVENT_TIMER, repeating=True):
         """
@@ -1090,6 +1212,8 @@ class _TimerPeriodic:
         self.key = key
         self.id = _TimerPeriodic.id_counter
         _TimerPeriodic.id_counter += 1
+        self.running = False
+        self.generation = 0  # bumped each time the timer is handed to the scheduler
         self.start()
 
     @classmethod
@@ -1110,9 +1234,9 @@ class _TimerPeriodic:
         :param window:      The window to stop timers for
         :type window:       FreeSimpleGUI.window.Window
         """
-        for timer in _TimerPeriodic.active_timers.values():
+        for timer in list(_TimerPeriodic.active_timers.values()):
             if timer.window == window:
-                timer.running = False
+                timer.stop()
 
     @classmethod
     def get_all_timers_for_window(cls, window):
@@ -1124,46 +1248,32 @@ class _TimerPeriodic:
         :rtype:             List[int]
         """
         timers = []
-        for timer in _TimerPeriodic.active_timers.values():
+        for timer in list(_TimerPeriodic.active_timers.values()):
             if timer.window == window:
                 timers.append(timer.id)
 
         return timers
 
-    def timer_thread(self):
-        """
-        The thread that sends events to the window.  Runs either once or in a loop until timer is stopped
-        """
-
-        if not self.running:  # if timer has been cancelled, abort
-            del _TimerPeriodic.active_timers[self.id]
-            return
-        while True:
-            time.sleep(self.frequency_ms / 1000)
-            if not self.running:  # if timer has been cancelled, abort
-                del _TimerPeriodic.active_timers[self.id]
-                return
-            self.window.write_event_value(self.key, self.id)
-
-            if not self.repeating:  # if timer does not repeat, then exit thread
-                del _TimerPeriodic.active_timers[self.id]
-                return
-
     def start(self):
         """
-        Starts a timer by starting a timer thread
+        Starts a timer by handing it to the scheduler
         Adds timer to the list of active timers
         """
+        if self.running:
+            return
         self.running = True
-        self.thread = threading.Thread(target=self.timer_thread, daemon=True)
-        self.thread.start()
         _TimerPeriodic.active_timers[self.id] = self
+        _TimerPeriodic.scheduler.add(self)
 
     def stop(self):
         """
         Stops a timer
         """
+        if not self.running:
+            return
         self.running = False
+        _TimerPeriodic.active_timers.pop(self.id, None)
+        _TimerPeriodic.scheduler.stopped()
 
 
 def _long_func_thread(window, end_key, original_func):
@@ -1199,6 +1309,9 @@ def _timeout_alarm_callback_hidden():
     Window._window_that_exited = None
 
 
+_READ_ALL_WINDOWS_QUEUED_BURST = 100  # thread events read_all_windows returns before letting tkinter run
+
+
 def read_all_windows(timeout=None, timeout_key=TIMEOUT_KEY):
     """
     Reads all windows that are "active" when the call is made. "Active" means that it's been finalized or read.
@@ -1210,6 +1323,10 @@ def read_all_windows(timeout=None, timeout_key=TIMEOUT_KEY):
     If no windows are open, then the value (None, WIN_CLOSED, None) will be returned
         Since WIN_CLOSED is None, it means (None, None, None) is what's returned when no windows remain opened
 
+    Events written with write_event_value are returned first, one per window in turn, so a window whose thread
+    writes thousands of events can't hold up the other windows.  Window.get_event_stats tells you which windows
+    are the busy ones.
+
     :param timeout:     Time in milliseconds to delay before a returning a timeout event
     :type timeout:      (int)
     :param timeout_key: Key to return when a timeout happens. Defaults to the standard TIMEOUT_KEY
@@ -1221,27 +1338,50 @@ def read_all_windows(timeout=None, timeout_key=TIMEOUT_KEY):
     if len(Window._active_windows) == 0:
         return None, WIN_CLOSED, None
 
-    # first see if any queued events are waiting for any of the windows
-    for window in Window._active_windows.keys():
-        if window._queued_thread_event_available():
-            _BuildResults(window, False, window)
-            event, values = window.ReturnValues
-            return window, event, values
-
     Window._root_running_mainloop = Window.hidden_master_root
     Window._timeout_key = timeout_key
 
+    # Thread events come first.  Windows take turns, one event each, so a busy window can't hold up the others.
+    # Every so often tkinter gets to run so that a steady stream of them doesn't hold up the GUI either
+    if Window._queued_events_in_a_row >= _READ_ALL_WINDOWS_QUEUED_BURST:
+        Window._queued_events_in_a_row = 0
+        Window._window_that_exited = None
+        try:  # stop at the first window that exits so no other window's event is left behind
+            while Window._window_that_exited is None and Window.hidden_master_root.tk.dooneevent(tk._tkinter.ALL_EVENTS | tk._tkinter.DONT_WAIT):
+                pass
+        except:
+            pass
+        if Window._window_that_exited is not None:
+            return _read_all_windows_exited_window(timeout_key)
+
+    window = Window._next_ready_window()
+    if window is not None:
+        Window._queued_events_in_a_row += 1
+        _BuildResults(window, False, window)
+        event, values = window.ReturnValues
+        if window._queued_thread_event_available():
+            window._add_to_ready_windows()
+        window._count_event()
+        return window, event, values
+    Window._queued_events_in_a_row = 0
+
     if timeout == 0:
-        window = list(Window._active_windows.keys())[Window._timeout_0_counter]
+        while True:
+            if not Window._poll_order:
+                Window._poll_order.extend(Window._active_windows)
+            window = Window._poll_order.popleft()
+            if window in Window._active_windows:
+                break
         event, values = window._ReadNonBlocking()
         if event is None:
             event = timeout_key
         if values is None:
             event = None
-        Window._timeout_0_counter = (Window._timeout_0_counter + 1) % len(Window._active_windows)
+        elif event != timeout_key:
+            window._count_event()
         return window, event, values
 
-    Window._timeout_0_counter = 0  # reset value if not reading with timeout 0 so ready next time needed
+    Window._poll_order.clear()  # reset if not reading with timeout 0 so ready next time needed
 
     # setup timeout timer
     if timeout is not None:
@@ -1263,8 +1403,19 @@ def read_all_windows(timeout=None, timeout_key=TIMEOUT_KEY):
         pass
         # print('** tkafter cancel failed **')
 
-    # Get window that caused return
+    return _read_all_windows_exited_window(timeout_key)
+
+
+def _read_all_windows_exited_window(timeout_key):
+    """
+    Not user callable!
+    Gets the event from the window that made read_all_windows stop waiting
 
+    :param timeout_key: Key to return if no window did
+    :type timeout_key:  (Any)
+    :return:            A tuple with the  (Window, event, values dictionary/list)
+    :rtype:             (Window, Any, Dict | List)
+    """
     window = Window._window_that_exited
 
     if window is None:
@@ -1281,6 +1432,8 @@ def read_all_windows(timeout=None, timeout_key=TIMEOUT_KEY):
     else:
         _BuildResults(window, False, window)
         event, values = window.ReturnValues
+        if event is not None:
+            window._count_event()
 
     return window, event, values
 
@@ -4016,6 +4169,12 @@ def _BuildResults(form, initialize_only, top_level_form):
     #   INPUT - Read value from TK
     #   Button - Button Text and position as a Tuple
 
+    # Windows created with incremental_results=True keep a precomputed plan and only re-read what changed
+    if not initialize_only and form is top_level_form and getattr(form, 'incremental_results', False) and not form.TKrootDestroyed:
+        if form._results_engine is None:
+            form._results_engine = _ResultsEngine(form)
+        return form._results_engine.build()
+
     # Get the initialized results so we don't have to rebuild
     form.ReturnValuesDictionary = {}
     form.ReturnValuesList = []
@@ -5068,11 +5227,7 @@ def PackFormIntoFrame(form, containing_frame, toplevel_form):
                 if element.ImageFilename:  # if button has an image on it
                     tkbutton.config(highlightthickness=0)
                     try:
-                        photo = tk.PhotoImage(file=element.ImageFilename)
-                        if element.ImageSubsample:
-                            photo = photo.subsample(element.ImageSubsample)
-                        if element.zoom:
-                            photo = photo.zoom(element.zoom)
+                        photo = _cached_photo_image(filename=element.ImageFilename, subsample=element.ImageSubsample, zoom=element.zoom)
                         if element.ImageSize != (None, None):
                             width, height = element.ImageSize
                         else:
@@ -5090,11 +5245,7 @@ def PackFormIntoFrame(form, containing_frame, toplevel_form):
                 if element.ImageData:  # if button has an image on it
                     tkbutton.config(highlightthickness=0)
                     try:
-                        photo = tk.PhotoImage(data=element.ImageData)
-                        if element.ImageSubsample:
-                            photo = photo.subsample(element.ImageSubsample)
-                        if element.zoom:
-                            photo = photo.zoom(element.zoom)
+                        photo = _cached_photo_image(data=element.ImageData, subsample=element.ImageSubsample, zoom=element.zoom)
                         if element.ImageSize != (None, None):
                             width, height = element.ImageSize
                         else:
@@ -5238,11 +5389,7 @@ def PackFormIntoFrame(form, containing_frame, toplevel_form):
                 if element.ImageFilename:  # if button has an image on it
                     button_style.configure(style_name, borderwidth=0)
                     # tkbutton.configure(highlightthickness=0)
-                    photo = tk.PhotoImage(file=element.ImageFilename)
-                    if element.ImageSubsample:
-                        photo = photo.subsample(element.ImageSubsample)
-                    if element.zoom:
-                        photo = photo.zoom(element.zoom)
+                    photo = _cached_photo_image(filename=element.ImageFilename, subsample=element.ImageSubsample, zoom=element.zoom)
                     if element.ImageSize != (None, None):
                         width, height = element.ImageSize
                     else:
@@ -5253,11 +5400,7 @@ def PackFormIntoFrame(form, containing_frame, toplevel_form):
                     # tkbutton.configure(highlightthickness=0)
                     button_style.configure(style_name, borderwidth=0)
 
-                    photo = tk.PhotoImage(data=element.ImageData)
-                    if element.ImageSubsample:
-                        photo = photo.subsample(element.ImageSubsample)
-                    if element.zoom:
-                        photo = photo.zoom(element.zoom)
+                    photo = _cached_photo_image(data=element.ImageData, subsample=element.ImageSubsample, zoom=element.zoom)
                     if element.ImageSize != (None, None):
                         width, height = element.ImageSize
                     else:
@@ -5327,11 +5470,7 @@ def PackFormIntoFrame(form, containing_frame, toplevel_form):
                 element.TKButton = tkbutton  # not used yet but save the TK button in case
                 wraplen = tkbutton.winfo_reqwidth()  # width of widget in Pixels
                 if element.ImageFilename:  # if button has an image on it
-                    photo = tk.PhotoImage(file=element.ImageFilename)
-                    if element.ImageSubsample:
-                        photo = photo.subsample(element.ImageSubsample)
-                    if element.zoom:
-                        photo = photo.zoom(element.zoom)
+                    photo = _cached_photo_image(filename=element.ImageFilename, subsample=element.ImageSubsample, zoom=element.zoom)
                     if element.ImageSize != (None, None):
                         width, height = element.ImageSize
                     else:
@@ -5339,11 +5478,7 @@ def PackFormIntoFrame(form, containing_frame, toplevel_form):
                     tkbutton.config(image=photo, compound=tk.CENTER, width=width, height=height)
                     tkbutton.image = photo
                 if element.ImageData:  # if button has an image on it
-                    photo = tk.PhotoImage(data=element.ImageData)
-                    if element.ImageSubsample:
-                        photo = photo.subsample(element.ImageSubsample)
-                    if element.zoom:
-                        photo = photo.zoom(element.zoom)
+                    photo = _cached_photo_image(data=element.ImageData, subsample=element.ImageSubsample, zoom=element.zoom)
                     if element.ImageSize != (None, None):
                         width, height = element.ImageSize
                     else:
@@ -5756,6 +5891,8 @@ def PackFormIntoFrame(form, containing_frame, toplevel_form):
 
                 if element.reroute_cprint:
                     cprint_set_output_destination(toplevel_form, element.Key)
+                if element.buffered:
+                    element._flush_output_buffer_periodically()
 
                 _add_right_click_menu_and_grab(element)
 
@@ -5947,18 +6084,11 @@ def PackFormIntoFrame(form, containing_frame, toplevel_form):
                 element = element  # type: Image
                 try:
                     if element.Filename is not None:
-                        photo = tk.PhotoImage(file=element.Filename)
+                        photo = _cached_photo_image(filename=element.Filename, subsample=element.ImageSubsample, zoom=element.zoom)
                     elif element.Data is not None:
-                        photo = tk.PhotoImage(data=element.Data)
+                        photo = _cached_photo_image(data=element.Data, subsample=element.ImageSubsample, zoom=element.zoom)
                     else:
                         photo = None
-
-                    if photo is not None:
-                        if element.ImageSubsample:
-                            photo = photo.subsample(element.ImageSubsample)
-                        if element.zoom:
-                            photo = photo.zoom(element.zoom)
-                        # print('*ERROR laying out form.... Image Element has no image specified*')
                 except Exception as e:
                     photo = None
                     _error_popup_with_traceback(
@@ -6136,17 +6266,11 @@ def PackFormIntoFrame(form, containing_frame, toplevel_form):
                 # this code will add an image to the tab. Use it when adding the image on a tab enhancement
                 try:
                     if element.Filename is not None:
-                        photo = tk.PhotoImage(file=element.Filename)
+                        photo = _cached_photo_image(filename=element.Filename, subsample=element.ImageSubsample, zoom=element.zoom)
                     elif element.Data is not None:
-                        photo = tk.PhotoImage(data=element.Data)
+                        photo = _cached_photo_image(data=element.Data, subsample=element.ImageSubsample, zoom=element.zoom)
                     else:
                         photo = None
-
-                    if element.ImageSubsample and photo is not None:
-                        photo = photo.subsample(element.ImageSubsample)
-                    if element.zoom and photo is not None:
-                        photo = photo.zoom(element.zoom)
-                        # print('*ERROR laying out form.... Image Element has no image specified*')
                 except Exception as e:
                     photo = None
                     _error_popup_with_traceback(
@@ -6326,8 +6450,9 @@ def PackFormIntoFrame(form, containing_frame, toplevel_form):
                 else:
                     anchor = tk.CENTER
                 column_widths = {}
+                sizing_rows = element._rows_for_sizing()  # a virtual table only sizes using the first rows
                 # create column width list
-                for row in element.Values:
+                for row in sizing_rows:
                     for i, col in enumerate(row):
                         col_width = min(len(str(col)), element.MaxColumnWidth)
                         try:
@@ -6337,7 +6462,7 @@ def PackFormIntoFrame(form, containing_frame, toplevel_form):
                             column_widths[i] = col_width
 
                 if element.ColumnsToDisplay is None:
-                    displaycolumns = element.ColumnHeadings if element.ColumnHeadings is not None else element.Values[0]
+                    displaycolumns = element.ColumnHeadings if element.ColumnHeadings is not None else sizing_rows[0]
                 else:
                     displaycolumns = []
                     for i, should_display in enumerate(element.ColumnsToDisplay):
@@ -6372,14 +6497,17 @@ def PackFormIntoFrame(form, containing_frame, toplevel_form):
                 if element.DisplayRowNumbers:
                     treeview.heading(element.RowHeaderText, text=element.RowHeaderText)  # make a dummy heading
                     row_number_header_width = _string_width_in_pixels(element.HeaderFont, element.RowHeaderText) + 10
-                    row_number_width = _string_width_in_pixels(font, str(len(element.Values))) + 10
+                    row_number_width = _string_width_in_pixels(font, str(element._row_total())) + 10
                     row_number_width = max(row_number_header_width, row_number_width)
                     treeview.column(element.RowHeaderText, width=row_number_width, minwidth=10, anchor=anchor, stretch=0)
 
-                headings = element.ColumnHeadings if element.ColumnHeadings is not None else element.Values[0]
+                headings = element.ColumnHeadings if element.ColumnHeadings is not None else sizing_rows[0]
+                element._heading_ids = list(headings)
                 for i, heading in enumerate(headings):
                     # heading = str(heading)
                     treeview.heading(heading, text=heading)
+                    if element.enable_sorting:
+                        treeview.heading(heading, command=lambda col=i, em=element: em._heading_clicked(col))
                     if element.AutoSizeColumns:
                         col_width = column_widths.get(i, len(heading))  # in case more headings than there are columns of data
                         width = max(
@@ -6407,13 +6535,13 @@ def PackFormIntoFrame(form, containing_frame, toplevel_form):
                     else:
                         col_anchor = anchor
                     treeview.column(heading, width=width, minwidth=10, anchor=col_anchor, stretch=element.expand_x)
-                # Insert values into the tree
-                for i, value in enumerate(element.Values):
+                # Insert values into the tree. Virtual tables load their visible rows once the scrollbars are made
+                for i, value in enumerate(element.Values if not element.Virtual else []):
                     if element.DisplayRowNumbers:
                         value = [i + element.StartingRowNumber] + value
                     id = treeview.insert('', 'end', text=value, iid=i + 1, values=value, tag=i)
                     element.tree_ids.append(id)
-                if element.AlternatingRowColor not in (None, COLOR_SYSTEM_DEFAULT):  # alternating colors
+                if element.AlternatingRowColor not in (None, COLOR_SYSTEM_DEFAULT) and not element.Virtual:  # alternating colors
                     for row in range(0, len(element.Values), 2):
                         treeview.tag_configure(row, background=element.AlternatingRowColor)
                 if element.RowColors is not None:  # individual row colors
@@ -6520,6 +6648,13 @@ def PackFormIntoFrame(form, containing_frame, toplevel_form):
                     element.Widget.bind('<Enter>', lambda event, em=element: testMouseHook(em))
                     element.Widget.bind('<Leave>', lambda event, em=element: testMouseUnhook(em))
 
+                if element.Virtual:
+                    element._virtual_setup()
+                elif element.view_rows is not None:  # sort or filter was set before the window was finalized
+                    element._show_view()
+                if element.sort_column is not None:
+                    element._set_heading_arrows()
+
                 expand, fill, row_should_expand, row_fill_direction = _add_expansion(element, row_should_expand, row_fill_direction)
                 element.TKTreeview.pack(side=tk.LEFT, padx=0, pady=0, expand=expand, fill=fill)
                 frame.pack(side=tk.LEFT, padx=elementpad[0], pady=elementpad[1], expand=expand, fill=fill)
@@ -6600,9 +6735,9 @@ def PackFormIntoFrame(form, containing_frame, toplevel_form):
                         if node.icon:
                             if node.icon not in element.image_dict:
                                 if type(node.icon) is bytes:
-                                    photo = tk.PhotoImage(data=node.icon)
+                                    photo = _cached_photo_image(data=node.icon)
                                 else:
-                                    photo = tk.PhotoImage(file=node.icon)
+                                    photo = _cached_photo_image(filename=node.icon)
                                 element.image_dict[node.icon] = photo
                             else:
                                 photo = element.image_dict.get(node.icon)
@@ -6707,6 +6842,10 @@ def PackFormIntoFrame(form, containing_frame, toplevel_form):
                     element._pack_forget_save_settings(alternate_widget=element.element_frame)  # seems like it should be the frame if following other elements conventions
                     # element.TKTreeview.pack_forget()
                 treeview.bind('<<TreeviewSelect>>', element._treeview_selected)
+                if element.ChildrenCallback is not None:
+                    treeview.bind('<<TreeviewOpen>>', element._lazy_opened)
+                    treeview.bind('<<TreeviewClose>>', element._lazy_closed)
+                    element._lazy_setup()
                 if element.Tooltip is not None:  # tooltip
                     element.TooltipObject = ToolTip(element.TKTreeview, text=element.Tooltip, timeout=DEFAULT_TOOLTIP_TIME)
                 _add_right_click_menu_and_grab(element)
@@ -6903,6 +7042,8 @@ def _convert_window_to_tk(window):
     InitializeResults(window)
 
     PackFormIntoFrame(window, master, window)
+    if window.incremental_results:
+        window._results_engine = _ResultsEngine(window)
 
     window.TKroot.configure(padx=window.Margins[0], pady=window.Margins[1])
 
@@ -8065,13 +8206,18 @@ def _print_to_element(
     end_str = str(end) if end is not None else '\n'
     sep_str = str(sep) if sep is not None else ' '
 
-    outstring = ''
-    num_args = len(args)
-    for i, arg in enumerate(args):
-        outstring += str(arg)
-        if i != num_args - 1:
-            outstring += sep_str
-    outstring += end_str
+    outstring = sep_str.join([str(arg) for arg in args]) + end_str
+
+    if multiline_element.buffered:  # the buffer handles refreshing, at most once per flush_interval
+        multiline_element._buffer_output(
+            outstring,
+            text_color=text_color,
+            background_color=background_color,
+            font=font,
+            justification=justification,
+            autoscroll=autoscroll,
+        )
+        return
 
     multiline_element.update(
         outstring,
@@ -16449,6 +16595,8 @@ from FreeSimpleGUI.elements.tree import TreeData
 from FreeSimpleGUI.tray import SystemTray
 from FreeSimpleGUI.window import Window
 from FreeSimpleGUI._utils import _error_popup_with_traceback
+from FreeSimpleGUI._results import _ResultsEngine
+from FreeSimpleGUI._image_cache import _cached_photo_image
 
 # Element aliases
 In = Input
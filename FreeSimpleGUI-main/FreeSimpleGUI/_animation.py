@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import collections
+import tkinter as tk
+import weakref
+
+# GIFs that say 0 (or next to 0) between frames are shown at this speed, same as web browsers do
+_DEFAULT_GIF_DELAY_MS = 100
+_MINIMUM_GIF_DELAY_MS = 20
+
+
+def _gif_frame_delays(gif):
+    """
+    Not user callable!
+    Walks the blocks of a GIF file to find how many frames it has and how long each is shown.
+    Nothing is decompressed.
+
+    :param gif: The raw (not base64) contents of a GIF file
+    :type gif:  (bytes)
+    :return:    The delay in milliseconds of each frame. Empty if the data isn't a GIF that can be read
+    :rtype:     List[int]
+    """
+    if gif[:3] != b'GIF' or len(gif) < 13:
+        return []
+    delays = []
+    delay = 0
+    position = 13
+    if gif[10] & 0x80:  # global color table
+        position += 3 * (2 << (gif[10] & 0x07))
+    try:
+        while position < len(gif):
+            block = gif[position]
+            if block == 0x21:  # extension
+                label = gif[position + 1]
+                position += 2
+                if label == 0xF9 and gif[position] >= 4:  # graphic control extension - has the delay for the next frame
+                    delay = (gif[position + 2] | gif[position + 3] << 8) * 10
+                while gif[position]:  # skip the data sub-blocks
+                    position += gif[position] + 1
+                position += 1
+            elif block == 0x2C:  # image descriptor = a frame
+                flags = gif[position + 9]
+                position += 10
+                if flags & 0x80:  # local color table
+                    position += 3 * (2 << (flags & 0x07))
+                position += 1  # LZW minimum code size
+                while gif[position]:
+                    position += gif[position] + 1
+                position += 1
+                delays.append(delay if delay >= _MINIMUM_GIF_DELAY_MS else _DEFAULT_GIF_DELAY_MS)
+                delay = 0
+            else:  # 0x3B is the trailer. Anything else is a damaged file, so stop at what was found
+                break
+    except IndexError:  # truncated file
+        pass
+    return delays
+
+
+class _AnimatedGif:
+    """
+    Not user callable!
+    The frames of an animated GIF, decoded only when they're needed and kept in a bounded LRU cache of
+    PhotoImages.  The GIF is scanned once (without decompressing) to learn the number of frames and the delay of
+    each.  One _AnimatedGif is shared by every Image element showing the same source.
+    """
+
+    _shared = weakref.WeakValueDictionary()  # source -> _AnimatedGif
+
+    @classmethod
+    def get(cls, source, max_frames):
+        """
+        :param source:     Filename or base64 bytes of the GIF
+        :type source:      str | bytes
+        :param max_frames: Most decoded frames to keep.  When shared, the largest of the requests is used
+        :type max_frames:  (int)
+        :return:           The shared animation for this source
+        :rtype:            (_AnimatedGif)
+        """
+        animation = cls._shared.get(source)
+        if animation is None:
+            animation = cls._shared[source] = _AnimatedGif(source)
+        animation.max_frames = max(animation.max_frames, max_frames)
+        return animation
+
+    def __init__(self, source):
+        self.source = source
+        self.max_frames = 1
+        self.frames = collections.OrderedDict()  # frame number -> tk.PhotoImage, least recently used first
+        try:
+            if isinstance(source, bytes):
+                raw = source if source[:3] == b'GIF' else base64.b64decode(source)
+            else:
+                with open(source, 'rb') as f:
+                    raw = f.read()
+            self.delays = _gif_frame_delays(raw)
+        except (OSError, binascii.Error, TypeError):
+            self.delays = []
+        # If the file couldn't be scanned, frames are decoded until tkinter fails and the count is learned then
+        self.frame_count = len(self.delays) or None
+
+    def delay(self, frame_number):
+        """
+        :return: How long in milliseconds the GIF says to show this frame
+        :rtype:  (int)
+        """
+        if frame_number < len(self.delays):
+            return self.delays[frame_number]
+        return _DEFAULT_GIF_DELAY_MS
+
+    def next_frame_number(self, frame_number):
+        if self.frame_count is None:
+            return frame_number + 1
+        return (frame_number + 1) % self.frame_count
+
+    def frame(self, frame_number):
+        """
+        Returns a frame, decoding it if it's not in the cache
+
+        :param frame_number: The frame to get.  Wraps around to 0 when past the last frame
+        :type frame_number:  (int)
+        :return:             The frame number that was actually returned and its image. (0, None) if nothing could be decoded
+        :rtype:              (int, tk.PhotoImage | None)
+        """
+        if self.frame_count:
+            frame_number %= self.frame_count
+        image = self.frames.get(frame_number)
+        if image is not None:
+            self.frames.move_to_end(frame_number)
+            return frame_number, image
+        try:
+            if isinstance(self.source, bytes):
+                image = tk.PhotoImage(data=self.source, format='gif -index %i' % frame_number)
+            else:
+                image = tk.PhotoImage(file=self.source, format='gif -index %i' % frame_number)
+        except Exception:
+            if frame_number == 0:
+                return 0, None
+            self.frame_count = frame_number  # ran off the end
+            return self.frame(0)
+        self.frames[frame_number] = image
+        while len(self.frames) > self.max_frames:
+            self.frames.popitem(last=False)
+        return frame_number, image
+
+    def prefetch(self, frame_number):
+        """
+        Decodes a frame ahead of time if it's not already cached.  Meant to be called when tkinter is idle.
+        """
+        if frame_number not in self.frames and (self.frame_count is None or frame_number < self.frame_count):
+            self.frame(frame_number)
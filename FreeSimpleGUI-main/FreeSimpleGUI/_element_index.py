@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import warnings
+
+import FreeSimpleGUI
+from FreeSimpleGUI import ELEM_TYPE_BUTTON
+from FreeSimpleGUI import ELEM_TYPE_BUTTONMENU
+from FreeSimpleGUI import ELEM_TYPE_COLUMN
+from FreeSimpleGUI import ELEM_TYPE_FRAME
+from FreeSimpleGUI import ELEM_TYPE_GRAPH
+from FreeSimpleGUI import ELEM_TYPE_IMAGE
+from FreeSimpleGUI import ELEM_TYPE_INPUT_CHECKBOX
+from FreeSimpleGUI import ELEM_TYPE_INPUT_COMBO
+from FreeSimpleGUI import ELEM_TYPE_INPUT_LISTBOX
+from FreeSimpleGUI import ELEM_TYPE_INPUT_MULTILINE
+from FreeSimpleGUI import ELEM_TYPE_INPUT_OPTION_MENU
+from FreeSimpleGUI import ELEM_TYPE_INPUT_RADIO
+from FreeSimpleGUI import ELEM_TYPE_INPUT_SLIDER
+from FreeSimpleGUI import ELEM_TYPE_INPUT_SPIN
+from FreeSimpleGUI import ELEM_TYPE_INPUT_TEXT
+from FreeSimpleGUI import ELEM_TYPE_MENUBAR
+from FreeSimpleGUI import ELEM_TYPE_PANE
+from FreeSimpleGUI import ELEM_TYPE_PROGRESS_BAR
+from FreeSimpleGUI import ELEM_TYPE_SEPARATOR
+from FreeSimpleGUI import ELEM_TYPE_TAB
+from FreeSimpleGUI import ELEM_TYPE_TAB_GROUP
+from FreeSimpleGUI import ELEM_TYPE_TABLE
+from FreeSimpleGUI import ELEM_TYPE_TREE
+from FreeSimpleGUI._utils import _error_popup_with_traceback
+
+# Elements that hold other elements in their own Rows
+_CONTAINER_TYPES = frozenset((ELEM_TYPE_COLUMN, ELEM_TYPE_FRAME, ELEM_TYPE_TAB_GROUP, ELEM_TYPE_PANE, ELEM_TYPE_TAB))
+
+# Elements that are given a numeric key when the user didn't supply one
+_AUTO_KEY_TYPES = frozenset(
+    (
+        ELEM_TYPE_MENUBAR,
+        ELEM_TYPE_BUTTONMENU,
+        ELEM_TYPE_INPUT_SLIDER,
+        ELEM_TYPE_GRAPH,
+        ELEM_TYPE_IMAGE,
+        ELEM_TYPE_INPUT_CHECKBOX,
+        ELEM_TYPE_INPUT_LISTBOX,
+        ELEM_TYPE_INPUT_COMBO,
+        ELEM_TYPE_INPUT_MULTILINE,
+        ELEM_TYPE_INPUT_OPTION_MENU,
+        ELEM_TYPE_INPUT_SPIN,
+        ELEM_TYPE_INPUT_RADIO,
+        ELEM_TYPE_INPUT_TEXT,
+        ELEM_TYPE_PROGRESS_BAR,
+        ELEM_TYPE_TABLE,
+        ELEM_TYPE_TREE,
+        ELEM_TYPE_TAB_GROUP,
+        ELEM_TYPE_SEPARATOR,
+    )
+)
+
+
+class _ElementIndex:
+    """
+    Not user callable!
+    A flat index of every element in a window, kept up to date as rows are added instead of being rebuilt by
+    walking the whole layout.
+
+    keys     - key -> element. This is the same dictionary object as Window.AllKeysDict
+    order    - every element in layout order, a container comes before the elements inside of it
+    parents  - id(element) -> the Window or container element that holds it
+    by_type  - element.Type -> list of elements of that type, in the order they were added
+
+    Keys are assigned exactly as the old recursive walk did: the elements inside a container get their keys
+    before the container itself, numeric keys come from Window.DictionaryKeyCounter and duplicate keys are
+    renamed using Window.UniqueKeyCounter.
+    """
+
+    def __init__(self, window):
+        """
+        :param window: The window being indexed
+        :type window:  (Window)
+        """
+        self.window = window
+        self.keys = {}
+        self.order = []
+        self.parents = {}
+        self.by_type = {}
+
+    def add_row(self, row, container):
+        """
+        Indexes a row of elements that was just appended to container's Rows
+
+        :param row:       The elements in the row
+        :type row:        List[Element]
+        :param container: The Window or container element the row was added to
+        :type container:  Window | Column | Frame | Pane | TabGroup | Tab
+        """
+        for element in row:
+            self.add(element, container)
+
+    def add_children(self, container):
+        """
+        Indexes everything inside of a container (but not the container itself)
+
+        :param container: The Window or container element to index the contents of
+        :type container:  Window | Column | Frame | Pane | TabGroup | Tab
+        """
+        for row in container.Rows:
+            self.add_row(row, container)
+
+    def add(self, element, container):
+        """
+        Indexes one element, and if it's a container, everything inside of it.
+        The element must already be in container's Rows.
+
+        :param element:   The element to index
+        :type element:    (Element)
+        :param container: The Window or container element that holds element
+        :type container:  Window | Column | Frame | Pane | TabGroup | Tab
+        """
+        new_elements = []
+        self._walk(element, container, new_elements)
+        if container is self.window:
+            self.order.extend(new_elements)
+        else:
+            position = self._insert_position(element, container)
+            self.order[position:position] = new_elements
+        for elem in new_elements:
+            self.by_type.setdefault(elem.Type, []).append(elem)
+
+    def parent_of(self, element):
+        """
+        :param element: An element in the window
+        :type element:  (Element)
+        :return:        The Window or container element that holds element. None if the element isn't indexed
+        :rtype:         Window | Column | Frame | Pane | TabGroup | Tab | None
+        """
+        return self.parents.get(id(element))
+
+    def elements_of_type(self, elem_type):
+        """
+        :param elem_type: One of the ELEM_TYPE_ constants
+        :type elem_type:  (str)
+        :return:          All elements of that type
+        :rtype:           List[Element]
+        """
+        return self.by_type.get(elem_type, [])
+
+    def _walk(self, element, container, new_elements):
+        new_elements.append(element)
+        self.parents[id(element)] = container
+        if element.Type in _CONTAINER_TYPES:
+            for row in element.Rows:
+                for child in row:
+                    self._walk(child, element, new_elements)
+        self._assign_key(element)
+
+    def _assign_key(self, element):
+        window = self.window
+        if element.Key is None:  # if no key has been assigned.... create one for input elements
+            if element.Type == ELEM_TYPE_BUTTON:
+                element.Key = element.ButtonText
+            elif element.Type == ELEM_TYPE_TAB:
+                element.Key = element.Title
+            if element.Type in _AUTO_KEY_TYPES:
+                element.Key = window.DictionaryKeyCounter
+                window.DictionaryKeyCounter += 1
+        if element.Key is None:
+            return
+        if element.Key in self.keys:
+            if element.Type == ELEM_TYPE_BUTTON and FreeSimpleGUI.WARN_DUPLICATE_BUTTON_KEY_ERRORS:  # for Buttons see if should complain
+                warnings.warn(f'*** Duplicate key found in your layout {element.Key} ***', UserWarning)
+                warnings.warn(f'*** Replaced new key with {str(element.Key) + str(window.UniqueKeyCounter)} ***')
+                if not FreeSimpleGUI.SUPPRESS_ERROR_POPUPS:
+                    _error_popup_with_traceback(
+                        'Duplicate key found in your layout',
+                        f'Dupliate key: {element.Key}',
+                        f'Is being replaced with: {str(element.Key) + str(window.UniqueKeyCounter)}',
+                        'The line of code above shows you which layout, but does not tell you exactly where the element was defined',
+                        f'The element type is {element.Type}',
+                    )
+            element.Key = str(element.Key) + str(window.UniqueKeyCounter)
+            window.UniqueKeyCounter += 1
+        self.keys[element.Key] = element
+
+    def _insert_position(self, element, container):
+        """
+        Finds where in self.order the subtree of an element added to a container that is not at the end of the
+        window belongs - right after whatever precedes it inside of the container.
+        """
+        previous = container
+        for row in container.Rows:
+            for elem in row:
+                if elem is element:
+                    break
+                previous = elem
+            else:
+                continue
+            break
+        while previous is not container and previous.Type in _CONTAINER_TYPES:
+            last = [elem for row in previous.Rows for elem in row]
+            if not last:
+                break
+            previous = last[-1]
+        for position in range(len(self.order) - 1, -1, -1):
+            if self.order[position] is previous:
+                return position + 1
+        return len(self.order)
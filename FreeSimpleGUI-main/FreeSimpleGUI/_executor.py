@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import threading
+
+from FreeSimpleGUI import EVENT_COALESCE_LATEST
+
+
+class _WindowExecutor:
+    """
+    Not user callable!
+    The pools of worker threads (and, if asked for, processes) that run the functions given to Window.submit.
+    Each pool is made the first time it's needed and is limited to the number of workers the Window was given, so
+    submitting hundreds of functions queues them up instead of starting hundreds of threads.
+
+    Results and exceptions are sent to the window as events.  When the window closes, functions that haven't
+    started are cancelled and the results of the ones still running are thrown away.
+    """
+
+    def __init__(self, window, max_threads=None, max_processes=None):
+        """
+        :param window:        The window that gets the events
+        :type window:         (Window)
+        :param max_threads:   Most functions to run at the same time in threads. None for the concurrent.futures default
+        :type max_threads:    (int | None)
+        :param max_processes: Most functions to run at the same time in processes. None for the number of CPUs
+        :type max_processes:  (int | None)
+        """
+        self.window = window
+        self.max_threads = max_threads
+        self.max_processes = max_processes
+        self.threads = None  # type: concurrent.futures.ThreadPoolExecutor
+        self.processes = None  # type: concurrent.futures.ProcessPoolExecutor
+        self.futures = set()  # futures that aren't done yet
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def submit(self, func, args, kwargs, end_key, error_key, progress_key, use_process):
+        import concurrent.futures  # imported here as it brings in logging and most programs never submit anything
+
+        with self.lock:
+            if self.closed:
+                raise RuntimeError('The window has been closed')
+            if use_process:
+                if self.processes is None:
+                    self.processes = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_processes)
+                pool = self.processes
+            else:
+                if self.threads is None:
+                    self.threads = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_threads, thread_name_prefix='FreeSimpleGUI')
+                pool = self.threads
+            if progress_key is not None:
+                kwargs = dict(kwargs, progress=lambda value: self.window.write_event_value(progress_key, value, coalesce=EVENT_COALESCE_LATEST))
+            future = pool.submit(func, *args, **kwargs)
+            self.futures.add(future)
+        future.add_done_callback(lambda done: self._done(done, end_key, error_key))
+        return future
+
+    def _done(self, future, end_key, error_key):
+        """
+        Called by concurrent.futures, in a worker thread, when a function finishes or is cancelled
+        """
+        with self.lock:
+            self.futures.discard(future)
+            if self.closed or future.cancelled():
+                return
+        exception = future.exception()
+        if exception is not None:
+            key = error_key if error_key is not None else end_key
+            if key is not None:
+                self.window.write_event_value(key, exception)
+        elif end_key is not None:
+            self.window.write_event_value(end_key, future.result())
+
+    def shutdown(self):
+        """
+        Cancels everything that hasn't started and lets the workers exit once the running functions return.
+        Doesn't wait for them.
+        """
+        with self.lock:
+            self.closed = True
+            futures = list(self.futures)
+        for future in futures:
+            future.cancel()
+        for pool in (self.threads, self.processes):
+            if pool is not None:
+                pool.shutdown(wait=False)
+
+    def pending(self):
+        """
+        :return: The number of functions submitted that haven't finished yet
+        :rtype:  (int)
+        """
+        with self.lock:
+            return len(self.futures)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import math
+
+
+class _FigureIndex:
+    """
+    Not user callable!
+    A uniform grid of the bounding boxes of the figures on a Graph, so finding the figures in a region, under the
+    mouse or nearest to a point only looks at the figures in the grid cells around it instead of asking tkinter.
+
+    Boxes are in canvas (pixel) coordinates.  Graph.move shifts every figure, which is stored as an offset rather
+    than by moving every box.  z holds the stacking order so results come out bottom to top like tkinter's.
+    """
+
+    cell_size = 64
+
+    def __init__(self):
+        self.boxes = {}  # id -> (x0, y0, x1, y1) before the offset is added
+        self.cells = {}  # (column, row) -> set of ids with a box touching that cell
+        self.z = {}  # id -> stacking position, higher is on top
+        self.top = 0
+        self.bottom = 0
+        self.offset_x = 0
+        self.offset_y = 0
+
+    def _cells(self, x0, y0, x1, y1):
+        size = self.cell_size
+        for column in range(math.floor(x0 / size), math.floor(x1 / size) + 1):
+            for row in range(math.floor(y0 / size), math.floor(y1 / size) + 1):
+                yield column, row
+
+    def add(self, id, box):
+        """
+        Adds a new figure on top of the others, or changes the box of one that's already indexed
+
+        :param id:  The canvas id of the figure
+        :type id:   (int)
+        :param box: The bounding box in canvas coordinates
+        :type box:  (float, float, float, float)
+        """
+        if id in self.boxes:
+            self._unlink(id)
+        else:
+            self.top += 1
+            self.z[id] = self.top
+        x0, y0, x1, y1 = box
+        box = self.boxes[id] = (min(x0, x1) - self.offset_x, min(y0, y1) - self.offset_y, max(x0, x1) - self.offset_x, max(y0, y1) - self.offset_y)
+        for cell in self._cells(*box):
+            self.cells.setdefault(cell, set()).add(id)
+
+    def remove(self, id):
+        if id in self.boxes:
+            self._unlink(id)
+            del self.boxes[id]
+            del self.z[id]
+
+    def _unlink(self, id):
+        for cell in self._cells(*self.boxes[id]):
+            ids = self.cells[cell]
+            ids.discard(id)
+            if not ids:
+                del self.cells[cell]
+
+    def move(self, id, dx, dy):
+        box = self.boxes.get(id)
+        if box is not None:
+            self.add(id, (box[0] + dx + self.offset_x, box[1] + dy + self.offset_y, box[2] + dx + self.offset_x, box[3] + dy + self.offset_y))
+
+    def move_all(self, dx, dy):
+        self.offset_x += dx
+        self.offset_y += dy
+
+    def raise_to_top(self, ids):
+        for id in sorted((id for id in ids if id in self.z), key=self.z.get):
+            self.top += 1
+            self.z[id] = self.top
+
+    def lower_to_bottom(self, ids):
+        for id in sorted((id for id in ids if id in self.z), key=self.z.get, reverse=True):
+            self.bottom -= 1
+            self.z[id] = self.bottom
+
+    def in_region(self, x0, y0, x1, y1):
+        """
+        :return: ids of the figures whose boxes overlap the region, bottom to top
+        :rtype:  List[int]
+        """
+        x0, x1 = min(x0, x1) - self.offset_x, max(x0, x1) - self.offset_x
+        y0, y1 = min(y0, y1) - self.offset_y, max(y0, y1) - self.offset_y
+        found = set()
+        for cell in self._cells(x0, y0, x1, y1):
+            found.update(self.cells.get(cell, ()))
+        boxes = self.boxes
+        hits = [id for id in found if boxes[id][0] <= x1 and boxes[id][2] >= x0 and boxes[id][1] <= y1 and boxes[id][3] >= y0]
+        return sorted(hits, key=self.z.get)
+
+    def at(self, x, y):
+        """
+        :return: id of the top figure whose box holds the point. None if there isn't one
+        :rtype:  int | None
+        """
+        x, y = x - self.offset_x, y - self.offset_y
+        size = self.cell_size
+        best = None
+        for id in self.cells.get((math.floor(x / size), math.floor(y / size)), ()):
+            x0, y0, x1, y1 = self.boxes[id]
+            if x0 <= x <= x1 and y0 <= y <= y1 and (best is None or self.z[id] > self.z[best]):
+                best = id
+        return best
+
+    def nearest(self, x, y, max_distance=None):
+        """
+        Searches rings of cells outward from the point until no unsearched cell can hold anything closer
+
+        :return: id of the figure whose box is closest to the point (0 if the point is inside). The top one wins a tie.
+                 None if there are none within max_distance
+        :rtype:  int | None
+        """
+        if not self.cells:
+            return None
+        x, y = x - self.offset_x, y - self.offset_y
+        size = self.cell_size
+        column, row = math.floor(x / size), math.floor(y / size)
+        last_ring = max(max(abs(c - column), abs(r - row)) for c, r in self.cells)
+        if max_distance is not None:
+            last_ring = min(last_ring, math.ceil(max_distance / size) + 1)
+        best, best_distance = None, math.inf
+        seen = set()
+        for ring in range(last_ring + 1):
+            for c in range(column - ring, column + ring + 1):
+                for r in range(row - ring, row + ring + 1):
+                    if max(abs(c - column), abs(r - row)) != ring:
+                        continue
+                    for id in self.cells.get((c, r), ()):
+                        if id in seen:
+                            continue
+                        seen.add(id)
+                        x0, y0, x1, y1 = self.boxes[id]
+                        distance = math.hypot(max(x0 - x, 0, x - x1), max(y0 - y, 0, y - y1))
+                        if distance < best_distance or (distance == best_distance and self.z[id] > self.z[best]):
+                            best, best_distance = id, distance
+            if best_distance <= ring * size:  # anything in a further ring is at least this far away
+                break
+        if max_distance is not None and best_distance > max_distance:
+            return None
+        return best
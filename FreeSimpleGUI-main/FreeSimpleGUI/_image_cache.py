@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import collections
+import hashlib
+import tkinter as tk
+import weakref
+
+
+class _ImageCache:
+    """
+    Not user callable!
+    One cache of decoded PhotoImages for the whole program, so an icon used by many buttons, tree nodes, tabs
+    or windows is only decoded once.
+
+    Images are keyed by a hash of their contents (not the filename or the object passed in) plus the
+    subsample / zoom applied, so resized variants are made once as well.  An image is only held weakly when it's
+    first decoded - it stays in the cache for as long as some widget still has a reference to it.  Images asked
+    for a second time are also held in a list of the most recently used ones, until their total size passes
+    max_bytes, so single-use images never push out the ones that are used over and over.
+    """
+
+    max_bytes = 64 * 1024 * 1024
+
+    def __init__(self):
+        self.recent = collections.OrderedDict()  # key -> (PhotoImage, size in bytes). Least recently used first
+        self.recent_bytes = 0
+        self.alive = weakref.WeakValueDictionary()  # key -> PhotoImage for every image still in use anywhere
+
+    def photo_image(self, filename=None, data=None, subsample=None, zoom=None):
+        """
+        Returns a PhotoImage for a file or base64 data, decoding it only if the same image hasn't been decoded
+        before.  The image returned may be shared, so don't draw on it.  Raises the same exceptions that
+        tk.PhotoImage would.
+
+        :param filename:  File to load. Used if data is None
+        :type filename:   (str)
+        :param data:      base64 (or raw) PNG / GIF data
+        :type data:       str | bytes
+        :param subsample: Divide the size by this amount
+        :type subsample:  (int | None)
+        :param zoom:      Multiply the size by this amount
+        :type zoom:       (int | None)
+        :return:          The decoded image
+        :rtype:           (tk.PhotoImage)
+        """
+        if data is not None:
+            if not isinstance(data, (bytes, str)):  # not something that can be hashed, like a PhotoImage
+                return self._resize(tk.PhotoImage(data=data), subsample, zoom)
+            content = data.encode() if isinstance(data, str) else data
+        else:
+            with open(filename, 'rb') as f:
+                content = f.read()
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        subsample = subsample or None
+        zoom = int(zoom) if zoom else None
+
+        key = (digest, subsample, zoom)
+        image = self._lookup(key)
+        if image is not None:
+            return image
+        base = self._lookup((digest, None, None))
+        if base is None:
+            base = tk.PhotoImage(data=data) if data is not None else tk.PhotoImage(file=filename)
+            self.alive[(digest, None, None)] = base
+        if subsample is None and zoom is None:
+            return base
+        image = self._resize(base, subsample, zoom)
+        self.alive[key] = image
+        return image
+
+    @staticmethod
+    def _resize(image, subsample, zoom):
+        if subsample:
+            image = image.subsample(subsample)
+        if zoom:
+            image = image.zoom(int(zoom))
+        return image
+
+    def _lookup(self, key):
+        image = self.alive.get(key)
+        root = tk._default_root
+        if image is not None and root is not None and image.tk is not root.tk:
+            # made by a Tk that has since been destroyed (ENABLE_TK_WINDOWS), so it has to be decoded again
+            stale = self.recent.pop(key, None)
+            if stale is not None:
+                self.recent_bytes -= stale[1]
+            return None
+        if image is not None:  # asked for again, so it's worth holding on to
+            if key in self.recent:
+                self.recent.move_to_end(key)
+            else:
+                self._store(key, image)
+        return image
+
+    def _store(self, key, image):
+        size = image.width() * image.height() * 4
+        replaced = self.recent.pop(key, None)  # a stale image made by a Tk that was destroyed
+        if replaced is not None:
+            self.recent_bytes -= replaced[1]
+        self.alive[key] = image
+        self.recent[key] = (image, size)
+        self.recent_bytes += size
+        while self.recent_bytes > self.max_bytes and len(self.recent) > 1:
+            _, (_, old_size) = self.recent.popitem(last=False)
+            self.recent_bytes -= old_size
+
+
+_image_cache = _ImageCache()
+
+
+def _cached_photo_image(filename=None, data=None, subsample=None, zoom=None):
+    """
+    Not user callable!
+    Shortcut for the process-wide image cache.  See _ImageCache.photo_image
+    """
+    return _image_cache.photo_image(filename=filename, data=data, subsample=subsample, zoom=zoom)
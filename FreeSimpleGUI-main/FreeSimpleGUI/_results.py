@@ -0,0 +1,434 @@
+from __future__ import annotations
+
+import tkinter as tk
+
+from FreeSimpleGUI import BUTTON_TYPE_BROWSE_FILE
+from FreeSimpleGUI import BUTTON_TYPE_BROWSE_FILES
+from FreeSimpleGUI import BUTTON_TYPE_BROWSE_FOLDER
+from FreeSimpleGUI import BUTTON_TYPE_CALENDAR_CHOOSER
+from FreeSimpleGUI import BUTTON_TYPE_COLOR_CHOOSER
+from FreeSimpleGUI import BUTTON_TYPE_REALTIME
+from FreeSimpleGUI import BUTTON_TYPE_SAVEAS_FILE
+from FreeSimpleGUI import ELEM_TYPE_BUTTON
+from FreeSimpleGUI import ELEM_TYPE_BUTTONMENU
+from FreeSimpleGUI import ELEM_TYPE_COLUMN
+from FreeSimpleGUI import ELEM_TYPE_FRAME
+from FreeSimpleGUI import ELEM_TYPE_GRAPH
+from FreeSimpleGUI import ELEM_TYPE_IMAGE
+from FreeSimpleGUI import ELEM_TYPE_INPUT_CHECKBOX
+from FreeSimpleGUI import ELEM_TYPE_INPUT_COMBO
+from FreeSimpleGUI import ELEM_TYPE_INPUT_LISTBOX
+from FreeSimpleGUI import ELEM_TYPE_INPUT_MULTILINE
+from FreeSimpleGUI import ELEM_TYPE_INPUT_OPTION_MENU
+from FreeSimpleGUI import ELEM_TYPE_INPUT_RADIO
+from FreeSimpleGUI import ELEM_TYPE_INPUT_SLIDER
+from FreeSimpleGUI import ELEM_TYPE_INPUT_SPIN
+from FreeSimpleGUI import ELEM_TYPE_INPUT_TEXT
+from FreeSimpleGUI import ELEM_TYPE_MENUBAR
+from FreeSimpleGUI import ELEM_TYPE_OUTPUT
+from FreeSimpleGUI import ELEM_TYPE_PANE
+from FreeSimpleGUI import ELEM_TYPE_PROGRESS_BAR
+from FreeSimpleGUI import ELEM_TYPE_SEPARATOR
+from FreeSimpleGUI import ELEM_TYPE_TAB
+from FreeSimpleGUI import ELEM_TYPE_TAB_GROUP
+from FreeSimpleGUI import ELEM_TYPE_TABLE
+from FreeSimpleGUI import ELEM_TYPE_TEXT
+from FreeSimpleGUI import ELEM_TYPE_TREE
+from FreeSimpleGUI import EncodeRadioRowCol
+from FreeSimpleGUI import WRITE_ONLY_KEY
+
+# Containers are walked recursively, exactly like _BuildResultsForSubform does
+_CONTAINER_TYPES = (ELEM_TYPE_COLUMN, ELEM_TYPE_FRAME, ELEM_TYPE_PANE, ELEM_TYPE_TAB_GROUP, ELEM_TYPE_TAB)
+
+# Element types that never put a value into the values list / dictionary
+_NO_VALUE_TYPES = (
+    ELEM_TYPE_BUTTON,
+    ELEM_TYPE_TEXT,
+    ELEM_TYPE_IMAGE,
+    ELEM_TYPE_OUTPUT,
+    ELEM_TYPE_PROGRESS_BAR,
+    ELEM_TYPE_COLUMN,
+    ELEM_TYPE_FRAME,
+    ELEM_TYPE_SEPARATOR,
+    ELEM_TYPE_TAB,
+)
+
+_VALUE_BUTTON_TYPES = (
+    BUTTON_TYPE_SAVEAS_FILE,
+    BUTTON_TYPE_BROWSE_FILE,
+    BUTTON_TYPE_BROWSE_FILES,
+    BUTTON_TYPE_BROWSE_FOLDER,
+    BUTTON_TYPE_CALENDAR_CHOOSER,
+)
+
+# What a slot does on every read
+_SLOT_VALUE = 0  # plain value-bearing element
+_SLOT_BUTTON = 1  # button - may be the event, may also carry a value
+_SLOT_MENUBAR = 2  # Menu element - chosen item becomes the event
+_SLOT_CUSTOM_MENUBAR = 3  # ButtonMenu that is part of a custom menubar
+
+
+# -------------------------  Value readers  ------------------------- #
+# Each reader returns the same value the full walk in _BuildResultsForSubform would produce
+
+
+def _read_input(element, window, slot):
+    try:
+        value = element.TKStringVar.get()
+    except:
+        value = ''
+    if not window.NonBlocking and not element.do_not_clear and not window.ReturnKeyboardEvents:
+        element.TKStringVar.set('')
+    return value
+
+
+def _read_checkbox(element, window, slot):
+    return element.TKIntVar.get() != 0
+
+
+def _read_radio(element, window, slot):
+    return element.TKIntVar.get() == slot.extra
+
+
+def _read_button(element, window, slot):
+    if element.BType == BUTTON_TYPE_CALENDAR_CHOOSER:
+        return element.calendar_selection
+    try:
+        return element.TKStringVar.get()
+    except:
+        return None
+
+
+def _read_combo(element, window, slot):
+    try:
+        if element.TKCombo.current() == -1:  # if the current value was not in the original list
+            return element.TKCombo.get()
+        return element.Values[element.TKCombo.current()]  # get value from original list given index
+    except:
+        return '*Exception occurred*'
+
+
+def _read_option_menu(element, window, slot):
+    return element.TKStringVar.get()
+
+
+def _read_listbox(element, window, slot):
+    try:
+        items = element.TKListbox.curselection()
+        return [element.Values[int(item)] for item in items]
+    except Exception:
+        return ''
+
+
+def _read_spin(element, window, slot):
+    try:
+        value = element.TKStringVar.get()
+        for v in element.Values:
+            if str(v) == value:
+                return v
+        return value
+    except:
+        return 0
+
+
+def _read_slider(element, window, slot):
+    try:
+        return float(element.TKScale.get())
+    except:
+        return 0
+
+
+def _read_multiline(element, window, slot):
+    try:
+        value = element.TKText.get(1.0, tk.END)
+        if element.rstrip:
+            value = value.rstrip()
+        if not window.NonBlocking and not element.do_not_clear and not window.ReturnKeyboardEvents:
+            element.TKText.delete('1.0', tk.END)
+        return value
+    except:
+        return None
+
+
+def _read_tab_group(element, window, slot):
+    try:
+        value = element.TKNotebook.tab(element.TKNotebook.index('current'))['text']
+        tab_key = element.find_currently_active_tab_key()
+        if tab_key is not None:
+            value = tab_key
+        return value
+    except:
+        return None
+
+
+def _read_selected_rows(element, window, slot):
+    return element.SelectedRows
+
+
+def _read_graph(element, window, slot):
+    return element.ClickPosition
+
+
+def _read_button_menu(element, window, slot):
+    return element.MenuItemChosen
+
+
+def _read_nothing(element, window, slot):
+    return None
+
+
+_READERS = {
+    ELEM_TYPE_INPUT_TEXT: _read_input,
+    ELEM_TYPE_INPUT_CHECKBOX: _read_checkbox,
+    ELEM_TYPE_INPUT_RADIO: _read_radio,
+    ELEM_TYPE_BUTTON: _read_button,
+    ELEM_TYPE_INPUT_COMBO: _read_combo,
+    ELEM_TYPE_INPUT_OPTION_MENU: _read_option_menu,
+    ELEM_TYPE_INPUT_LISTBOX: _read_listbox,
+    ELEM_TYPE_INPUT_SPIN: _read_spin,
+    ELEM_TYPE_INPUT_SLIDER: _read_slider,
+    ELEM_TYPE_INPUT_MULTILINE: _read_multiline,
+    ELEM_TYPE_TAB_GROUP: _read_tab_group,
+    ELEM_TYPE_TABLE: _read_selected_rows,
+    ELEM_TYPE_TREE: _read_selected_rows,
+    ELEM_TYPE_GRAPH: _read_graph,
+    ELEM_TYPE_BUTTONMENU: _read_button_menu,
+}
+
+# The tkinter variable that, when written, means the element's value may have changed
+_TRACED_VARIABLES = {
+    ELEM_TYPE_INPUT_TEXT: 'TKStringVar',
+    ELEM_TYPE_INPUT_CHECKBOX: 'TKIntVar',
+    ELEM_TYPE_INPUT_RADIO: 'TKIntVar',
+    ELEM_TYPE_INPUT_COMBO: 'TKStringVar',
+    ELEM_TYPE_INPUT_OPTION_MENU: 'TKStringVar',
+    ELEM_TYPE_INPUT_SPIN: 'TKStringVar',
+    ELEM_TYPE_INPUT_SLIDER: 'TKIntVar',
+}
+
+# Elements whose value is looked up in element.Values.  A new Values list means the cached value is stale.
+_VALUES_LIST_TYPES = (ELEM_TYPE_INPUT_COMBO, ELEM_TYPE_INPUT_SPIN)
+
+
+class _ResultSlot:
+    """
+    One entry in the flat, ordered plan built by _ResultsEngine
+    """
+
+    __slots__ = ('element', 'kind', 'reader', 'extra', 'emits', 'traced', 'dirty', 'value', 'token')
+
+    def __init__(self, element, kind, reader, extra=None, emits=True):
+        self.element = element
+        self.kind = kind
+        self.reader = reader
+        self.extra = extra
+        self.emits = emits
+        self.traced = False
+        self.dirty = True
+        self.value = None
+        self.token = None
+
+
+class _ResultsEngine:
+    """
+    Builds the values returned from Window.read without walking the whole layout every time.
+
+    The layout is walked once to produce a flat list of the elements that take part in building the results, in the
+    same order _BuildResultsForSubform visits them. Elements backed by a tkinter variable get a "write" trace so
+    that their cached value is only read back from tkinter after the variable changes. Everything else (Multiline,
+    Listbox, Table, Tree, Graph, menus, TabGroup, Inputs that clear themselves) is read on every call, like before.
+
+    The engine is dropped whenever the window's layout changes (add_row, extend_layout, TabGroup.add_tab) and is
+    rebuilt on the next read.
+    """
+
+    def __init__(self, window):
+        """
+        :param window: The window to build results for. Must already be finalized
+        :type window:  (Window)
+        """
+        self.window = window
+        self.slots = []  # type: list[_ResultSlot]
+        self.list_order = []  # type: list[int]
+        self.use_dictionary = False
+        self._traces = []  # list of (tk.Variable, trace callback name)
+        self._plan(window, True)
+        self._add_traces()
+
+    def _plan(self, form, top):
+        """
+        Walks one container, mirroring the recursion in _BuildResultsForSubform.
+        Values of a nested container land in the window's values list after that container's own nested containers,
+        which is why non top-level containers collect their list positions locally and hand them back.
+
+        :param form: The window or container element being walked
+        :type form:  Window | Column | Frame | Pane | TabGroup | Tab
+        :param top:  True if form is the window itself
+        :type top:   (bool)
+        :return:     Positions (into self.slots) of the values this container adds to the values list
+        :rtype:      List[int]
+        """
+        own = self.list_order if top else []
+        for row_num, row in enumerate(form.Rows):
+            for col_num, element in enumerate(row):
+                if element.Key is not None and WRITE_ONLY_KEY in str(element.Key):
+                    continue
+                elem_type = element.Type
+                if elem_type in _CONTAINER_TYPES:
+                    self.list_order.extend(self._plan(element, False))
+                    if element.UseDictionary:
+                        self.use_dictionary = True
+
+                if elem_type == ELEM_TYPE_INPUT_MULTILINE and element.WriteOnly:
+                    continue
+
+                if elem_type == ELEM_TYPE_BUTTON:
+                    emits = (element.BType == BUTTON_TYPE_COLOR_CHOOSER and element.Target == (None, None)) or (element.Key is not None and element.BType in _VALUE_BUTTON_TYPES)
+                    slot = _ResultSlot(element, _SLOT_BUTTON, _read_button, emits=emits)
+                elif elem_type == ELEM_TYPE_MENUBAR:
+                    slot = _ResultSlot(element, _SLOT_MENUBAR, None)
+                elif elem_type == ELEM_TYPE_BUTTONMENU and element.part_of_custom_menubar:
+                    slot = _ResultSlot(element, _SLOT_CUSTOM_MENUBAR, None, emits=False)
+                elif elem_type in _NO_VALUE_TYPES:
+                    continue
+                else:
+                    slot = _ResultSlot(element, _SLOT_VALUE, _READERS.get(elem_type, _read_nothing))
+                    if elem_type == ELEM_TYPE_INPUT_RADIO:
+                        slot.extra = EncodeRadioRowCol(form.ContainerElemementNumber, row_num, col_num)
+
+                self.slots.append(slot)
+                if slot.emits:
+                    own.append(len(self.slots) - 1)
+        return own
+
+    def _add_traces(self):
+        """
+        Adds one "write" trace per tkinter variable. Radio buttons in a group share a variable so one trace marks
+        every button in the group dirty.
+        """
+        slots_by_var = {}
+        variables = {}
+        for slot in self.slots:
+            element = slot.element
+            attr = _TRACED_VARIABLES.get(element.Type)
+            if attr is None or slot.kind != _SLOT_VALUE:
+                continue
+            # Inputs that clear themselves after a read must run their reader every time
+            if element.Type == ELEM_TYPE_INPUT_TEXT and not element.do_not_clear:
+                continue
+            var = getattr(element, attr, None)
+            if not isinstance(var, tk.Variable):
+                continue
+            name = str(var)
+            variables[name] = var
+            slots_by_var.setdefault(name, []).append(slot)
+            slot.traced = True
+
+        for name, var in variables.items():
+            try:
+                cbname = var.trace_add('write', self._make_callback(slots_by_var[name]))
+            except Exception:
+                for slot in slots_by_var[name]:
+                    slot.traced = False
+                continue
+            self._traces.append((var, cbname))
+
+    @staticmethod
+    def _make_callback(slots):
+        def _var_written(*args):
+            for slot in slots:
+                slot.dirty = True
+
+        return _var_written
+
+    def detach(self):
+        """
+        Removes the variable traces. Called when the layout changes and the engine is thrown away.
+        """
+        for var, cbname in self._traces:
+            try:
+                var.trace_remove('write', cbname)
+            except Exception:
+                pass
+        self._traces = []
+
+    def build(self):
+        """
+        Produces the same results _BuildResults(window, False, window) would, reading only what may have changed.
+
+        :return: (event, values) where values is a dict or list depending on window.UseDictionary
+        :rtype:  Tuple[Any, Dict[Any, Any] | List[Any]]
+        """
+        window = self.window
+        event = window.LastButtonClicked
+        values_dict = window.ReturnValuesDictionary = {}
+        slot_values = [None] * len(self.slots)
+
+        for index, slot in enumerate(self.slots):
+            element = slot.element
+            kind = slot.kind
+            if kind == _SLOT_VALUE:
+                if slot.traced and not slot.dirty:
+                    if element.Type in _VALUES_LIST_TYPES and slot.token != id(element.Values):
+                        slot.dirty = True
+                if slot.dirty or not slot.traced:
+                    value = slot.reader(element, window, slot)
+                    if slot.traced:
+                        slot.value = value
+                        slot.dirty = False
+                        if element.Type in _VALUES_LIST_TYPES:
+                            slot.token = id(element.Values)
+                else:
+                    value = slot.value
+            elif kind == _SLOT_BUTTON:
+                if window.LastButtonClicked == element.Key:
+                    event = window.LastButtonClicked
+                    if element.BType != BUTTON_TYPE_REALTIME:  # Do not clear realtime buttons
+                        window.LastButtonClicked = None
+                if not slot.emits:
+                    continue
+                value = slot.reader(element, window, slot)
+            elif kind == _SLOT_MENUBAR:
+                if element.MenuItemChosen is not None:
+                    event = window.LastButtonClicked = element.MenuItemChosen
+                value = element.MenuItemChosen
+                element.MenuItemChosen = None
+            else:  # _SLOT_CUSTOM_MENUBAR
+                if element.MenuItemChosen is not None:
+                    value = event = element.MenuItemChosen
+                    window.LastButtonClicked = element.MenuItemChosen
+                    if element.custom_menubar_key is not None:
+                        values_dict[element.custom_menubar_key] = value
+                    element.MenuItemChosen = None
+                elif element.custom_menubar_key not in values_dict:
+                    values_dict[element.custom_menubar_key] = None
+                continue
+
+            slot_values[index] = value
+            values_dict[element.Key] = value
+
+        window.ReturnValuesList = [slot_values[index] for index in self.list_order]
+        if self.use_dictionary:
+            window.UseDictionary = True
+
+        if window.ReturnKeyboardEvents and window.LastKeyboardEvent is not None:
+            event = window.LastKeyboardEvent
+            window.LastKeyboardEvent = None
+
+        values_dict.pop(None, None)  # clean up dictionary include None was included
+
+        if event is None:
+            queued_event_value = window._queued_thread_event_read()
+            if queued_event_value is not None:
+                event, value = queued_event_value
+                window.ReturnValuesList.append(value)
+                values_dict[event] = value
+
+        if not window.UseDictionary:
+            window.ReturnValues = event, window.ReturnValuesList
+        else:
+            window.ReturnValues = event, values_dict
+
+        if not window.LastButtonClickedWasRealtime:
+            window.LastButtonClicked = None
+        return window.ReturnValues
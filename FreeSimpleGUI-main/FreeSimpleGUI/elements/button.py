@@ -553,11 +553,7 @@ class Button(Element):
         self.Disabled = disabled if disabled is not None else self.Disabled
 
         if image_data is not None:
-            image = tk.PhotoImage(data=image_data)
-            if image_subsample:
-                image = image.subsample(image_subsample)
-            if image_zoom is not None:
-                image = image.zoom(int(image_zoom))
+            image = _cached_photo_image(data=image_data, subsample=image_subsample, zoom=image_zoom)
             if image_size is not None:
                 width, height = image_size
             else:
@@ -568,11 +564,7 @@ class Button(Element):
                 self.TKButton.config(image=image, width=width, height=height)
             self.TKButton.image = image
         if image_filename is not None:
-            image = tk.PhotoImage(file=image_filename)
-            if image_subsample:
-                image = image.subsample(image_subsample)
-            if image_zoom is not None:
-                image = image.zoom(int(image_zoom))
+            image = _cached_photo_image(filename=image_filename, subsample=image_subsample, zoom=image_zoom)
             if image_size is not None:
                 width, height = image_size
             else:
@@ -861,19 +853,11 @@ class ButtonMenu(Element):
                     )
             image = None
             if filename is not None:
-                image = tk.PhotoImage(file=filename)
-                if image_subsample is not None:
-                    image = image.subsample(image_subsample)
-                if image_zoom is not None:
-                    image = image.zoom(int(image_zoom))
+                image = _cached_photo_image(filename=filename, subsample=image_subsample, zoom=image_zoom)
             elif data is not None:
                 # if type(data) is bytes:
                 try:
-                    image = tk.PhotoImage(data=data)
-                    if image_subsample is not None:
-                        image = image.subsample(image_subsample)
-                    if image_zoom is not None:
-                        image = image.zoom(int(image_zoom))
+                    image = _cached_photo_image(data=data, subsample=image_subsample, zoom=image_zoom)
                 except Exception:
                     image = data
 
@@ -919,5 +903,6 @@ class ButtonMenu(Element):
     Click = click
 
 
+from FreeSimpleGUI._image_cache import _cached_photo_image
 from FreeSimpleGUI._utils import _error_popup_with_traceback, _exit_mainloop
 from FreeSimpleGUI.window import Window
@@ -7,10 +7,65 @@ from FreeSimpleGUI import COLOR_SYSTEM_DEFAULT
 from FreeSimpleGUI import ELEM_TYPE_GRAPH
 from FreeSimpleGUI import Element
 from FreeSimpleGUI import TEXT_LOCATION_CENTER
+from FreeSimpleGUI._figure_index import _FigureIndex
+from FreeSimpleGUI._image_cache import _cached_photo_image
 from FreeSimpleGUI._utils import _error_popup_with_traceback
 from FreeSimpleGUI._utils import _exit_mainloop
 
 
+def _decimate_columns(points):
+    """
+    Not user callable!
+    Thins out a polyline that's already in canvas coordinates so there are at most 4 points per pixel column: the
+    first, last, lowest and highest point in each column (known as M4 decimation).  The line drawn looks the same
+    as the full one, spikes included, but how long it takes to draw depends on the width of the canvas rather than
+    on the number of points.
+    Only lines that keep going the same direction in x can be thinned this way.  Anything else is returned as is.
+
+    :param points: The canvas coordinates shaped (N, 2)
+    :type points:  numpy.ndarray
+    :return:       The points to draw, in their original order
+    :rtype:        numpy.ndarray
+    """
+    import numpy
+
+    count = len(points)
+    if count < 8:
+        return points
+    y = points[:, 1]
+    steps = numpy.diff(numpy.floor(points[:, 0]))
+    if ((steps < 0).any() and (steps > 0).any()) or numpy.isnan(y).any():
+        return points
+    starts = numpy.flatnonzero(numpy.concatenate(([True], steps != 0)))
+    if len(starts) * 4 >= count:  # already less than 4 points per column
+        return points
+    ends = numpy.append(starts[1:], count) - 1
+    column = numpy.repeat(numpy.arange(len(starts)), numpy.diff(numpy.append(starts, count)))
+    keep = [starts, ends]
+    for extreme in (numpy.minimum.reduceat(y, starts), numpy.maximum.reduceat(y, starts)):
+        matches = numpy.flatnonzero(y == extreme[column])  # every column has at least one
+        keep.append(matches[numpy.concatenate(([True], numpy.diff(column[matches]) != 0))])
+    return points[numpy.unique(numpy.concatenate(keep))]
+
+
+# kind of figure for Graph.draw_figures -> tkinter canvas item type
+_FIGURE_KINDS = {'line': 'line', 'lines': 'line', 'polygon': 'polygon', 'rectangle': 'rectangle', 'oval': 'oval', 'point': 'oval'}
+
+
+class _FigureGroup:
+    """
+    Not user callable!
+    The figures drawn by one Graph.draw_figures group.  They all have the canvas tag so they can be configured,
+    moved or deleted with a single tkinter call.
+    """
+
+    def __init__(self, kind, tag, ids, options):
+        self.kind = kind
+        self.tag = tag
+        self.ids = ids
+        self.options = options
+
+
 class Graph(Element):
     """
     Creates an area for you to draw on.  The MAGICAL property this Element has is that you interact
@@ -108,6 +163,11 @@ class Graph(Element):
         self.expand_x = expand_x
         self.expand_y = expand_y
         self.motion_events = motion_events
+        self._transform_key = None
+        self._transform = None
+        self._figure_groups = {}  # group -> _FigureGroup made by draw_figures
+        self._batch_count = 0
+        self._figure_index = None  # type: _FigureIndex    # made the first time a figure query needs it
 
         super().__init__(
             ELEM_TYPE_GRAPH,
@@ -121,6 +181,25 @@ class Graph(Element):
         )
         return
 
+    def _canvas_transform(self):
+        """
+        Not user callable.  The numbers needed to convert user coordinates into canvas coordinates.  They're only
+        calculated again when the canvas size or the coordinate system changes.
+
+        :return: scale_x, scale_y, the user x of the left edge, the user y of the bottom edge, canvas height
+        :rtype:  (float, float, float, float, float)
+        """
+        key = (self.CanvasSize, self.BottomLeft, self.TopRight)
+        if key != self._transform_key:
+            try:
+                scale_x = (self.CanvasSize[0] - 0) / (self.TopRight[0] - self.BottomLeft[0])
+                scale_y = (0 - self.CanvasSize[1]) / (self.TopRight[1] - self.BottomLeft[1])
+            except:
+                scale_x = scale_y = 0
+            self._transform = (scale_x, scale_y, self.BottomLeft[0], self.BottomLeft[1], self.CanvasSize[1])
+            self._transform_key = key
+        return self._transform
+
     def _convert_xy_to_canvas_xy(self, x_in, y_in):
         """
         Not user callable.  Used to convert user's coordinates into the ones used by tkinter
@@ -133,16 +212,39 @@ class Graph(Element):
         """
         if None in (x_in, y_in):
             return None, None
-        try:
-            scale_x = (self.CanvasSize[0] - 0) / (self.TopRight[0] - self.BottomLeft[0])
-            scale_y = (0 - self.CanvasSize[1]) / (self.TopRight[1] - self.BottomLeft[1])
-        except:
-            scale_x = scale_y = 0
-
-        new_x = 0 + scale_x * (x_in - self.BottomLeft[0])
-        new_y = self.CanvasSize[1] + scale_y * (y_in - self.BottomLeft[1])
+        scale_x, scale_y, left, bottom, height = self._canvas_transform()
+        new_x = 0 + scale_x * (x_in - left)
+        new_y = height + scale_y * (y_in - bottom)
         return new_x, new_y
 
+    def _canvas_coordinates(self, points, decimate=False):
+        """
+        Not user callable.  Converts many points at once into a flat list of canvas coordinates [x0, y0, x1, y1, ...]
+        that can be passed straight to tkinter.  A NumPy array of points is converted with array math instead of
+        a Python loop.
+
+        :param points:   The points in user's coordinates
+        :type points:    List[(int, int) | Tuple[float, float]] | numpy.ndarray
+        :param decimate: If True the points are a polyline that's thinned to at most 4 points per pixel column. Needs NumPy
+        :type decimate:  (bool)
+        :return:         The canvas coordinates
+        :rtype:          List[float]
+        """
+        scale_x, scale_y, left, bottom, height = self._canvas_transform()
+        if decimate and not hasattr(points, 'shape') and len(points) > 4 * self.CanvasSize[0]:
+            try:
+                import numpy
+
+                points = numpy.asarray(points, dtype=float)
+            except ImportError:
+                pass
+        if hasattr(points, 'shape'):  # NumPy array shaped (N, 2)
+            converted = (points - (left, bottom)) * (scale_x, scale_y) + (0, height)
+            if decimate:
+                converted = _decimate_columns(converted)
+            return converted.ravel().tolist()
+        return [c for x, y in points for c in (scale_x * (x - left), height + scale_y * (y - bottom))]
+
     def _convert_canvas_xy_to_xy(self, x_in, y_in):
         """
         Not user callable.  Used to convert tkinter Canvas coords into user's coordinates
@@ -192,30 +294,39 @@ class Graph(Element):
             id = self._TKCanvas2.create_line(converted_point_from, converted_point_to, width=width, fill=color)
         except:
             id = None
+        self._index_figure(id)
         return id
 
-    def draw_lines(self, points, color='black', width=1):
+    def draw_lines(self, points, color='black', width=1, decimate=False):
         """
         Draw a series of lines given list of points
 
-        :param points: list of points that define the polygon
-        :type points:  List[(int, int) | Tuple[float, float]]
-        :param color:  Color of the line
-        :type color:   (str)
-        :param width:  width of line in pixels
-        :type width:   (int)
-        :return:       id returned from tktiner or None if user closed the window. id is used when you
-        :rtype:        int | None
+        Plotting a long series (a sensor trace with a million samples for example)?  Set decimate and only the first,
+        last, lowest and highest point that land in each pixel column are drawn.  It looks the same but the time to
+        draw it depends on the width of the Graph instead of the number of points.  The x values must only increase
+        (or only decrease) and NumPy must be installed, otherwise all the points are drawn.
+
+        :param points:   list of points that define the polygon
+        :type points:    List[(int, int) | Tuple[float, float]] | numpy.ndarray
+        :param color:    Color of the line
+        :type color:     (str)
+        :param width:    width of line in pixels
+        :type width:     (int)
+        :param decimate: If True, draw at most 4 points per pixel column
+        :type decimate:  (bool)
+        :return:         id returned from tktiner or None if user closed the window. id is used when you
+        :rtype:          int | None
         """
-        converted_points = [self._convert_xy_to_canvas_xy(point[0], point[1]) for point in points]
+        converted_points = self._canvas_coordinates(points, decimate)
 
         try:  # in case window was closed with an X
-            id = self._TKCanvas2.create_line(*converted_points, width=width, fill=color)
+            id = self._TKCanvas2.create_line(converted_points, width=width, fill=color)
         except:
             if self._TKCanvas2 is None:
                 print('*** WARNING - The Graph element has not been finalized and cannot be drawn upon ***')
                 print('Call Window.Finalize() prior to this operation')
             id = None
+        self._index_figure(id)
         return id
 
     def draw_point(self, point, size=2, color='black'):
@@ -245,6 +356,7 @@ class Graph(Element):
             id = self._TKCanvas2.create_oval(point1[0], point1[1], point2[0], point2[1], width=0, fill=color, outline=color)
         except:
             id = None
+        self._index_figure(id)
         return id
 
     def draw_circle(self, center_location, radius, fill_color=None, line_color='black', line_width=1):
@@ -285,6 +397,7 @@ class Graph(Element):
             )
         except:
             id = None
+        self._index_figure(id)
         return id
 
     def draw_oval(self, top_left, bottom_right, fill_color=None, line_color=None, line_width=1):
@@ -322,6 +435,7 @@ class Graph(Element):
         except:
             id = None
 
+        self._index_figure(id)
         return id
 
     def draw_arc(self, top_left, bottom_right, extent, start_angle, style=None, arc_color='black', line_width=1, fill_color=None):
@@ -367,6 +481,7 @@ class Graph(Element):
         except Exception as e:
             print('Error encountered drawing arc.', e)
             id = None
+        self._index_figure(id)
         return id
 
     def draw_rectangle(self, top_left, bottom_right, fill_color=None, line_color=None, line_width=None):
@@ -407,6 +522,7 @@ class Graph(Element):
             )
         except:
             id = None
+        self._index_figure(id)
         return id
 
     def draw_polygon(self, points, fill_color=None, line_color=None, line_width=None):
@@ -414,7 +530,7 @@ class Graph(Element):
         Draw a polygon given list of points
 
         :param points:     list of points that define the polygon
-        :type points:      List[(int, int) | Tuple[float, float]]
+        :type points:      List[(int, int) | Tuple[float, float]] | numpy.ndarray
         :param fill_color: color of the interior
         :type fill_color:  (str)
         :param line_color: color of outline
@@ -425,7 +541,7 @@ class Graph(Element):
         :rtype:            int | None
         """
 
-        converted_points = [self._convert_xy_to_canvas_xy(point[0], point[1]) for point in points]
+        converted_points = self._canvas_coordinates(points)
         if self._TKCanvas2 is None:
             print('*** WARNING - The Graph element has not been finalized and cannot be drawn upon ***')
             print('Call Window.Finalize() prior to this operation')
@@ -434,6 +550,7 @@ class Graph(Element):
             id = self._TKCanvas2.create_polygon(converted_points, fill=fill_color, outline=line_color, width=line_width)
         except:
             id = None
+        self._index_figure(id)
         return id
 
     def draw_text(self, text, location, color='black', font=None, angle=0, text_location=TEXT_LOCATION_CENTER):
@@ -475,6 +592,7 @@ class Graph(Element):
             )
         except:
             id = None
+        self._index_figure(id)
         return id
 
     def draw_image(self, filename=None, data=None, location=(None, None)):
@@ -493,11 +611,11 @@ class Graph(Element):
         if location == (None, None):
             return
         if filename is not None:
-            image = tk.PhotoImage(file=filename)
+            image = _cached_photo_image(filename=filename)
         elif data is not None:
             # if type(data) is bytes:
             try:
-                image = tk.PhotoImage(data=data)
+                image = _cached_photo_image(data=data)
             except:
                 return None  # an error likely means the window has closed so exit
         converted_point = self._convert_xy_to_canvas_xy(location[0], location[1])
@@ -510,8 +628,281 @@ class Graph(Element):
             self.Images[id] = image
         except:
             id = None
+        self._index_figure(id)
         return id
 
+    def draw_figures(self, kind, figures, fill_color=None, line_color=None, line_width=1, size=2, group=None, decimate=False):
+        """
+        Draws many figures of the same kind at once.  The coordinates are converted together (with array math for
+        NumPy arrays) and the figures share their options, which are set with a single tkinter call.
+        Good for scatter plots, bar charts and anything else redrawn many times a second.
+
+        Each figure is given the same way as to the matching draw_ method:
+            'line' or 'lines' - a list of points
+            'polygon'         - a list of points
+            'rectangle'       - top_left, bottom_right
+            'oval'            - top_left, bottom_right of the bounding rectangle
+            'point'           - one point.  size is the diameter in user's coordinates like draw_point
+        figures can be a list or a NumPy array shaped (N, 2) for points or (N, points per figure, 2) for the others.
+
+        If a group name is given, the figures are kept ("retained") by the Graph.  Calling draw_figures again with
+        the same group moves the existing figures to their new coordinates instead of deleting and creating them,
+        only adding or removing figures when the number of them changes.  Pass the group to delete_figure,
+        move_figure, bring_figure_to_front or send_figure_to_back to operate on all of its figures at once.
+        erase removes all groups.
+
+        :param kind:       The kind of figures: 'line', 'lines', 'polygon', 'rectangle', 'oval' or 'point'
+        :type kind:        (str)
+        :param figures:    The figures to draw, in user's coordinates
+        :type figures:     List[List[(int, int) | Tuple[float, float]]] | numpy.ndarray
+        :param fill_color: color of the interior. Also the color of points if line_color isn't set
+        :type fill_color:  (str)
+        :param line_color: color of lines and of the outline of other figures
+        :type line_color:  (str)
+        :param line_width: width of the lines in pixels
+        :type line_width:  (int)
+        :param size:       Diameter of points in user's coordinate values
+        :type size:        int | float
+        :param group:      Name to keep these figures under so they can be updated by calling draw_figures again
+        :type group:       (str | None)
+        :param decimate:   For lines. If True, draw at most 4 points per pixel column. See draw_lines
+        :type decimate:    (bool)
+        :return:           ids of the figures, in the same order as figures. None if the window was closed
+        :rtype:            List[int] | None
+        """
+        tk_type = _FIGURE_KINDS.get(kind)
+        if tk_type is None:
+            _error_popup_with_traceback('Error in Graph.draw_figures', f'Unknown kind of figure: {kind}', f'Valid kinds are: {", ".join(_FIGURE_KINDS)}')
+            return None
+        if self._TKCanvas2 is None:
+            print('*** WARNING - The Graph element has not been finalized and cannot be drawn upon ***')
+            print('Call Window.Finalize() prior to this operation')
+            return None
+        coordinates = self._figure_coordinates(kind, figures, size, decimate)
+        if kind in ('line', 'lines'):
+            options = {'fill': line_color or 'black', 'width': line_width}
+        elif kind == 'point':
+            color = fill_color or line_color or 'black'
+            options = {'fill': color, 'outline': color, 'width': 0}
+        else:
+            options = {'fill': fill_color, 'outline': line_color, 'width': line_width}
+
+        canvas = self._TKCanvas2
+        figure_group = self._figure_groups.get(group) if group is not None else None
+        if figure_group is not None and figure_group.kind != kind:
+            self.delete_figure(group)
+            figure_group = None
+        try:  # in case window was closed with an X
+            if figure_group is None:
+                self._batch_count += 1
+                tag = f'sg_figures_{self._batch_count}'
+                ids = self._create_figures(tk_type, coordinates, tag)
+                canvas.itemconfigure(tag, **options)
+                self._index_figures(ids, coordinates, line_width)
+                if group is None:
+                    canvas.dtag(tag)
+                    return ids
+                self._figure_groups[group] = _FigureGroup(kind, tag, ids, options)
+                return list(ids)
+
+            ids = figure_group.ids
+            reused = min(len(ids), len(coordinates))
+            call, widget = canvas.tk.call, canvas._w
+            for id, coords in zip(ids, coordinates):
+                call(widget, 'coords', id, coords)
+            if len(coordinates) > len(ids):
+                ids += self._create_figures(tk_type, coordinates[reused:], figure_group.tag)
+                figure_group.options = None  # the new figures need the options set
+            elif len(coordinates) < len(ids):
+                canvas.delete(*ids[reused:])
+                if self._figure_index is not None:
+                    for id in ids[reused:]:
+                        self._figure_index.remove(id)
+                del ids[reused:]
+            if options != figure_group.options:
+                canvas.itemconfigure(figure_group.tag, **options)
+                figure_group.options = options
+            self._index_figures(ids, coordinates, line_width)
+            return list(ids)
+        except:
+            return None
+
+    def _figure_coordinates(self, kind, figures, size, decimate=False):
+        """
+        Not user callable.  Converts the figures given to draw_figures into one flat list of canvas coordinates per figure
+
+        :return: The canvas coordinates of each figure
+        :rtype:  List[List[float]]
+        """
+        if kind == 'point':
+            centers = self._canvas_coordinates(figures)
+            half = (self._canvas_transform()[0] * size) // 2  # same as draw_point
+            return [[x - half, y - half, x + half, y + half] for x, y in zip(centers[0::2], centers[1::2])]
+        if decimate and kind in ('line', 'lines'):
+            return [self._canvas_coordinates(figure, decimate) for figure in figures]
+        if hasattr(figures, 'shape') and len(figures.shape) == 3:  # (N, points per figure, 2)
+            flat = self._canvas_coordinates(figures.reshape(-1, 2))
+            per_figure = figures.shape[1] * 2
+            return [flat[i : i + per_figure] for i in range(0, len(flat), per_figure)]
+        return [self._canvas_coordinates(figure) for figure in figures]
+
+    def _create_figures(self, tk_type, coordinates, tag):
+        """
+        Not user callable.  Creates canvas items of one type, going straight to tcl instead of through the tkinter
+        create_ methods, which spend more time preparing the options than tk spends making the item.
+        Options are left to the caller to set on the tag with one itemconfigure.
+
+        :return: ids of the new items
+        :rtype:  List[int]
+        """
+        call, widget = self._TKCanvas2.tk.call, self._TKCanvas2._w
+        return [int(call(widget, 'create', tk_type, coords, '-tags', tag)) for coords in coordinates]
+
+    def update_figure(self, figure, points, decimate=False):
+        """
+        Moves a previously drawn figure to new coordinates without deleting it and drawing it again.  Much faster than
+        erasing and redrawing a figure that changes each frame, like a live plot drawn with draw_lines.
+
+        points are given the same way the figure was drawn: the list of points for lines and polygons, top_left and
+        bottom_right for rectangles, ovals and arcs and the location for text and images.  For figures made with
+        draw_point or draw_circle use the top left and bottom right of the circle.
+
+        :param figure:   Previously obtained figure-id. These are returned from all Draw methods
+        :type figure:    (int)
+        :param points:   The new points in user's coordinates
+        :type points:    List[(int, int) | Tuple[float, float]] | numpy.ndarray
+        :param decimate: For lines. If True, draw at most 4 points per pixel column. See draw_lines
+        :type decimate:  (bool)
+        """
+        if self._TKCanvas2 is None:
+            print('*** WARNING - The Graph element has not been finalized and cannot be drawn upon ***')
+            print('Call Window.Finalize() prior to this operation')
+            return None
+        if figure is None:
+            print('* update_figure warning - your figure is None *')
+            return None
+        canvas = self._TKCanvas2
+        try:  # in case window was closed with an X
+            canvas.tk.call(canvas._w, 'coords', figure, self._canvas_coordinates(points, decimate))
+        except:
+            return
+        self._index_figure(figure)
+
+    def _figure_tag(self, figure):
+        """
+        Not user callable.  Turns a group name from draw_figures into the canvas tag of its figures.  Anything else is
+        returned as is.
+        """
+        if isinstance(figure, str) and figure in self._figure_groups:
+            return self._figure_groups[figure].tag
+        return figure
+
+    def _index_figure(self, id):
+        """
+        Not user callable.  Puts a figure that was just drawn or changed into the figure index, if there is one yet,
+        using the bounding box tkinter gives it
+        """
+        if self._figure_index is None or id is None:
+            return
+        try:
+            box = self._TKCanvas2.bbox(id)
+        except:
+            return
+        if box:
+            self._figure_index.add(id, box)
+
+    def _index_figures(self, ids, coordinates, line_width):
+        """
+        Not user callable.  Puts the figures from draw_figures into the figure index, if there is one yet.  The boxes
+        are worked out from the coordinates instead of asking tkinter about each figure.
+        """
+        if self._figure_index is None:
+            return
+        pad = (line_width or 1) / 2 + 1
+        add = self._figure_index.add
+        for id, coords in zip(ids, coordinates):
+            xs, ys = coords[0::2], coords[1::2]
+            if xs:
+                add(id, (min(xs) - pad, min(ys) - pad, max(xs) + pad, max(ys) + pad))
+
+    def _figure_ids(self, figure):
+        """
+        Not user callable.  The ids a figure or group name from draw_figures stands for
+        """
+        if isinstance(figure, str) and figure in self._figure_groups:
+            return self._figure_groups[figure].ids
+        return [figure]
+
+    def _index(self):
+        """
+        Not user callable.  Returns the figure index, making it from what's on the canvas the first time it's needed.
+        After that every drawing method keeps it up to date.
+        """
+        if self._figure_index is None:
+            index = _FigureIndex()
+            canvas = self._TKCanvas2
+            for id in canvas.find_all():  # bottom to top
+                box = canvas.bbox(id)
+                if box:
+                    index.add(id, box)
+            self._figure_index = index
+        return self._figure_index
+
+    def get_figures_in_region(self, top_left, bottom_right):
+        """
+        Returns the figures whose bounding boxes overlap a rectangle.  Answered from an index of the figures kept by
+        the Graph, so it's fast enough to call on every mouse movement, even with thousands of figures.
+        Figures drawn on tk_canvas directly, rather than with the Graph's methods, are only seen if they were there
+        before the first query.
+
+        :param top_left:     the top left point of the region
+        :type top_left:      (int, int) | Tuple[float, float]
+        :param bottom_right: the bottom right point of the region
+        :type bottom_right:  (int, int) | Tuple[float, float]
+        :return:             ids of the figures, from the bottom to the top
+        :rtype:              List[int]
+        """
+        if self._TKCanvas2 is None:
+            print('*** WARNING - The Graph element has not been finalized and cannot be drawn upon ***')
+            print('Call Window.Finalize() prior to this operation')
+            return []
+        x0, y0 = self._convert_xy_to_canvas_xy(top_left[0], top_left[1])
+        x1, y1 = self._convert_xy_to_canvas_xy(bottom_right[0], bottom_right[1])
+        return self._index().in_region(x0, y0, x1, y1)
+
+    def get_figure_at_location(self, location):
+        """
+        Returns the top figure whose bounding box holds a point.  Meant for hover highlighting - like
+        get_figures_in_region it uses the Graph's index of figures instead of asking tkinter.
+        Use get_figures_at_location to check against the exact shapes instead of the bounding boxes.
+
+        :param location: point to check
+        :type location:  (int, int) | Tuple[float, float]
+        :return:         id of the figure or None if there's no figure there
+        :rtype:          int | None
+        """
+        if self._TKCanvas2 is None or location == (None, None):
+            return None
+        x, y = self._convert_xy_to_canvas_xy(location[0], location[1])
+        return self._index().at(x, y)
+
+    def get_nearest_figure(self, location, max_distance=None):
+        """
+        Returns the figure closest to a point, measuring to the edge of each figure's bounding box.  A point inside a box
+        is a distance of 0.  If several are as close, the one on top is returned.
+
+        :param location:     point to check
+        :type location:      (int, int) | Tuple[float, float]
+        :param max_distance: Only look this far from the point, in pixels. None to look anywhere on the Graph
+        :type max_distance:  (int | float | None)
+        :return:             id of the figure or None if there are none (close enough)
+        :rtype:              int | None
+        """
+        if self._TKCanvas2 is None or location == (None, None):
+            return None
+        x, y = self._convert_xy_to_canvas_xy(location[0], location[1])
+        return self._index().nearest(x, y, max_distance)
+
     def erase(self):
         """
         Erase the Graph - Removes all figures previously "drawn" using the Graph methods (e.g. DrawText)
@@ -521,6 +912,9 @@ class Graph(Element):
             print('Call Window.Finalize() prior to this operation')
             return None
         self.Images = {}
+        self._figure_groups = {}
+        if self._figure_index is not None:
+            self._figure_index = _FigureIndex()
         try:  # in case window was closed with X
             self._TKCanvas2.delete('all')
         except:
@@ -530,9 +924,14 @@ class Graph(Element):
         """
         Remove from the Graph the figure represented by id. The id is given to you anytime you call a drawing primitive
 
-        :param id: the id returned to you when calling one of the drawing methods
-        :type id:  (int)
+        :param id: the id returned to you when calling one of the drawing methods or a group name from draw_figures
+        :type id:  (int | str)
         """
+        if self._figure_index is not None:
+            for figure_id in self._figure_ids(id):
+                self._figure_index.remove(figure_id)
+        if isinstance(id, str) and id in self._figure_groups:
+            id = self._figure_groups.pop(id).tag
         try:
             self._TKCanvas2.delete(id)
         except:
@@ -592,12 +991,14 @@ class Graph(Element):
             print('Call Window.Finalize() prior to this operation')
             return None
         self._TKCanvas2.move('all', shift_amount[0], shift_amount[1])
+        if self._figure_index is not None:
+            self._figure_index.move_all(shift_amount[0], shift_amount[1])
 
     def move_figure(self, figure, x_direction, y_direction):
         """
         Moves a previously drawn figure using a "delta" from current position
 
-        :param figure:      Previously obtained figure-id. These are returned from all Draw methods
+        :param figure:      Previously obtained figure-id. These are returned from all Draw methods. Or a group name from draw_figures
         :type figure:       (id)
         :param x_direction: delta to apply to position in the X direction
         :type x_direction:  int | float
@@ -610,7 +1011,10 @@ class Graph(Element):
         if figure is None:
             print('* move_figure warning - your figure is None *')
             return None
-        self._TKCanvas2.move(figure, shift_amount[0], shift_amount[1])
+        self._TKCanvas2.move(self._figure_tag(figure), shift_amount[0], shift_amount[1])
+        if self._figure_index is not None:
+            for id in self._figure_ids(figure):
+                self._figure_index.move(id, shift_amount[0], shift_amount[1])
 
     def relocate_figure(self, figure, x, y):
         """
@@ -634,24 +1038,30 @@ class Graph(Element):
             return None
         xy = self._TKCanvas2.coords(figure)
         self._TKCanvas2.move(figure, shift_converted[0] - xy[0], shift_converted[1] - xy[1])
+        if self._figure_index is not None:
+            self._figure_index.move(figure, shift_converted[0] - xy[0], shift_converted[1] - xy[1])
 
     def send_figure_to_back(self, figure):
         """
         Changes Z-order of figures on the Graph.  Sends the indicated figure to the back of all other drawn figures
 
-        :param figure: value returned by tkinter when creating the figure / drawing
+        :param figure: value returned by tkinter when creating the figure / drawing. Or a group name from draw_figures
         :type figure:  (int)
         """
-        self.TKCanvas.tag_lower(figure)  # move figure to the "bottom" of all other figure
+        self.TKCanvas.tag_lower(self._figure_tag(figure))  # move figure to the "bottom" of all other figure
+        if self._figure_index is not None:
+            self._figure_index.lower_to_bottom(self._figure_ids(figure))
 
     def bring_figure_to_front(self, figure):
         """
         Changes Z-order of figures on the Graph.  Brings the indicated figure to the front of all other drawn figures
 
-        :param figure: value returned by tkinter when creating the figure / drawing
+        :param figure: value returned by tkinter when creating the figure / drawing. Or a group name from draw_figures
         :type figure:  (int)
         """
-        self.TKCanvas.tag_raise(figure)  # move figure to the "top" of all other figures
+        self.TKCanvas.tag_raise(self._figure_tag(figure))  # move figure to the "top" of all other figures
+        if self._figure_index is not None:
+            self._figure_index.raise_to_top(self._figure_ids(figure))
 
     def get_figures_at_location(self, location):
         """
@@ -797,6 +1207,7 @@ class Graph(Element):
     DeleteFigure = delete_figure
     DrawArc = draw_arc
     DrawCircle = draw_circle
+    DrawFigures = draw_figures
     DrawImage = draw_image
     DrawLine = draw_line
     DrawOval = draw_oval
@@ -806,6 +1217,9 @@ class Graph(Element):
     DrawRectangle = draw_rectangle
     DrawText = draw_text
     GetFiguresAtLocation = get_figures_at_location
+    GetFigureAtLocation = get_figure_at_location
+    GetFiguresInRegion = get_figures_in_region
+    GetNearestFigure = get_nearest_figure
     GetBoundingBox = get_bounding_box
     Erase = erase
     MotionCallBack = motion_call_back
@@ -815,3 +1229,4 @@ class Graph(Element):
     SendFigureToBack = send_figure_to_back
     TKCanvas = tk_canvas
     Update = update
+    UpdateFigure = update_figure
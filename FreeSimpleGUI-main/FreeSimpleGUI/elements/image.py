@@ -5,6 +5,8 @@ import tkinter as tk
 import warnings
 
 from FreeSimpleGUI import ELEM_TYPE_IMAGE
+from FreeSimpleGUI._animation import _AnimatedGif
+from FreeSimpleGUI._image_cache import _cached_photo_image
 from FreeSimpleGUI._utils import _error_popup_with_traceback
 from FreeSimpleGUI.elements.base import Element
 
@@ -99,6 +101,7 @@ class Image(Element):
         self.LastFrameTime = 0
         self.ImageSubsample = subsample
         self.zoom = int(zoom) if zoom is not None else None
+        self._pixel_image = None  # type: tk.PhotoImage   # reused by every update_pixels call
 
         self.Source = filename if filename is not None else data
         key = key if key is not None else k
@@ -165,17 +168,13 @@ class Image(Element):
         image = None
         if filename is not None:
             try:
-                image = tk.PhotoImage(file=filename)
-                if subsample is not None:
-                    image = image.subsample(subsample)
-                if zoom is not None:
-                    image = image.zoom(int(zoom))
+                image = _cached_photo_image(filename=filename, subsample=subsample, zoom=zoom)
             except Exception as e:
                 _error_popup_with_traceback('Exception updating Image element', e)
 
         elif data is not None:
             # if type(data) is bytes:
-            try:
+            try:  # not cached. Data is usually a new frame each time (video, animations) that would only fill the cache
                 image = tk.PhotoImage(data=data)
                 if subsample is not None:
                     image = image.subsample(subsample)
@@ -218,14 +217,82 @@ class Image(Element):
         if visible is not None:
             self._visible = visible
 
-    def update_animation(self, source, time_between_frames=0):
+    def update_pixels(self, pixels, width=None, height=None):
+        """
+        Shows raw pixels.  Much faster than update(data=...) for video or plots that change every frame.
+        The pixels are copied into a PhotoImage that's kept and reused for every call, so there is no PNG
+        encoding, no base64 and no new image object each frame.
+
+        pixels can be a NumPy array of uint8 shaped (height, width, 3) for RGB, (height, width, 4) for RGBA or
+        (height, width) for grayscale.  Or it can be any bytes-like object (bytes, bytearray, memoryview) holding
+        the RGB, RGBA or grayscale bytes row by row, in which case width and height must be supplied.
+        Alpha values are ignored.  OpenCV frames are BGR so convert them to RGB first.
+
+        :param pixels: The pixels to show
+        :type pixels:  numpy.ndarray | bytes | bytearray | memoryview
+        :param width:  Width of the image in pixels. Only needed if pixels doesn't have a shape
+        :type width:   (int | None)
+        :param height: Height of the image in pixels. Only needed if pixels doesn't have a shape
+        :type height:  (int | None)
+        """
+        if not self._widget_was_created():  # if widget hasn't been created yet, then don't allow
+            return
+
+        if self._this_elements_window_closed():
+            _error_popup_with_traceback('Error in Image.update_pixels - The window was closed')
+            return
+
+        shape = getattr(pixels, 'shape', None)
+        if shape is not None:
+            height, width = shape[0], shape[1]
+        if width is None or height is None:
+            _error_popup_with_traceback('Error in Image.update_pixels', 'width and height are needed when pixels is not an array')
+            return
+        data = memoryview(pixels)
+        if not data.c_contiguous:
+            data = memoryview(data.tobytes())
+        data = data.cast('B')
+        channels = len(data) // (width * height) if width and height else 0
+        if channels not in (1, 3, 4) or channels * width * height != len(data):
+            _error_popup_with_traceback(
+                'Error in Image.update_pixels',
+                f'Expected {width} x {height} pixels of 1, 3 or 4 bytes each (uint8) but got {len(data)} bytes',
+            )
+            return
+        if channels == 4:  # tk's ppm reader has no alpha, so drop it
+            rgba = data.tobytes()
+            data = bytearray(width * height * 3)
+            data[0::3] = rgba[0::4]
+            data[1::3] = rgba[1::4]
+            data[2::3] = rgba[2::4]
+        # A binary PPM (PGM for grayscale) is just a short header followed by the raw bytes
+        ppm = b''.join((b'P5' if channels == 1 else b'P6', f' {width} {height} 255 '.encode(), data))
+
+        image = self._pixel_image
+        try:
+            if image is None or image.width() != width or image.height() != height:
+                image = self._pixel_image = tk.PhotoImage(width=width, height=height)
+            image.tk.call(image.name, 'put', ppm, '-format', 'ppm')
+            if str(self.tktext_label.cget('image')) != image.name:  # first frame, new size or something else was shown
+                self.tktext_label.configure(image=image, width=width, height=height)
+                self.tktext_label.image = image
+        except Exception as e:  # sometimes crashes if user closed with X
+            _error_popup_with_traceback('Exception updating Image element', e)
+
+    def update_animation(self, source, time_between_frames=0, max_cached_frames=100):
         """
         Show an Animated GIF. Call the function as often as you like. The function will determine when to show the next frame and will automatically advance to the next frame at the right time.
         NOTE - does NOT perform a sleep call to delay
+
+        Frames are decoded when they're first shown (the next frame is decoded while tkinter is idle) and up to
+        max_cached_frames of them are kept.  Image elements showing the same source share the decoded frames.
+
         :param source:              Filename or Base64 encoded string containing Animated GIF
         :type source:               str | bytes | None
-        :param time_between_frames: Number of milliseconds to wait between showing frames
-        :type time_between_frames:  (int)
+        :param time_between_frames: Number of milliseconds to wait between showing frames. 0 shows a new frame every call. None uses the timing stored in the GIF for each frame
+        :type time_between_frames:  (int | None)
+        :param max_cached_frames:   Most decoded frames to keep in memory. Frames beyond this are decoded again when needed
+        :type max_cached_frames:    (int)
         """
 
         if self.Source != source:
@@ -233,38 +300,36 @@ class Image(Element):
             self.Source = source
 
         if self.AnimatedFrames is None:
-            self.TotalAnimatedFrames = 0
-            self.AnimatedFrames = []
-            # Load up to 1000 frames of animation.  stops when a bad frame is returns by tkinter
-            for i in range(1000):
-                if type(source) is not bytes:
-                    try:
-                        self.AnimatedFrames.append(tk.PhotoImage(file=source, format='gif -index %i' % (i)))
-                    except Exception:
-                        break
-                else:
-                    try:
-                        self.AnimatedFrames.append(tk.PhotoImage(data=source, format='gif -index %i' % (i)))
-                    except Exception:
-                        break
-            self.TotalAnimatedFrames = len(self.AnimatedFrames)
+            # AnimatedFrames is the (shared) lazily decoded animation
+            self.AnimatedFrames = _AnimatedGif.get(source, max_cached_frames)
+            self.TotalAnimatedFrames = self.AnimatedFrames.frame_count or 0
             self.LastFrameTime = time.time()
             self.CurrentFrameNumber = -1  # start at -1 because it is incremented before every frame is shown
+        animation = self.AnimatedFrames
         # show the frame
 
         now = time.time()
 
-        if time_between_frames:
-            if (now - self.LastFrameTime) * 1000 > time_between_frames:
-                self.LastFrameTime = now
-                self.CurrentFrameNumber = (self.CurrentFrameNumber + 1) % self.TotalAnimatedFrames
+        if time_between_frames is None:
+            delay = animation.delay(self.CurrentFrameNumber) if self.CurrentFrameNumber >= 0 else 0
+        else:
+            delay = time_between_frames
+        if delay:
+            if (now - self.LastFrameTime) * 1000 > delay:
+                if time_between_frames is None and now - self.LastFrameTime < 2 * delay / 1000:
+                    self.LastFrameTime += delay / 1000  # keep to the GIF's own schedule rather than drifting by how late this call was
+                else:
+                    self.LastFrameTime = now
             else:  # don't reshow the frame again if not time for new frame
                 return
-        else:
-            self.CurrentFrameNumber = (self.CurrentFrameNumber + 1) % self.TotalAnimatedFrames
-        image = self.AnimatedFrames[self.CurrentFrameNumber]
+        self.CurrentFrameNumber, image = animation.frame(animation.next_frame_number(self.CurrentFrameNumber))
+        self.TotalAnimatedFrames = animation.frame_count or 0
+        if image is None:
+            return
         try:  # needed in case the window was closed with an "X"
             self.tktext_label.configure(image=image, width=image.width(), heigh=image.height())
+            self.tktext_label.image = image
+            self.tktext_label.after_idle(animation.prefetch, animation.next_frame_number(self.CurrentFrameNumber))
         except Exception as e:
             print('Exception in update_animation', e)
 
@@ -273,47 +338,14 @@ class Image(Element):
         Show an Animated GIF. Call the function as often as you like. The function will determine when to show the next frame and will automatically advance to the next frame at the right time.
         NOTE - does NOT perform a sleep call to delay
 
+        Only the frame being shown (and the next one) are kept in memory.
+
         :param source:              Filename or Base64 encoded string containing Animated GIF
         :type source:               str | bytes
-        :param time_between_frames: Number of milliseconds to wait between showing frames
-        :type time_between_frames:  (int)
+        :param time_between_frames: Number of milliseconds to wait between showing frames. None uses the timing stored in the GIF for each frame
+        :type time_between_frames:  (int | None)
         """
-
-        if self.Source != source:
-            self.AnimatedFrames = None
-            self.Source = source
-            self.frame_num = 0
-
-        now = time.time()
-
-        if time_between_frames:
-            if (now - self.LastFrameTime) * 1000 > time_between_frames:
-                self.LastFrameTime = now
-            else:  # don't reshow the frame again if not time for new frame
-                return
-
-        # read a frame
-        while True:
-            if type(source) is not bytes:
-                try:
-                    self.image = tk.PhotoImage(file=source, format='gif -index %i' % (self.frame_num))
-                    self.frame_num += 1
-                except:
-                    self.frame_num = 0
-            else:
-                try:
-                    self.image = tk.PhotoImage(data=source, format='gif -index %i' % (self.frame_num))
-                    self.frame_num += 1
-                except:
-                    self.frame_num = 0
-            if self.frame_num:
-                break
-
-        try:  # needed in case the window was closed with an "X"
-            self.tktext_label.configure(image=self.image, width=self.image.width(), heigh=self.image.height())
-
-        except:
-            pass
+        self.update_animation(source, time_between_frames=time_between_frames, max_cached_frames=1)
 
     Update = update
     UpdateAnimation = update_animation
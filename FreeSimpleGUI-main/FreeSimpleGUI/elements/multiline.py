@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import collections
 import sys
+import threading
+import time
 import tkinter as tk
 
 import FreeSimpleGUI
@@ -66,6 +69,12 @@ class Multiline(Element):
         rstrip=True,
         right_click_menu=None,
         visible=True,
+        buffered=False,
+        flush_interval=50,
+        max_lines=None,
+        max_chars=None,
+        trim_chunk=None,
+        scrollback_file=None,
         metadata=None,
     ):
         """
@@ -159,6 +168,18 @@ class Multiline(Element):
         :type right_click_menu:              List[List[ List[str] | str ]]
         :param visible:                      set visibility state of the element
         :type visible:                       (bool)
+        :param buffered:                     If True, print, cprint and rerouted stdout/stderr are collected and added to the element at most once every flush_interval milliseconds instead of on every call. Safe to print from threads
+        :type buffered:                      (bool)
+        :param flush_interval:               Milliseconds between adding buffered output to the element
+        :type flush_interval:                (int)
+        :param max_lines:                    If set, lines are removed from the top so the element never holds more than this many lines
+        :type max_lines:                     (int | None)
+        :param max_chars:                    If set, text is removed from the top so the element never holds much more than this many characters. Checked every trim_chunk characters
+        :type max_chars:                     (int | None)
+        :param trim_chunk:                   How many lines/characters beyond max_lines/max_chars are removed at a time so that removing isn't done on every print. Default is 1/10th of the limit
+        :type trim_chunk:                    (int | None)
+        :param scrollback_file:              Filename that text removed because of max_lines or max_chars is appended to. Use get(include_scrollback=True) to get it back along with the element's contents
+        :type scrollback_file:               (str | None)
         :param metadata:                     User metadata that can be set to ANYTHING
         :type metadata:                      (Any)
         """
@@ -198,6 +219,15 @@ class Multiline(Element):
         self.no_scrollbar = no_scrollbar
         self.hscrollbar = None  # The horizontal scrollbar
         self.auto_scroll_only_at_bottom = autoscroll_only_at_bottom
+        self.buffered = buffered
+        self.flush_interval = flush_interval
+        self.max_lines = max_lines
+        self.max_chars = max_chars
+        self.trim_chunk = trim_chunk
+        self.scrollback_file = scrollback_file
+        self._chars_since_check = 0
+        self._output_buffer = collections.deque()  # (text, text_color, background_color, font, justification, autoscroll)
+        self._last_flush_time = 0
         sz = size if size != (None, None) else s
 
         super().__init__(
@@ -296,19 +326,11 @@ class Multiline(Element):
         tag = None
         if value is not None:
             value = str(value)
-            if background_color_for_value is not None or text_color_for_value is not None or font_for_value is not None:
-                try:
-                    tag = 'Multiline(' + str(text_color_for_value) + ',' + str(background_color_for_value) + ',' + str(font_for_value) + ')'
-                    if tag not in self.tags:
-                        self.tags.add(tag)
-                    if background_color_for_value is not None:
-                        self.TKText.tag_configure(tag, background=background_color_for_value)
-                    if text_color_for_value is not None:
-                        self.TKText.tag_configure(tag, foreground=text_color_for_value)
-                    if font_for_value is not None:
-                        self.TKText.tag_configure(tag, font=font_for_value)
-                except Exception as e:
-                    print('* Multiline.update - bad color likely specified:', e)
+            if append:
+                self._flush_output_buffer()  # keep anything buffered ahead of this value
+            else:
+                self._output_buffer.clear()
+            tag = self._value_tag(text_color_for_value, background_color_for_value, font_for_value)
             if self.Disabled:
                 self.TKText.configure(state='normal')
             try:
@@ -318,6 +340,7 @@ class Multiline(Element):
                     self.TKText.insert(tk.END, value, (just_tag, tag))
                 else:
                     self.TKText.insert(tk.END, value)
+                self._trim_scrollback(len(value))
             except Exception as e:
                 print('* Error setting multiline *', e)
             if self.Disabled:
@@ -353,14 +376,185 @@ class Multiline(Element):
         if visible is not None:
             self._visible = visible
 
-    def get(self):
+    def _value_tag(self, text_color, background_color, font):
+        """
+        Not user callable.  Returns the name of the tag used for text with these colors and font, configuring it
+        in the widget.
+
+        :return: The tag name or None if text_color, background_color and font are all None
+        :rtype:  (str | None)
+        """
+        if background_color is None and text_color is None and font is None:
+            return None
+        tag = 'Multiline(' + str(text_color) + ',' + str(background_color) + ',' + str(font) + ')'
+        if tag not in self.tags:
+            try:
+                if background_color is not None:
+                    self.TKText.tag_configure(tag, background=background_color)
+                if text_color is not None:
+                    self.TKText.tag_configure(tag, foreground=text_color)
+                if font is not None:
+                    self.TKText.tag_configure(tag, font=font)
+                self.tags.add(tag)
+            except Exception as e:
+                print('* Multiline.update - bad color likely specified:', e)
+        return tag
+
+    def _trim_scrollback(self, added):
+        """
+        Not user callable.  Keeps the widget within max_lines and max_chars.  To keep the cost of each insert low,
+        nothing is removed until a limit is passed and then trim_chunk more lines/characters than needed are
+        removed in a single delete.  The character count is only checked after trim_chunk characters were added.
+        Removed text is appended to scrollback_file if there is one.  The widget must be in the normal state.
+
+        :param added: Number of characters that were just inserted
+        :type added:  (int)
+        """
+        if not self.max_lines and not self.max_chars:
+            return
+        text = self.TKText
+        cut = None  # index of the first character to keep
+        if self.max_lines:
+            line, column = text.index('end-1c').split('.')
+            lines = int(line) if column != '0' else int(line) - 1
+            if lines > self.max_lines:
+                cut = f'{lines - self.max_lines + self._trim_chunk(self.max_lines) + 1}.0'
+        if self.max_chars:
+            self._chars_since_check += added
+            if self._chars_since_check >= self._trim_chunk(self.max_chars):
+                self._chars_since_check = 0
+                chars = int(text.tk.call(text._w, 'count', '-chars', '1.0', 'end-1c'))
+                if chars > self.max_chars:
+                    char_cut = text.index(f'1.0 + {chars - self.max_chars + self._trim_chunk(self.max_chars)} chars')
+                    if cut is None or text.compare(char_cut, '>', cut):
+                        cut = char_cut
+        if cut is None:
+            return
+        if self.scrollback_file:
+            self._append_to_scrollback_file(text.get('1.0', cut))
+        text.delete('1.0', cut)
+
+    def _append_to_scrollback_file(self, removed):
+        """
+        Not user callable.  Appends text removed because of max_lines or max_chars to scrollback_file
+
+        :param removed: The text that was removed
+        :type removed:  (str)
+        """
+        try:
+            with open(self.scrollback_file, 'a', encoding='utf-8') as f:
+                f.write(removed)
+        except Exception as e:
+            print('* Multiline - unable to write to the scrollback file *', e)
+
+    def _trim_chunk(self, limit):
+        return self.trim_chunk if self.trim_chunk is not None else max(1, limit // 10)
+
+    def _buffer_output(self, text, text_color=None, background_color=None, font=None, justification=None, autoscroll=None):
+        """
+        Not user callable.  Adds text to the output buffer.  Can be called from any thread.
+        The buffer is emptied into the widget every flush_interval milliseconds while the window is being read.
+        If auto_refresh is set and this is the main thread, it's also emptied (and the window refreshed) here,
+        but no more often than every flush_interval milliseconds.
+        """
+        self._output_buffer.append((text, text_color, background_color, font, justification, autoscroll))
+        if self.AutoRefresh and threading.current_thread() is threading.main_thread():
+            if (time.monotonic() - self._last_flush_time) * 1000 >= self.flush_interval:
+                self._flush_output_buffer()
+                try:  # in case the window was destroyed
+                    self.ParentForm.refresh()
+                except:
+                    pass
+
+    def _flush_output_buffer(self):
+        """
+        Not user callable.  Must be called from the main thread.
+        Adds everything in the output buffer to the widget with a single insert.  Neighboring pieces of text with
+        the same colors, font and justification are joined together.
+        """
+        buffer = self._output_buffer
+        if not buffer or not self._widget_was_created():
+            return
+        segments = []
+        dropped = None  # text that's skipped because of max_lines but still belongs in the scrollback file
+        while True:
+            try:
+                segments.append(buffer.popleft())
+            except IndexError:
+                break
+        if self.max_lines:  # no point adding lines that would be trimmed right away
+            start, lines = len(segments), 0
+            while start > 0 and lines <= self.max_lines:
+                start -= 1
+                lines += segments[start][0].count('\n')
+            if start and self.scrollback_file:
+                dropped = ''.join(segment[0] for segment in segments[:start])
+            segments = segments[start:]
+
+        insert_args = []
+        for text, text_color, background_color, font, justification, autoscroll in segments:
+            if justification is not None:
+                just_tag = 'left' if justification.startswith('l') else 'right' if justification.startswith('r') else 'center' if justification.startswith('c') else None
+            else:
+                just_tag = self.justification_tag
+            tags = tuple(tag for tag in (just_tag, self._value_tag(text_color, background_color, font)) if tag is not None)
+            if insert_args and insert_args[-1] == tags:
+                insert_args[-2].append(text)
+            else:
+                insert_args += [[text], tags]
+            if autoscroll is not None:
+                self.Autoscroll = autoscroll
+        for i in range(0, len(insert_args), 2):
+            insert_args[i] = ''.join(insert_args[i])
+
+        try:
+            current_scroll_position = self.TKText.yview()[1]
+            if self.Disabled:
+                self.TKText.configure(state='normal')
+            if dropped is not None:  # the widget's text would be trimmed too, so it goes to the file first to keep the order
+                self._append_to_scrollback_file(self.TKText.get('1.0', 'end-1c') + dropped)
+                self.TKText.delete('1.0', tk.END)
+            self.TKText.insert(tk.END, *insert_args)
+            self._trim_scrollback(sum(len(insert_args[i]) for i in range(0, len(insert_args), 2)))
+            if self.Disabled:
+                self.TKText.configure(state='disabled')
+            if self.Autoscroll:
+                if not self.auto_scroll_only_at_bottom or current_scroll_position == 1.0:
+                    self.TKText.see(tk.END)
+        except Exception as e:
+            print('* Error setting multiline *', e)
+        self._last_flush_time = time.monotonic()
+
+    def _flush_output_buffer_periodically(self):
+        """
+        Not user callable.  Started when the widget is created for buffered Multilines.  Empties the output
+        buffer every flush_interval milliseconds until the window is closed.
+        """
+        if self._this_elements_window_closed():
+            return
+        try:
+            self._flush_output_buffer()
+            self.TKText.after(self.flush_interval, self._flush_output_buffer_periodically)
+        except tk.TclError:  # widget was destroyed
+            pass
+
+    def get(self, include_scrollback=False):
         """
         Return current contents of the Multiline Element
 
-        :return: current contents of the Multiline Element (used as an input type of Multiline
-        :rtype:  (str)
+        :param include_scrollback: If True, the text that was removed and saved to scrollback_file is put in front of the current contents
+        :type include_scrollback:  (bool)
+        :return:                   current contents of the Multiline Element (used as an input type of Multiline
+        :rtype:                    (str)
         """
+        self._flush_output_buffer()
         value = str(self.TKText.get(1.0, tk.END))
+        if include_scrollback and self.scrollback_file:
+            try:
+                with open(self.scrollback_file, encoding='utf-8') as f:
+                    value = f.read() + value
+            except FileNotFoundError:  # nothing has been removed yet
+                pass
         if self.rstrip:
             return value.rstrip()
         return value
@@ -490,7 +684,10 @@ class Multiline(Element):
         :type txt:  (str)
         """
         try:
-            self.update(txt, append=True)
+            if self.buffered:
+                self._buffer_output(txt)
+            else:
+                self.update(txt, append=True)
             # if need to echo, then send the same text to the destinatoin that isn't thesame as this one
             if self.echo_stdout_stderr:
                 if sys.stdout != self:
@@ -503,12 +700,15 @@ class Multiline(Element):
     def flush(self):
         """
         Flush parameter was passed into a print statement.
-        For now doing nothing.  Not sure what action should be taken to ensure a flush happens regardless.
+        For buffered Multilines, anything waiting in the buffer is added to the element now if called from the
+        main thread.  Otherwise does nothing.
         """
         # try:
         #     self.previous_stdout.flush()
         # except:
         #     pass
+        if self.buffered and threading.current_thread() is threading.main_thread():
+            self._flush_output_buffer()
         return
 
     def set_ibeam_color(self, ibeam_color=None):
@@ -593,6 +793,12 @@ class Output(Multiline):
         sbar_arrow_width=None,
         sbar_frame_color=None,
         sbar_relief=None,
+        buffered=False,
+        flush_interval=50,
+        max_lines=None,
+        max_chars=None,
+        trim_chunk=None,
+        scrollback_file=None,
     ):
         """
         :param size:                        (w, h) w=characters-wide, h=rows-high. If an int instead of a tuple is supplied, then height is auto-set to 1
@@ -647,6 +853,18 @@ class Output(Multiline):
         :type sbar_frame_color:             (str)
         :param sbar_relief:                 Scrollbar relief that will be used for the "thumb" of the scrollbar (the thing you grab that slides). Should be a constant that is defined at starting with "RELIEF_" - RELIEF_RAISED, RELIEF_SUNKEN, RELIEF_FLAT, RELIEF_RIDGE, RELIEF_GROOVE, RELIEF_SOLID
         :type sbar_relief:                  (str)
+        :param buffered:                    If True, output is collected and added to the element at most once every flush_interval milliseconds instead of on every print. Safe to print from threads
+        :type buffered:                     (bool)
+        :param flush_interval:              Milliseconds between adding buffered output to the element
+        :type flush_interval:               (int)
+        :param max_lines:                   If set, lines are removed from the top so the element never holds more than this many lines
+        :type max_lines:                    (int | None)
+        :param max_chars:                   If set, text is removed from the top so the element never holds much more than this many characters. Checked every trim_chunk characters
+        :type max_chars:                    (int | None)
+        :param trim_chunk:                  How many lines/characters beyond max_lines/max_chars are removed at a time so that removing isn't done on every print. Default is 1/10th of the limit
+        :type trim_chunk:                   (int | None)
+        :param scrollback_file:             Filename that text removed because of max_lines or max_chars is appended to. Use get(include_scrollback=True) to get it back along with the element's contents
+        :type scrollback_file:              (str | None)
         """
 
         super().__init__(
@@ -682,4 +900,10 @@ class Output(Multiline):
             sbar_arrow_width=sbar_arrow_width,
             sbar_frame_color=sbar_frame_color,
             sbar_relief=sbar_relief,
+            buffered=buffered,
+            flush_interval=flush_interval,
+            max_lines=max_lines,
+            max_chars=max_chars,
+            trim_chunk=trim_chunk,
+            scrollback_file=scrollback_file,
         )
@@ -16,6 +16,7 @@ from FreeSimpleGUI import PackFormIntoFrame
 from FreeSimpleGUI import popup_error
 from FreeSimpleGUI import popup_error_with_traceback
 from FreeSimpleGUI import ToolTip
+from FreeSimpleGUI._image_cache import _cached_photo_image
 from FreeSimpleGUI._utils import _error_popup_with_traceback
 from FreeSimpleGUI.window import Window
 
@@ -604,10 +605,10 @@ class TabGroup(Element):
         """
 
         self.add_row(tab_element)
+        self.ParentForm._invalidate_results_engine()
         tab_element.TKFrame = tab_element.Widget = tk.Frame(self.TKNotebook)
         form = self.ParentForm
-        form._BuildKeyDictForWindow(form, tab_element, form.AllKeysDict)
-        form.AllKeysDict[tab_element.Key] = tab_element
+        form._element_index.add(tab_element, self)
         # Pack the tab's layout into the tab. NOTE - This does NOT pack the Tab itself... for that see below...
         PackFormIntoFrame(tab_element, tab_element.TKFrame, self.ParentForm)
 
@@ -616,15 +617,11 @@ class TabGroup(Element):
         # ------------------- start of imagey-stuff -------------------
         try:
             if tab_element.Filename is not None:
-                photo = tk.PhotoImage(file=tab_element.Filename)
+                photo = _cached_photo_image(filename=tab_element.Filename, subsample=tab_element.ImageSubsample)
             elif tab_element.Data is not None:
-                photo = tk.PhotoImage(data=tab_element.Data)
+                photo = _cached_photo_image(data=tab_element.Data, subsample=tab_element.ImageSubsample)
             else:
                 photo = None
-
-            if tab_element.ImageSubsample and photo is not None:
-                photo = photo.subsample(tab_element.ImageSubsample)
-                # print('*ERROR laying out form.... Image Element has no image specified*')
         except Exception as e:
             photo = None
             _error_popup_with_traceback(
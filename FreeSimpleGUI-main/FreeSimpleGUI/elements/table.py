@@ -17,6 +17,55 @@ from FreeSimpleGUI._utils import _error_popup_with_traceback
 from FreeSimpleGUI._utils import _exit_mainloop
 
 
+def _longest_increasing_run(sequence):
+    """
+    Returns the values making up a longest strictly increasing subsequence of sequence
+
+    :param sequence: The numbers to search
+    :type sequence:  List[int]
+    :return:         The values that are part of the subsequence
+    :rtype:          Set[int]
+    """
+    tails = []  # index into sequence of the smallest tail of an increasing run of each length
+    previous = [-1] * len(sequence)
+    for i, value in enumerate(sequence):
+        low, high = 0, len(tails)
+        while low < high:
+            mid = (low + high) // 2
+            if sequence[tails[mid]] < value:
+                low = mid + 1
+            else:
+                high = mid
+        if low:
+            previous[i] = tails[low - 1]
+        if low == len(tails):
+            tails.append(i)
+        else:
+            tails[low] = i
+    result = set()
+    i = tails[-1] if tails else -1
+    while i != -1:
+        result.add(sequence[i])
+        i = previous[i]
+    return result
+
+
+def _sort_key(value):
+    """
+    Sort key that lets a column mixing numbers, numeric text and other text sort without errors.
+    Numbers (and text that looks like a number) come first in numeric order, then text ignoring case, then None.
+    """
+    if isinstance(value, (int, float)):
+        return 0, value, ''
+    if value is None:
+        return 2, 0, ''
+    text = str(value)
+    try:
+        return 0, float(text.replace(',', '')), ''
+    except ValueError:
+        return 1, 0, text.casefold()
+
+
 class Table(Element):
     def __init__(
         self,
@@ -71,6 +120,11 @@ class Table(Element):
         expand_x=False,
         expand_y=False,
         visible=True,
+        enable_sorting=False,
+        virtual=False,
+        virtual_overscan=20,
+        row_callback=None,
+        row_count=None,
         metadata=None,
     ):
         """
@@ -174,6 +228,16 @@ class Table(Element):
         :type expand_y:                 (bool)
         :param visible:                 set visibility state of the element
         :type visible:                  (bool)
+        :param enable_sorting:          If True, clicking a column heading sorts the table by that column. Clicking again reverses the order
+        :type enable_sorting:           (bool)
+        :param virtual:                 If True, only the rows that can be seen (plus virtual_overscan rows above and below) are put into the tkinter Treeview. Use for very large tables. values can then be any sequence that supports len() and indexing
+        :type virtual:                  (bool)
+        :param virtual_overscan:        Number of rows above and below the visible rows that are kept in the Treeview when virtual is True
+        :type virtual_overscan:         (int)
+        :param row_callback:            Instead of values, a function that is called with a row number and returns that row. Requires row_count. Turns on virtual mode
+        :type row_callback:             Callable[[int], List[str | int | float]] | None
+        :param row_count:               The number of rows available from row_callback
+        :type row_count:                (int | None)
         :param metadata:                User metadata that can be set to ANYTHING
         :type metadata:                 (Any)
         """
@@ -227,6 +291,32 @@ class Table(Element):
         self.RightClickMenu = right_click_menu
         self.RowColors = row_colors
         self.tree_ids = []  # ids returned when inserting items into table - will use to delete colors
+        self._iid_rows = None  # iid -> row number. None while row N has the iid N+1 (always, unless rows were matched by row_id_column)
+        self._iid_counter = 0  # the next iid to use for a row inserted by a keyed diff update
+        self._shown_rows = None  # snapshot of the rows shown, taken by diff updates
+        self._tags_stale = False  # True if rows were moved without updating their row number tags
+        self.last_update_operations = 0  # number of Treeview operations the last update of values performed
+        self._shown_view = None  # the view_rows that are shown in the Treeview, None if Values is shown in order
+        self.enable_sorting = enable_sorting
+        self.view_rows = None  # row number in Values of each row shown, None when not sorted or filtered
+        self.sort_column = None
+        self.sort_descending = False
+        self.filter_text = ''
+        self.filter_columns = None
+        self._sort_cache = {}  # column -> rows of Values in ascending order for that column
+        self._filter_cache = None  # (text, columns, matching rows) of the last filter, used to narrow the next one
+        self._filter_strings = {}  # columns -> lower case text of those columns for every row
+        self._heading_ids = []  # Treeview column ids of the data columns, filled in when the Treeview is made
+        self.Virtual = virtual or row_callback is not None
+        self.VirtualOverscan = virtual_overscan
+        self.RowCallback = row_callback
+        self.RowCount = row_count
+        self._virtual_range = (0, 0)  # rows [first, last) that are currently in the Treeview
+        self._virtual_top = 0  # row shown at the top of the table
+        self._virtual_visible = None  # number of rows that fit in the table, learned from the Treeview
+        self._virtual_render_pending = False
+        self._virtual_resync = False  # True when the Treeview's selection was changed by re-windowing, not the user
+        self._virtual_extend_selection = False  # True if the last click had shift or control held
         key = key if key is not None else k
         sz = size if size != (None, None) else s
         pad = pad if pad is not None else p
@@ -254,7 +344,7 @@ class Table(Element):
         )
         return
 
-    def update(self, values=None, num_rows=None, visible=None, select_rows=None, alternating_row_color=None, row_colors=None):
+    def update(self, values=None, num_rows=None, visible=None, select_rows=None, alternating_row_color=None, row_colors=None, row_count=None, diff=False, row_id_column=None):
         """
         Changes some of the settings for the Table Element. Must call `Window.Read` or `Window.Finalize` prior
 
@@ -276,6 +366,12 @@ class Table(Element):
         :type alternating_row_color:  (str)
         :param row_colors:            list of tuples of (row, background color) OR (row, foreground color, background color). Changes the colors of listed rows to the color(s) provided (note the optional foreground color)
         :type row_colors:             List[Tuple[int, str] | Tuple[Int, str, str]]
+        :param row_count:             Virtual tables only. The new number of rows available from row_callback. Also causes the visible rows to be fetched again
+        :type row_count:              (int)
+        :param diff:                  If True, values is compared to what is shown and only the rows that changed are updated. Selection and scroll position are kept. Pass a new list rather than changing the old one in place
+        :type diff:                   (bool)
+        :param row_id_column:         Column that uniquely identifies a row. Rows are then matched by this column so rows that moved are moved rather than rewritten. Implies diff=True
+        :type row_id_column:          (int | None)
         """
         if not self._widget_was_created():  # if widget hasn't been created yet, then don't allow
             return
@@ -284,8 +380,28 @@ class Table(Element):
             _error_popup_with_traceback('Error in Table.update - The window was closed')
             return
 
-        if values is not None:
+        if values is not None or row_count is not None:
+            self._invalidate_view_caches()
+
+        if self.Virtual:
+            self._virtual_update(values, num_rows, visible, select_rows, alternating_row_color, row_colors, row_count)
+            return
+
+        alternating_rows = None  # rows that need their alternating color set. None means all of them
+        if values is not None and self.view_rows is not None:  # sorted or filtered, so show the new values the same way
+            old_count = len(self.tree_ids)
+            self.Values = values
+            self.last_update_operations = self._apply_view()
+            alternating_rows = range(old_count + old_count % 2, len(self.tree_ids), 2)
+        elif values is not None and (diff or row_id_column is not None):
+            old_count = len(self.tree_ids)
+            self.last_update_operations = self._diff_update(values, row_id_column)
+            self.Values = values
+            alternating_rows = range(old_count + old_count % 2, len(values), 2)
+        elif values is not None:
+            ops = 0
             for id in self.tree_ids:
+                ops += 3
                 self.TKTreeview.item(id, tags=())
                 if self.BackgroundColor is not None and self.BackgroundColor != COLOR_SYSTEM_DEFAULT:
                     self.TKTreeview.tag_configure(id, background=self.BackgroundColor)
@@ -300,6 +416,7 @@ class Table(Element):
             for i in children:
                 self.TKTreeview.detach(i)
                 self.TKTreeview.delete(i)
+                ops += 2
             children = self.TKTreeview.get_children()
 
             self.tree_ids = []
@@ -312,8 +429,14 @@ class Table(Element):
                 else:
                     self.TKTreeview.tag_configure(id, background='#FFFFFF')
                 self.tree_ids.append(id)
+                ops += 2
             self.Values = values
             self.SelectedRows = []
+            self._iid_rows = None
+            self._shown_rows = None
+            self._shown_view = None
+            self._tags_stale = False
+            self.last_update_operations = ops
         if visible is False:
             self._pack_forget_save_settings(self.element_frame)
         elif visible is True:
@@ -322,14 +445,20 @@ class Table(Element):
         if num_rows is not None:
             self.TKTreeview.config(height=num_rows)
         if select_rows is not None:
-            rows_to_select = [i + 1 for i in select_rows]
+            rows_to_select = [self.tree_ids[i] for i in select_rows if 0 <= i < len(self.tree_ids)]
             self.TKTreeview.selection_set(rows_to_select)
 
+        if (alternating_row_color is not None or row_colors is not None) and self._tags_stale:
+            for row, iid in enumerate(self.tree_ids):
+                self.TKTreeview.item(iid, tags=(row,))
+            self._tags_stale = False
+
         if alternating_row_color is not None:  # alternating colors
             self.AlternatingRowColor = alternating_row_color
+            alternating_rows = None
 
         if self.AlternatingRowColor is not None:
-            for row in range(0, len(self.Values), 2):
+            for row in alternating_rows if alternating_rows is not None else range(0, len(self.tree_ids), 2):
                 self.TKTreeview.tag_configure(row, background=self.AlternatingRowColor)
         if row_colors is not None:  # individual row colors
             self.RowColors = row_colors
@@ -351,7 +480,11 @@ class Table(Element):
         """
         # print('**-- in treeview selected --**')
         selections = self.TKTreeview.selection()
-        self.SelectedRows = [int(x) - 1 for x in selections]
+        if self.Virtual:
+            if not self._virtual_selection_changed(selections):
+                return
+        else:
+            self.SelectedRows = [self._row_from_iid(x) for x in selections]
         if self.ChangeSubmits:
             if self.Key is not None:
                 self.ParentForm.LastButtonClicked = self.Key
@@ -369,7 +502,10 @@ class Table(Element):
         :type event:  (unknown)
         """
         selections = self.TKTreeview.selection()
-        self.SelectedRows = [int(x) - 1 for x in selections]
+        if self.Virtual:  # the Treeview only has the loaded rows. Keep the ones selected outside of them
+            self._virtual_selection_changed(selections)
+        else:
+            self.SelectedRows = [self._row_from_iid(x) for x in selections]
         if self.BindReturnKey:  # Signifies BOTH a return key AND a double click
             if self.Key is not None:
                 self.ParentForm.LastButtonClicked = self.Key
@@ -394,7 +530,7 @@ class Table(Element):
             if region == 'heading':
                 row = -1
             elif region == 'cell':
-                row = int(self.Widget.identify_row(event.y)) - 1
+                row = self._row_from_iid(self.Widget.identify_row(event.y))
             elif region == 'separator':
                 row = None
             else:
@@ -425,10 +561,13 @@ class Table(Element):
         if self.right_click_selects and len(selections) <= 1:
             if (event.num == 3 and not running_mac()) or (event.num == 2 and running_mac()):
                 if row != -1 and row is not None:
-                    selections = [row + 1]
+                    selections = [self.tree_ids[row]] if not self.Virtual else [row + 1]
                     self.TKTreeview.selection_set(selections)
         # print(selections)
-        self.SelectedRows = [int(x) - 1 for x in selections]
+        if self.Virtual:  # the Treeview only has the loaded rows. Keep the ones selected outside of them
+            self._virtual_selection_changed(selections)
+        else:
+            self.SelectedRows = [self._row_from_iid(x) for x in selections]
         # print('The new selected rows = ', self.SelectedRows, 'selections =', selections)
         if self.enable_click_events is True:
             if self.Key is not None:
@@ -446,10 +585,530 @@ class Table(Element):
         :rtype:  List[int]
         """
 
+        if self.Virtual:
+            return list(self.SelectedRows)
         selections = self.TKTreeview.selection()
-        selected_rows = [int(x) - 1 for x in selections]
+        selected_rows = [self._row_from_iid(x) for x in selections]
         return selected_rows
 
+    def _row_from_iid(self, iid):
+        """
+        Not user callable. Converts a Treeview item id into the row number in values
+        """
+        if self._iid_rows is None:
+            return int(iid) - 1
+        return self._iid_rows[str(iid)]
+
+    def _display_value(self, row, value):
+        if self.DisplayRowNumbers:
+            return [row + self.StartingRowNumber] + list(value)
+        return value
+
+    def _diff_update(self, values, row_id_column, source_rows=None):
+        """
+        Not user callable. Updates the Treeview to show values touching only the rows that changed.
+        Rows are compared by position, matched by the row_id_column if one is given, or matched by their
+        row number in self.Values when showing a sorted / filtered view.
+
+        :param values:        The new table
+        :type values:         List[List[str | int | float]]
+        :param row_id_column: Column that uniquely identifies each row or None to compare rows by position
+        :type row_id_column:  (int | None)
+        :param source_rows:   For each row of values, its row number in self.Values
+        :type source_rows:    List[int] | None
+        :return:              Number of Treeview operations performed
+        :rtype:               (int)
+        """
+        treeview = self.TKTreeview
+        old_rows = self._shown_rows if self._shown_rows is not None else [tuple(row) for row in self.Values]
+        new_rows = [tuple(row) for row in values]
+        if source_rows is not None:
+            new_keys = source_rows
+            old_keys = self._shown_view if self._shown_view is not None else range(len(self.tree_ids))
+        elif row_id_column is not None:
+            new_keys = [row[row_id_column] for row in new_rows]
+            old_keys = [row[row_id_column] for row in old_rows]
+            if len(set(new_keys)) != len(new_keys):
+                warnings.warn(f'Table {self.Key} - row_id_column {row_id_column} has duplicate values. Rows compared by position instead', UserWarning)
+                row_id_column = None
+        selected_before = treeview.selection()
+        scroll_before = treeview.yview()[0]
+        ops = 0
+
+        if row_id_column is None and source_rows is None:
+            for row in range(min(len(old_rows), len(new_rows))):
+                if old_rows[row] != new_rows[row]:
+                    treeview.item(self.tree_ids[row], values=self._display_value(row, values[row]))
+                    ops += 1
+            if len(new_rows) < len(old_rows):
+                treeview.delete(*self.tree_ids[len(new_rows) :])
+                if self._iid_rows is not None:
+                    for iid in self.tree_ids[len(new_rows) :]:
+                        del self._iid_rows[iid]
+                del self.tree_ids[len(new_rows) :]
+                ops += 1
+            for row in range(len(old_rows), len(new_rows)):
+                if self._iid_rows is None:
+                    iid = str(row + 1)
+                else:
+                    iid = str(self._iid_counter)
+                    self._iid_counter += 1
+                    self._iid_rows[iid] = row
+                value = self._display_value(row, values[row])
+                treeview.insert('', 'end', text=value, iid=iid, values=value, tags=(row,))
+                self.tree_ids.append(iid)
+                ops += 1
+        else:
+            if self._iid_rows is None:
+                self._iid_counter = len(self.tree_ids) + 1
+            retag = self.AlternatingRowColor is not None or self.RowColors is not None  # tags are only used for row colors
+            old_position = {iid: row for row, iid in enumerate(self.tree_ids)}
+            iid_for_key = {key: iid for key, iid in zip(old_keys, self.tree_ids)}
+            desired = [iid_for_key.get(key) for key in new_keys]
+            kept = set(iid for iid in desired if iid is not None)
+            doomed = [iid for iid in self.tree_ids if iid not in kept]
+            if doomed:
+                treeview.delete(*doomed)
+                ops += 1
+            # Items that are in increasing order already stay put, every other kept item gets moved
+            staying = _longest_increasing_run([old_position[iid] for iid in desired if iid is not None])
+            moving = [iid for iid in desired if iid is not None and old_position[iid] not in staying]
+            if moving:
+                treeview.detach(*moving)
+                ops += 1
+            moving = set(moving)
+            # With the moving items detached, the rows placed so far are exactly the first rows in the Treeview
+            tree_ids = []
+            for row, iid in enumerate(desired):
+                value = None
+                if iid is None:
+                    iid = str(self._iid_counter)
+                    self._iid_counter += 1
+                    value = self._display_value(row, values[row])
+                    treeview.insert('', row, text=value, iid=iid, values=value, tags=(row,))
+                    ops += 1
+                else:
+                    if iid in moving:
+                        treeview.move(iid, '', row)
+                        ops += 1
+                    old_row = old_position[iid]
+                    changes = {}
+                    if old_rows[old_row] != new_rows[row] or (self.DisplayRowNumbers and old_row != row):
+                        changes['values'] = self._display_value(row, values[row])
+                    if old_row != row:
+                        if retag:
+                            changes['tags'] = (row,)
+                        else:
+                            self._tags_stale = True
+                    if changes:
+                        treeview.item(iid, **changes)
+                        ops += 1
+                tree_ids.append(iid)
+            self.tree_ids = tree_ids
+            self._iid_rows = {iid: row for row, iid in enumerate(tree_ids)}
+
+        self._shown_rows = new_rows
+        self._shown_view = source_rows
+        selected = [iid for iid in selected_before if iid in self._iid_rows] if self._iid_rows is not None else [iid for iid in selected_before if int(iid) <= len(self.tree_ids)]
+        if tuple(treeview.selection()) != tuple(selected):
+            treeview.selection_set(selected)
+            ops += 1
+        self.SelectedRows = [self._row_from_iid(iid) for iid in selected]
+        if treeview.yview()[0] != scroll_before:
+            treeview.yview_moveto(scroll_before)
+            ops += 1
+        return ops
+
+    # -------------------------  Sorting and filtering  ------------------------- #
+    # The rows shown are described by view_rows, a list of row numbers into Values. Each column's sort order is
+    # computed once and cached until the values change. Filtering narrows the previous matches when the new text
+    # extends the old text. Normal tables are brought up to date with a diff keyed by row number in Values so rows
+    # are moved, not rebuilt. Virtual tables just reload the visible rows.
+
+    def sort(self, column, descending=False):
+        """
+        Sorts the rows shown by a column. Numbers, and text that looks like a number, sort numerically and
+        before other text. Text is sorted without regard to case. Values itself is not changed.
+        Rows returned in the values dictionary are positions in the sorted table. Use view_rows or
+        get_source_rows to get back to rows in Values.
+
+        :param column:     The column to sort by (0 is the first column of values). None removes the sort
+        :type column:      (int | None)
+        :param descending: If True sorts largest to smallest
+        :type descending:  (bool)
+        """
+        self.sort_column = column
+        self.sort_descending = descending
+        self._show_view()
+
+    def filter(self, text, columns=None):
+        """
+        Only shows rows where text appears (ignoring case) in one of the columns.  Typing more characters only
+        searches the rows that matched before.
+
+        :param text:    Text to look for. '' or None shows all rows
+        :type text:     (str | None)
+        :param columns: The columns to search. None searches all of them
+        :type columns:  List[int] | None
+        """
+        self.filter_text = text.lower() if text else ''
+        self.filter_columns = tuple(columns) if columns is not None else None
+        self._show_view()
+
+    def get_source_rows(self):
+        """
+        Returns the selected rows as row numbers in Values. Same as get() when the table isn't sorted or filtered
+
+        :return: A list of row numbers into Values
+        :rtype:  List[int]
+        """
+        rows = self.get()
+        if self.view_rows is None:
+            return rows
+        return [self.view_rows[row] for row in rows]
+
+    def _invalidate_view_caches(self):
+        self._sort_cache = {}
+        self._filter_cache = None
+        self._filter_strings = {}
+
+    def _source_count(self):
+        if self.RowCallback is not None:
+            return self.RowCount or 0
+        return len(self.Values)
+
+    def _source_row(self, index):
+        if self.RowCallback is not None:
+            return self.RowCallback(index)
+        return self.Values[index]
+
+    def _sorted_rows(self, column):
+        order = self._sort_cache.get(column)
+        if order is None:
+            keys = [_sort_key(row[column] if column < len(row) else None) for row in map(self._source_row, range(self._source_count()))]
+            order = self._sort_cache[column] = sorted(range(len(keys)), key=keys.__getitem__)
+        return order
+
+    def _filtered_rows(self):
+        text, columns = self.filter_text, self.filter_columns
+        strings = self._filter_strings.get(columns)
+        if strings is None:
+            strings = self._filter_strings[columns] = ['\0'.join(str(value).lower() for i, value in enumerate(row) if columns is None or i in columns) for row in map(self._source_row, range(self._source_count()))]
+        previous = self._filter_cache
+        if previous is not None and previous[1] == columns and text.startswith(previous[0]):
+            candidates = previous[2]
+        else:
+            candidates = range(len(strings))
+        matches = [row for row in candidates if text in strings[row]]
+        self._filter_cache = (text, columns, matches)
+        return matches
+
+    def _compute_view(self):
+        """
+        Not user callable. Works out view_rows from the current sort and filter
+
+        :return: Row numbers into Values in the order they are shown or None if showing all of Values in order
+        :rtype:  List[int] | None
+        """
+        if self.sort_column is None and not self.filter_text:
+            return None
+        if self.sort_column is not None:
+            order = self._sorted_rows(self.sort_column)
+            if self.sort_descending:
+                order = order[::-1]
+        else:
+            order = range(self._source_count())
+        if not self.filter_text:
+            return list(order)
+        matches = self._filtered_rows()
+        if self.sort_column is None:
+            return matches
+        matching = set(matches)
+        return [row for row in order if row in matching]
+
+    def _apply_view(self):
+        """
+        Not user callable. Computes the view and updates the Treeview to show it (non-virtual tables only)
+
+        :return: Number of Treeview operations performed
+        :rtype:  (int)
+        """
+        self.view_rows = self._compute_view()
+        view = self.view_rows if self.view_rows is not None else range(len(self.Values))
+        return self._diff_update([self.Values[row] for row in view], None, source_rows=list(view))
+
+    def _show_view(self):
+        """
+        Not user callable. Shows the rows for the current sort and filter, keeping the selected rows selected
+        """
+        if not self._widget_was_created():
+            self.view_rows = self._compute_view()
+            return
+        self._set_heading_arrows()
+        if not self.Virtual:
+            old_count = len(self.tree_ids)
+            self.last_update_operations = self._apply_view()
+            if self.AlternatingRowColor is not None:
+                for row in range(old_count + old_count % 2, len(self.tree_ids), 2):
+                    self.TKTreeview.tag_configure(row, background=self.AlternatingRowColor)
+            return
+        selected = [self.view_rows[row] if self.view_rows is not None else row for row in self.SelectedRows]
+        self.view_rows = self._compute_view()
+        if selected:
+            position = {source: row for row, source in enumerate(self.view_rows)} if self.view_rows is not None else None
+            self.SelectedRows = sorted(position[source] if position is not None else source for source in selected if position is None or source in position)
+        self._virtual_render(0, reload=True)
+
+    def _set_heading_arrows(self):
+        for column, heading_id in enumerate(self._heading_ids):
+            text = str(heading_id)
+            if column == self.sort_column:
+                text += ' \u25bc' if self.sort_descending else ' \u25b2'
+            self.TKTreeview.heading(heading_id, text=text)
+
+    def _heading_clicked(self, column):
+        """
+        Not user callable. Called when a heading is clicked and enable_sorting is True. Clicking the sorted column reverses the order
+        """
+        descending = not self.sort_descending if column == self.sort_column else False
+        self.sort(column, descending)
+
+    # -------------------------  Virtual (windowed) mode  ------------------------- #
+    # Only rows [first, last) are in the Treeview. Row N always has the iid N+1, the same as a normal table, so
+    # clicks and selections map directly to absolute row numbers. The Treeview's own scrolling is used for small
+    # moves. When the view gets close to either end of the rows that are loaded, the window of rows is moved.
+
+    def _row_total(self):
+        """
+        Not user callable. Number of rows shown, after sorting and filtering
+        """
+        if self.view_rows is not None:
+            return len(self.view_rows)
+        return self._source_count()
+
+    def _get_row(self, row):
+        """
+        Not user callable. Returns a single row of the table as shown, after sorting and filtering
+        """
+        if self.view_rows is not None:
+            row = self.view_rows[row]
+        return self._source_row(row)
+
+    def _rows_for_sizing(self):
+        """
+        Not user callable. The rows used to auto-size the columns. A virtual table only looks at the first rows
+        """
+        if not self.Virtual:
+            return self.Values
+        return [self._get_row(row) for row in range(min(self._row_total(), max(self.NumRows or 10, 100)))]
+
+    def _virtual_setup(self):
+        """
+        Not user callable. Called once the Treeview and scrollbars are made to take over scrolling and load the first rows
+        """
+        treeview = self.TKTreeview
+        treeview.configure(yscrollcommand=self._virtual_yscroll)
+        if getattr(self, 'vsb', None) is not None and not self.HideVerticalScroll:
+            self.vsb.configure(command=self._virtual_scrollbar)
+        treeview.bind('<ButtonPress-1>', self._virtual_button_pressed, add='+')
+        if self.AlternatingRowColor not in (None, COLOR_SYSTEM_DEFAULT):
+            treeview.tag_configure('_alternating', background=self.AlternatingRowColor)
+        self._virtual_render(0)
+
+    def _virtual_page(self):
+        if self._virtual_visible:
+            return self._virtual_visible
+        return self.NumRows if self.NumRows else 10
+
+    def _virtual_insert(self, row, index):
+        value = self._get_row(row)
+        if self.DisplayRowNumbers:
+            value = [row + self.StartingRowNumber] + list(value)
+        if self.AlternatingRowColor not in (None, COLOR_SYSTEM_DEFAULT) and row % 2 == 0:
+            tags = ('_alternating', row)
+        else:
+            tags = (row,)
+        self.TKTreeview.insert('', index, text=value, iid=row + 1, values=value, tags=tags)
+
+    def _virtual_render(self, top=None, reload=False):
+        """
+        Not user callable. Loads the rows around top into the Treeview, only adding and removing the rows that changed
+
+        :param top:    The row to show at the top of the table. None keeps the current top row
+        :type top:     (int | None)
+        :param reload: If True the rows already in the Treeview are fetched again
+        :type reload:  (bool)
+        """
+        self._virtual_render_pending = False
+        treeview = self.TKTreeview
+        total = self._row_total()
+        page = self._virtual_page()
+        top = self._virtual_top if top is None else top
+        top = max(0, min(top, total - page))
+        first = max(0, top - self.VirtualOverscan)
+        last = min(total, top + page + self.VirtualOverscan)
+        old_first, old_last = self._virtual_range
+        if reload or last <= old_first or first >= old_last:
+            children = treeview.get_children()
+            if children:
+                treeview.delete(*children)
+            for row in range(first, last):
+                self._virtual_insert(row, 'end')
+        else:
+            doomed = [row + 1 for row in range(old_first, min(first, old_last))] + [row + 1 for row in range(max(last, old_first), old_last)]
+            if doomed:
+                treeview.delete(*doomed)
+            for index, row in enumerate(range(first, min(old_first, last))):
+                self._virtual_insert(row, index)
+            for row in range(max(old_last, first), last):
+                self._virtual_insert(row, 'end')
+        self._virtual_range = (first, last)
+        self._virtual_top = top
+
+        wanted = [row + 1 for row in self.SelectedRows if first <= row < last]
+        if [int(x) for x in treeview.selection()] != wanted:
+            self._virtual_resync = True
+            treeview.selection_set(wanted)
+        if last > first:
+            treeview.yview_moveto((top - first) / (last - first))
+        self._virtual_set_scrollbar()
+
+    def _virtual_set_scrollbar(self):
+        if getattr(self, 'vsb', None) is None or self.HideVerticalScroll:
+            return
+        total = self._row_total()
+        if total == 0:
+            self.vsb.set(0, 1)
+        else:
+            self.vsb.set(self._virtual_top / total, min(1, (self._virtual_top + self._virtual_page()) / total))
+
+    def _virtual_yscroll(self, first, last):
+        """
+        Not user callable. The Treeview's yscrollcommand. Tracks which rows are showing and moves the window of
+        loaded rows when getting near the end of it
+        """
+        row_first, row_last = self._virtual_range
+        loaded = row_last - row_first
+        if loaded == 0:
+            self._virtual_set_scrollbar()
+            return
+        first, last = float(first), float(last)
+        self._virtual_top = row_first + int(round(first * loaded))
+        self._virtual_visible = max(1, int(round((last - first) * loaded)))
+        margin = max(1, self.VirtualOverscan // 2)
+        near_top = row_first > 0 and self._virtual_top - row_first < margin
+        near_bottom = row_last < self._row_total() and row_last - (self._virtual_top + self._virtual_visible) < margin
+        if (near_top or near_bottom) and not self._virtual_render_pending:
+            self._virtual_render_pending = True
+            self.TKTreeview.after_idle(self._virtual_render)
+        self._virtual_set_scrollbar()
+
+    def _virtual_scrollbar(self, *args):
+        """
+        Not user callable. The vertical scrollbar's command. Positions are in rows of the whole table
+        """
+        total = self._row_total()
+        page = self._virtual_page()
+        if args[0] == 'moveto':
+            top = int(float(args[1]) * total)
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            top = self._virtual_top + (amount * page if args[2] == 'pages' else amount)
+        else:
+            return
+        self.scroll_to_row(top)
+
+    def _virtual_button_pressed(self, event):
+        self._virtual_extend_selection = bool(event.state & 0x0005)  # Shift or Control held
+
+    def _virtual_selection_changed(self, selections):
+        """
+        Not user callable. Merges the Treeview's selection (loaded rows only) with the rows selected outside of it
+
+        :return: True if the user changed the selection, False if it was changed by loading different rows
+        :rtype:  (bool)
+        """
+        first, last = self._virtual_range
+        visible = [int(x) - 1 for x in selections]
+        if self._virtual_resync:
+            self._virtual_resync = False
+            if visible == [row for row in self.SelectedRows if first <= row < last]:
+                return False
+        if self._virtual_extend_selection:
+            outside = [row for row in self.SelectedRows if not first <= row < last]
+            self.SelectedRows = sorted(set(outside) | set(visible))
+        else:
+            self.SelectedRows = visible
+        return True
+
+    def _virtual_update(self, values, num_rows, visible, select_rows, alternating_row_color, row_colors, row_count):
+        """
+        Not user callable. Table.update for virtual tables. Cost depends on the number of visible rows, not the number of rows in the table
+        """
+        reload = False
+        if values is not None:
+            self.Values = values
+            self.SelectedRows = []
+            reload = True
+        if row_count is not None:
+            self.RowCount = row_count
+            reload = True
+        if reload and self.view_rows is not None:
+            self.view_rows = self._compute_view()
+        self.SelectedRows = [row for row in self.SelectedRows if row < self._row_total()]
+        if visible is False:
+            self._pack_forget_save_settings(self.element_frame)
+        elif visible is True:
+            self._pack_restore_settings(self.element_frame)
+        if num_rows is not None:
+            self.TKTreeview.config(height=num_rows)
+            self.NumRows = num_rows
+            self._virtual_visible = None
+        if alternating_row_color is not None:
+            self.AlternatingRowColor = alternating_row_color
+            self.TKTreeview.tag_configure('_alternating', background=alternating_row_color)
+            reload = True
+        if row_colors is not None:  # individual row colors
+            self.RowColors = row_colors
+            for row_def in self.RowColors:
+                if len(row_def) == 2:  # only background is specified
+                    self.TKTreeview.tag_configure(row_def[0], background=row_def[1])
+                else:
+                    self.TKTreeview.tag_configure(row_def[0], background=row_def[2], foreground=row_def[1])
+        top = None
+        if select_rows is not None:
+            self.SelectedRows = sorted(i for i in select_rows if 0 <= i < self._row_total())
+            first, last = self._virtual_range
+            if self.SelectedRows and not first <= self.SelectedRows[0] < last:
+                top = self.SelectedRows[0]
+        self._virtual_render(top, reload=reload)
+        if visible is not None:
+            self._visible = visible
+
+    def scroll_to_row(self, row):
+        """
+        Scrolls the table so that row is the top row shown. Works for normal and virtual tables.
+
+        :param row: The row number (0 is the first row of the data)
+        :type row:  (int)
+        """
+        if not self._widget_was_created():  # if widget hasn't been created yet, then don't allow
+            return
+        if not self.Virtual:
+            total = len(self.Values)
+            if total:
+                self.TKTreeview.yview_moveto(max(0, min(row, total)) / total)
+            return
+        first, last = self._virtual_range
+        page = self._virtual_page()
+        row = max(0, min(row, self._row_total() - page))
+        if first <= row and row + page <= last and (first == 0 or row - first >= self.VirtualOverscan // 2) and (last == self._row_total() or last - (row + page) >= self.VirtualOverscan // 2):
+            self._virtual_top = row
+            self.TKTreeview.yview_moveto((row - first) / (last - first))
+            self._virtual_set_scrollbar()
+        else:
+            self._virtual_render(row)
+
     def get_last_clicked_position(self):
         """
         Returns a tuple with the row and column of the cell that was last clicked.
@@ -11,6 +11,7 @@ from FreeSimpleGUI import ELEM_TYPE_TREE
 from FreeSimpleGUI import Element
 from FreeSimpleGUI import LOOK_AND_FEEL_TABLE
 from FreeSimpleGUI import theme_button_color
+from FreeSimpleGUI._image_cache import _cached_photo_image
 from FreeSimpleGUI._utils import _error_popup_with_traceback
 from FreeSimpleGUI._utils import _exit_mainloop
 
@@ -68,6 +69,8 @@ class Tree(Element):
         expand_x=False,
         expand_y=False,
         visible=True,
+        children_callback=None,
+        lazy_node_budget=None,
         metadata=None,
     ):
         """
@@ -161,13 +164,17 @@ class Tree(Element):
         :type expand_y:                 (bool)
         :param visible:                 set visibility state of the element
         :type visible:                  (bool)
+        :param children_callback:       Turns on lazy mode. Called with a node's key the first time that node is expanded (with '' for the top level if data has no nodes). Returns or yields the children as tuples (key, text, values) or (key, text, values, icon) or (key, text, values, icon, has_children). Nodes without children in data get an expand arrow so their children can be fetched. show_expanded is ignored in lazy mode
+        :type children_callback:        Callable[[Any], Iterable[tuple]]
+        :param lazy_node_budget:        Lazy mode only. Maximum number of fetched nodes to keep. When exceeded, the children of the least recently collapsed nodes are dropped and fetched again the next time they're expanded. None means never drop
+        :type lazy_node_budget:         (int | None)
         :param metadata:                User metadata that can be set to ANYTHING
         :type metadata:                 (Any)
         """
 
         self.image_dict = {}
 
-        self.TreeData = data
+        self.TreeData = data if data is not None or children_callback is None else TreeData()
         self.ColumnHeadings = headings
         self.ColumnsToDisplay = visible_column_map
         self.ColumnWidths = col_widths
@@ -197,7 +204,7 @@ class Tree(Element):
         self.Justification = justification
         self.InitialState = None
         self.SelectMode = select_mode
-        self.ShowExpanded = show_expanded
+        self.ShowExpanded = show_expanded and children_callback is None
         self.NumRows = num_rows
         self.Col0Width = col0_width
         self.col0_heading = col0_heading
@@ -212,6 +219,12 @@ class Tree(Element):
         self.IconList = {}
         self.IdToKey = {'': ''}
         self.KeyToID = {'': ''}
+        self.ChildrenCallback = children_callback
+        self.LazyNodeBudget = lazy_node_budget
+        self._lazy_placeholders = {}  # parent id -> id of the placeholder child that gives it an expand arrow
+        self._lazy_loaded_parents = set()  # ids whose children came from children_callback
+        self._lazy_collapsed = {}  # ids of collapsed, loaded parents. Oldest collapse first
+        self._lazy_node_count = 0
         key = key if key is not None else k
         pad = pad if pad is not None else p
         self.expand_x = expand_x
@@ -275,9 +288,9 @@ class Tree(Element):
                 try:
                     if node.icon not in self.image_dict:
                         if type(node.icon) is bytes:
-                            photo = tk.PhotoImage(data=node.icon)
+                            photo = _cached_photo_image(data=node.icon)
                         else:
-                            photo = tk.PhotoImage(file=node.icon)
+                            photo = _cached_photo_image(filename=node.icon)
                         self.image_dict[node.icon] = photo
                     else:
                         photo = self.image_dict.get(node.icon)
@@ -311,6 +324,147 @@ class Tree(Element):
         for node in node.children:
             self.add_treeview_data(node)
 
+    def _lazy_setup(self):
+        """
+        Not a user function.  Called once the TreeData has been inserted when in lazy mode.  Gives every node that
+        has no children in the TreeData an expand arrow and fetches the top level if the TreeData is empty.
+        """
+        self._lazy_placeholders = {}
+        self._lazy_loaded_parents = set()
+        self._lazy_collapsed = {}
+        self._lazy_node_count = 0
+        for key, node in self.TreeData.tree_dict.items():
+            if key != '' and not node.children and key in self.KeyToID:
+                self._lazy_add_placeholder(self.KeyToID[key])
+        if not self.TreeData.root_node.children:
+            self._lazy_load('')
+
+    def _lazy_add_placeholder(self, parent_id):
+        self._lazy_placeholders[parent_id] = self.TKTreeview.insert(parent_id, 'end', text='')
+
+    def _lazy_insert(self, parent_id, key, text, values, icon=None, has_children=True):
+        """
+        Not a user function.  Inserts one node returned by the children_callback
+        """
+        options = {'text': text}
+        if values is not None:  # ttk can't take values=None
+            options['values'] = values
+        photo = self._photo_for_icon(icon)
+        if photo is not None:
+            options['image'] = photo
+        id = self.TKTreeview.insert(parent_id, 'end', **options)
+        self.IdToKey[id] = key
+        self.KeyToID[key] = id
+        if has_children:
+            self._lazy_add_placeholder(id)
+
+    def _photo_for_icon(self, icon):
+        """
+        Not a user function.  Returns the PhotoImage for an icon, loading it the first time it's used.
+
+        :param icon: base64 icon or filename. None for no icon
+        :type icon:  bytes | str | None
+        :return:     The image or None if there is no icon or it can't be loaded
+        :rtype:      tk.PhotoImage | None
+        """
+        if not icon:
+            return None
+        photo = self.image_dict.get(icon)
+        if photo is None:
+            try:
+                if type(icon) is bytes:
+                    photo = _cached_photo_image(data=icon)
+                else:
+                    photo = _cached_photo_image(filename=icon)
+                self.image_dict[icon] = photo
+            except Exception as e:
+                print('Error loading tree icon', e)
+        return photo
+
+    def _lazy_load(self, parent_id):
+        """
+        Not a user function.  Replaces the placeholder under parent_id with the children from the children_callback.
+        If there turn out to be no children, the expand arrow goes away.
+
+        :param parent_id: The treeview id of the node being expanded. '' for the top level
+        :type parent_id:  (str)
+        """
+        placeholder = self._lazy_placeholders.pop(parent_id, None)
+        if placeholder is not None:
+            self.TKTreeview.delete(placeholder)
+        count = 0
+        try:
+            for child in self.ChildrenCallback(self.IdToKey[parent_id]):
+                self._lazy_insert(parent_id, *child)
+                count += 1
+        except Exception as e:
+            _error_popup_with_traceback('Error in Tree children_callback', f'Fetching children of {self.IdToKey[parent_id]}', e)
+        self._lazy_loaded_parents.add(parent_id)
+        self._lazy_node_count += count
+        self._lazy_evict()
+
+    def _lazy_opened(self, event):
+        """
+        Not a user function.  Callback for <<TreeviewOpen>>.  Fetches the children of the node if they're not loaded.
+
+        :param event: An event parameter passed in by tkinter.  Not used
+        :type event:  (Any)
+        """
+        id = self.TKTreeview.focus()
+        self._lazy_collapsed.pop(id, None)
+        if id in self._lazy_placeholders:
+            self._lazy_load(id)
+
+    def _lazy_closed(self, event):
+        """
+        Not a user function.  Callback for <<TreeviewClose>>.  The children of a collapsed node become candidates
+        for being dropped once there are more than lazy_node_budget fetched nodes.
+
+        :param event: An event parameter passed in by tkinter.  Not used
+        :type event:  (Any)
+        """
+        id = self.TKTreeview.focus()
+        if id in self._lazy_loaded_parents:
+            self._lazy_collapsed.pop(id, None)
+            self._lazy_collapsed[id] = None
+            self._lazy_evict()
+
+    def _lazy_evict(self):
+        """
+        Not a user function.  Drops the children of the least recently collapsed nodes until the number of fetched
+        nodes is within the budget.  Dropped nodes get their placeholder back so they can be fetched again.
+        """
+        if self.LazyNodeBudget is None:
+            return
+        treeview = self.TKTreeview
+        evicted = False
+        while self._lazy_node_count > self.LazyNodeBudget and self._lazy_collapsed:
+            id = next(iter(self._lazy_collapsed))
+            del self._lazy_collapsed[id]
+            if not treeview.exists(id) or treeview.item(id, 'open'):
+                continue
+            children = treeview.get_children(id)
+            stack = list(children)
+            while stack:
+                child = stack.pop()
+                if child not in self.IdToKey:  # a placeholder
+                    continue
+                stack.extend(treeview.get_children(child))
+                key = self.IdToKey.pop(child)
+                if self.KeyToID.get(key) == child:
+                    del self.KeyToID[key]
+                self._lazy_placeholders.pop(child, None)
+                self._lazy_loaded_parents.discard(child)
+                self._lazy_collapsed.pop(child, None)
+                self._lazy_node_count -= 1
+            if children:
+                treeview.delete(*children)
+            self._lazy_loaded_parents.discard(id)
+            self._lazy_add_placeholder(id)
+            evicted = True
+        if evicted:
+            self.SelectedRows = [self.IdToKey[x] for x in treeview.selection() if x in self.IdToKey]
+
     def update(self, values=None, key=None, value=None, text=None, icon=None, visible=None):
         """
         Changes some of the settings for the Tree Element. Must call `Window.Read` or `Window.Finalize` prior
@@ -321,7 +475,7 @@ class Tree(Element):
         function "pin" to ensure your element is "pinned" to that location in your layout so that it returns there
         when made visible.
 
-        :param values:  Representation of the tree
+        :param values:  Representation of the tree. In lazy mode, pass an empty TreeData to fetch everything again from the children_callback
         :type values:   (TreeData)
         :param key:     identifies a particular item in tree to update
         :type key:      str | int | tuple | object
@@ -343,21 +497,18 @@ class Tree(Element):
 
         if values is not None:
             children = self.TKTreeview.get_children()
-            for i in children:
-                self.TKTreeview.detach(i)
-                self.TKTreeview.delete(i)
-            children = self.TKTreeview.get_children()
+            if children:
+                self.TKTreeview.delete(*children)
             self.TreeData = values
             self.IdToKey = {'': ''}
             self.KeyToID = {'': ''}
             self.add_treeview_data(self.TreeData.root_node)
+            if self.ChildrenCallback is not None:
+                self._lazy_setup()
             self.SelectedRows = []
         if key is not None:
-            for id in self.IdToKey.keys():
-                if key == self.IdToKey[id]:
-                    break
-            else:
-                id = None
+            id = self.KeyToID.get(key)
+            if id is None:
                 print('** Key not found **')
         else:
             id = None
@@ -370,9 +521,9 @@ class Tree(Element):
             if icon is not None:
                 try:
                     if type(icon) is bytes:
-                        photo = tk.PhotoImage(data=icon)
+                        photo = _cached_photo_image(data=icon)
                     else:
-                        photo = tk.PhotoImage(file=icon)
+                        photo = _cached_photo_image(filename=icon)
                     self.TKTreeview.item(id, image=photo)
                     self.IconList[key] = photo  # save so that it's not deleted (save reference)
                 except:
@@ -388,6 +539,164 @@ class Tree(Element):
 
         return self
 
+    def update_nodes(self, delete=None, insert=None, move=None, update=None):
+        """
+        Changes many nodes of the tree in one call.  Much faster than calling update once per node, or rebuilding
+        the entire tree with update(values=...) when only part of it has changed.
+
+        The changes are made in this order: delete, insert, move, update.  Nothing is redrawn until all of them
+        are done.  The TreeData the tree was built from is not changed.
+
+        Changes will not be visible in your window until you call window.read or window.refresh.
+
+        :param delete: Keys of the nodes to remove.  Everything under a removed node is removed too
+        :type delete:  List[str | int | tuple | object]
+        :param insert: Nodes to add as tuples (parent_key, key, text, values) or (parent_key, key, text, values, icon). A node's parent must already be in the tree or come earlier in this list, so a subtree is added by listing each parent before its children. Keys already in the tree are skipped. In lazy mode the parent's children are fetched first if they haven't been
+        :type insert:  List[tuple]
+        :param move:   Nodes to move as tuples (key, new_parent_key, index). index is the position within the new parent, 'end' to make it the last child. Everything under the node moves with it
+        :type move:    List[tuple]
+        :param update: Nodes to change as tuples (key, text, values) or (key, text, values, icon). Use None for anything that should stay the same
+        :type update:  List[tuple]
+        :return:       returns self so can be chained
+        :rtype:        (Tree)
+        """
+        if not self._widget_was_created():  # if widget hasn't been created yet, then don't allow
+            return
+
+        if self._this_elements_window_closed():
+            _error_popup_with_traceback('Error in Tree.update_nodes - The window was closed')
+            return
+
+        treeview = self.TKTreeview
+        call = treeview.tk.call  # going straight to tcl skips tkinter's option formatting for every node
+        widget = str(treeview)
+        key_to_id = self.KeyToID
+        id_to_key = self.IdToKey
+        lazy = self.ChildrenCallback is not None
+        not_found = []
+        duplicates = []
+
+        if delete:
+            self._delete_nodes(delete, not_found)
+
+        if insert:
+            for entry in insert:
+                parent_key, key, text, values = entry[:4]
+                parent_id = key_to_id.get(parent_key)
+                if parent_id is None:
+                    not_found.append(parent_key)
+                    continue
+                if key in key_to_id:
+                    duplicates.append(key)
+                    continue
+                if lazy:
+                    if parent_id in self._lazy_placeholders:
+                        # fetch the children now. Otherwise they're fetched again next to this node when it's expanded
+                        self._lazy_load(parent_id)
+                        if parent_id != '' and parent_id not in id_to_key:  # evicted while making room for them
+                            not_found.append(parent_key)
+                            continue
+                        if key in key_to_id:  # the children_callback returned it
+                            duplicates.append(key)
+                            continue
+                    elif parent_id not in self._lazy_loaded_parents and treeview.parent(parent_id) in self._lazy_loaded_parents:
+                        self._lazy_loaded_parents.add(parent_id)  # a fetched node without children. Its new children count as fetched too
+                options = ['-text', text]
+                if values is not None:
+                    options += ['-values', values]
+                photo = self._photo_for_icon(entry[4] if len(entry) > 4 else None)
+                if photo is not None:
+                    options += ['-image', photo]
+                id = call(widget, 'insert', parent_id, 'end', *options)
+                id_to_key[id] = key
+                key_to_id[key] = id
+                if lazy and parent_id in self._lazy_loaded_parents:
+                    self._lazy_node_count += 1
+            if lazy:
+                self._lazy_evict()
+
+        if move:
+            for key, parent_key, index in move:
+                id = key_to_id.get(key)
+                parent_id = key_to_id.get(parent_key)
+                if id is None or id == '' or parent_id is None:
+                    not_found.append(key if id is None else parent_key)
+                    continue
+                try:
+                    call(widget, 'move', id, parent_id, index)
+                except tk.TclError as e:
+                    _error_popup_with_traceback('Error in Tree.update_nodes', f'Unable to move {key} to {parent_key}', e)
+
+        if update:
+            for entry in update:
+                key, text, values = entry[:3]
+                id = key_to_id.get(key)
+                if id is None or id == '':
+                    not_found.append(key)
+                    continue
+                options = []
+                if text is not None:
+                    options += ['-text', text]
+                if values is not None:
+                    options += ['-values', values]
+                photo = self._photo_for_icon(entry[3] if len(entry) > 3 else None)
+                if photo is not None:
+                    options += ['-image', photo]
+                if options:
+                    call(widget, 'item', id, *options)
+
+        if not_found:
+            print('** Keys not found **', not_found)
+        if duplicates:
+            print('** Keys already in the tree, not inserted **', duplicates)
+        return self
+
+    def _delete_nodes(self, keys, not_found):
+        """
+        Not a user function.  Removes the nodes with the given keys and everything under them using a single
+        tcl call, and drops them from KeyToID, IdToKey and the lazy mode bookkeeping.
+
+        :param keys:      Keys of the nodes to remove
+        :type keys:       List[str | int | tuple | object]
+        :param not_found: Keys that aren't in the tree are appended to this list
+        :type not_found:  List[str | int | tuple | object]
+        """
+        treeview = self.TKTreeview
+        lazy = self.ChildrenCallback is not None
+        doomed = {}  # the top-most ids being deleted. Anything under them goes with them
+        removed = set()
+        for key in keys:
+            id = self.KeyToID.get(key)
+            if id is None or id == '':
+                not_found.append(key)
+                continue
+            if id in removed:  # already under a node being deleted
+                continue
+            doomed[id] = None
+            stack = [(id, lazy and treeview.parent(id) in self._lazy_loaded_parents)]
+            while stack:
+                node, fetched = stack.pop()
+                if node in removed:  # was deleted on its own earlier in the list
+                    doomed.pop(node, None)
+                    continue
+                removed.add(node)
+                if node not in self.IdToKey:  # a lazy mode placeholder
+                    continue
+                children_fetched = node in self._lazy_loaded_parents
+                stack.extend((child, children_fetched) for child in treeview.get_children(node))
+                node_key = self.IdToKey.pop(node)
+                if self.KeyToID.get(node_key) == node:
+                    del self.KeyToID[node_key]
+                if lazy:
+                    self._lazy_placeholders.pop(node, None)
+                    self._lazy_loaded_parents.discard(node)
+                    self._lazy_collapsed.pop(node, None)
+                    if fetched:
+                        self._lazy_node_count -= 1
+        if doomed:
+            treeview.delete(*doomed)
+            self.SelectedRows = [self.IdToKey[x] for x in treeview.selection() if x in self.IdToKey]
+
     Update = update
 
 
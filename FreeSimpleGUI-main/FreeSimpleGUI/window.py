@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import calendar
+import collections
 import datetime
 import difflib
 import os
@@ -8,6 +9,7 @@ import pickle
 import queue
 import sys
 import threading
+import time
 import tkinter
 import tkinter as tk
 import warnings
@@ -29,29 +31,8 @@ from FreeSimpleGUI import _TimerPeriodic
 from FreeSimpleGUI import BUTTON_TYPE_CALENDAR_CHOOSER
 from FreeSimpleGUI import COLOR_SYSTEM_DEFAULT
 from FreeSimpleGUI import ELEM_TYPE_BUTTON
-from FreeSimpleGUI import ELEM_TYPE_BUTTONMENU
-from FreeSimpleGUI import ELEM_TYPE_COLUMN
-from FreeSimpleGUI import ELEM_TYPE_FRAME
-from FreeSimpleGUI import ELEM_TYPE_GRAPH
-from FreeSimpleGUI import ELEM_TYPE_IMAGE
-from FreeSimpleGUI import ELEM_TYPE_INPUT_CHECKBOX
-from FreeSimpleGUI import ELEM_TYPE_INPUT_COMBO
-from FreeSimpleGUI import ELEM_TYPE_INPUT_LISTBOX
-from FreeSimpleGUI import ELEM_TYPE_INPUT_MULTILINE
-from FreeSimpleGUI import ELEM_TYPE_INPUT_OPTION_MENU
-from FreeSimpleGUI import ELEM_TYPE_INPUT_RADIO
-from FreeSimpleGUI import ELEM_TYPE_INPUT_SLIDER
-from FreeSimpleGUI import ELEM_TYPE_INPUT_SPIN
-from FreeSimpleGUI import ELEM_TYPE_INPUT_TEXT
-from FreeSimpleGUI import ELEM_TYPE_MENUBAR
-from FreeSimpleGUI import ELEM_TYPE_PANE
-from FreeSimpleGUI import ELEM_TYPE_PROGRESS_BAR
-from FreeSimpleGUI import ELEM_TYPE_SEPARATOR
-from FreeSimpleGUI import ELEM_TYPE_TAB
-from FreeSimpleGUI import ELEM_TYPE_TAB_GROUP
-from FreeSimpleGUI import ELEM_TYPE_TABLE
-from FreeSimpleGUI import ELEM_TYPE_TREE
 from FreeSimpleGUI import EMOJI_BASE64_KEY
+from FreeSimpleGUI import EVENT_COALESCE_LIST
 from FreeSimpleGUI import EVENT_TIMER
 from FreeSimpleGUI import fill_form_with_values
 from FreeSimpleGUI import GRAB_ANYWHERE_IGNORE_THESE_WIDGETS
@@ -79,12 +60,26 @@ from FreeSimpleGUI import TITLEBAR_TEXT_KEY
 from FreeSimpleGUI import TTKPartOverrides
 from FreeSimpleGUI import WINDOW_CLOSE_ATTEMPTED_EVENT
 from FreeSimpleGUI import WINDOW_CONFIG_EVENT
+from FreeSimpleGUI._element_index import _ElementIndex
+from FreeSimpleGUI._executor import _WindowExecutor
 from FreeSimpleGUI._utils import _error_popup_with_traceback
 from FreeSimpleGUI._utils import _exit_mainloop
 from FreeSimpleGUI.elements.base import Element
 from FreeSimpleGUI.elements.helpers import _simplified_dual_color_to_tuple
 from FreeSimpleGUI.elements.helpers import button_color_to_tuple
 
+# Stands in the thread queue for the value of a coalesced event. The value is in Window._coalesced_events
+_COALESCED = object()
+
+
+def _resolve_waiter(waiter):
+    """
+    Not user callable!
+    Wakes up Window.read_async if it's still waiting
+    """
+    if not waiter.done():
+        waiter.set_result(None)
+
 
 class Window:
     """
@@ -104,7 +99,10 @@ class Window:
     _window_running_mainloop = None  # The window that is running the mainloop
     _container_element_counter = 0  # used to get a number of Container Elements (Frame, Column, Tab)
     _read_call_from_debugger = False
-    _timeout_0_counter = 0  # when timeout=0 then go through each window one at a time
+    _ready_windows = collections.deque()  # windows with thread events waiting. Each window is in it at most once
+    _ready_lock = threading.Lock()  # guards _ready_windows and each window's _in_ready_windows
+    _poll_order = collections.deque()  # when read_all_windows has timeout=0 then go through each window one at a time
+    _queued_events_in_a_row = 0  # thread events read_all_windows returned without letting tkinter run
     _counter_for_ttk_widgets = 0
     _floating_debug_window_build_needed = False
     _main_debug_window_build_needed = False
@@ -181,6 +179,9 @@ class Window:
         sbar_relief=None,
         watermark=None,
         metadata=None,
+        incremental_results=False,
+        max_worker_threads=None,
+        max_worker_processes=None,
     ):
         """
         :param title:                                The title that will be displayed in the Titlebar and on the Taskbar
@@ -307,6 +308,12 @@ class Window:
         :type watermark:                             bool
         :param metadata:                             User metadata that can be set to ANYTHING
         :type metadata:                              (Any)
+        :param incremental_results:                  If True, read() uses a precomputed list of the elements in the layout and only reads back from tkinter the values that changed since the last read. Speeds up reads of windows with many elements
+        :type incremental_results:                   (bool)
+        :param max_worker_threads:                   Most functions given to submit that run at the same time in threads. The rest wait their turn. None for the concurrent.futures default
+        :type max_worker_threads:                    (int | None)
+        :param max_worker_processes:                 Most functions given to submit with use_process=True that run at the same time. None for the number of CPUs
+        :type max_worker_processes:                  (int | None)
         """
 
         self._metadata = None  # type: Any
@@ -388,7 +395,9 @@ class Window:
         self.ContainerElemementNumber = Window._GetAContainerNumber()
         # The dictionary containing all elements and keys for the window
         # The keys are the keys for the elements and the values are the elements themselves.
-        self.AllKeysDict = {}
+        # The dictionary is owned by the element index which is updated every time a row is added
+        self._element_index = _ElementIndex(self)
+        self.AllKeysDict = self._element_index.keys
         self.TransparentColor = transparent_color
         self.UniqueKeyCounter = 0
         self.DebuggerEnabled = debugger_enabled
@@ -396,6 +405,9 @@ class Window:
         self.ElementJustification = element_justification
         self.FocusSet = False
         self.metadata = metadata
+        self.incremental_results = incremental_results
+        self._results_engine = None  # type: _ResultsEngine
+        self._executor = _WindowExecutor(self, max_worker_threads, max_worker_processes)
         self.TtkTheme = ttk_theme or FreeSimpleGUI.DEFAULT_TTK_THEME
         self.UseTtkButtons = use_ttk_buttons if use_ttk_buttons is not None else FreeSimpleGUI.USE_TTK_BUTTONS
         self.user_bind_dict = {}  # Used when user defines a tkinter binding using bind method - convert bind string to key modifier
@@ -403,6 +415,13 @@ class Window:
         self.modal = modal
         self.thread_queue = None  # type: queue.Queue
         self.thread_lock = None  # type: threading.Lock
+        self._thread_wakeup_pending = False  # True from when a thread wakes the window until the thread queue is emptied
+        self._coalesced_events = {}  # key -> [coalesce mode, value] for keys written with coalesce that haven't been read
+        self._async_waiter = None  # type: asyncio.Future    # what read_async is sleeping on
+        self._in_ready_windows = False  # True while the window is in Window._ready_windows
+        self._events_read = 0  # events returned by reads of this window
+        self._event_rate = 0.0  # events per second, decayed with a 1 second time constant
+        self._event_rate_time = None  # when _event_rate was last updated
         self.thread_timer = None  # type: tk.Misc
         self.thread_strvar = None  # type: tk.StringVar
         self.read_closed_window_count = 0
@@ -544,6 +563,7 @@ class Window:
         :param *args: List[Elements]
         :type *args:
         """
+        self._invalidate_results_engine()
         NumRows = len(self.Rows)  # number of existing rows is our row number
         CurrentRowNumber = NumRows  # this row's number
         CurrentRow = []  # start with a blank row and build up
@@ -599,6 +619,16 @@ class Window:
                 self.NoTitleBar = True
         # -------------------------  Append the row to list of Rows  ------------------------- #
         self.Rows.append(CurrentRow)
+        self._element_index.add_row(CurrentRow, self)
+
+    def _invalidate_results_engine(self):
+        """
+        Not user callable!
+        Throws away the precomputed results plan because the layout changed.  It's rebuilt on the next read.
+        """
+        if self._results_engine is not None:
+            self._results_engine.detach()
+            self._results_engine = None
 
     # ------------------------- Add Multiple Rows to Form ------------------------- #
     def add_rows(self, rows):
@@ -666,7 +696,6 @@ class Window:
         else:
             new_rows = rows
         self.add_rows(new_rows)
-        self._BuildKeyDict()
 
         if self._has_custom_titlebar_element():
             self.Margins = (0, 0)
@@ -696,7 +725,6 @@ class Window:
         PackFormIntoFrame(column, frame, self)
         # sg.PackFormIntoFrame(col, window.TKroot, window)
         self.AddRow(column)
-        self.AllKeysDict = self._BuildKeyDictForWindow(self, column, self.AllKeysDict)
         return self
 
     def LayoutAndRead(self, rows, non_blocking=False):
@@ -984,11 +1012,73 @@ class Window:
             except:
                 break  # wasn't a calendar button for sure
 
+        if results is not None and results[0] is not None and results[0] != timeout_key:
+            self._count_event()
+
         if close:
             self.close()
 
         return results
 
+    async def read_async(self, timeout=None, timeout_key=TIMEOUT_KEY, close=False, poll_interval=10):
+        """
+        The asyncio version of read.  Use it from a coroutine instead of calling read(timeout=10) in a loop:
+
+            event, values = await window.read_async()
+
+        While it waits, tkinter's events are handled from the asyncio event loop so your other coroutines (network
+        connections, timers, ...) keep running.  A full read is only done when tkinter actually had something to
+        do, so an idle window costs next to nothing.  Calling write_event_value from a coroutine or a thread returns
+        the event right away.  Clicks and other GUI events are noticed within poll_interval milliseconds.
+
+        The window must be read (or finalized) from the same thread that runs the asyncio event loop.
+
+        :param timeout:       Milliseconds to wait until the read will return IF no other events happen first
+        :type timeout:        (int | None)
+        :param timeout_key:   The value that will be returned from the call if the timer expired
+        :type timeout_key:    (Any)
+        :param close:         if True the window will be closed prior to returning
+        :type close:          (bool)
+        :param poll_interval: Longest time in milliseconds between checks for tkinter events when nothing is happening
+        :type poll_interval:  (int)
+        :return:              (event, values)
+        :rtype:               Tuple[(Any), Dict[Any, Any], List[Any], None]
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout / 1000
+        delay = 0.001
+        results = self.read(timeout=0, timeout_key=timeout_key)
+        while results[0] == timeout_key and results[1] is not None:
+            busy = self._queued_thread_event_available()
+            try:
+                while self.TKroot.tk.dooneevent(tkinter._tkinter.ALL_EVENTS | tkinter._tkinter.DONT_WAIT):
+                    busy = True
+            except:  # window destroyed. The read will sort it out
+                busy = True
+            if busy:
+                results = self.read(timeout=0, timeout_key=timeout_key)
+                delay = 0.001
+                continue
+            if deadline is not None and loop.time() >= deadline:
+                break
+            # Sleep until the next poll, the deadline or write_event_value, whichever comes first
+            wait = min(delay, poll_interval / 1000)
+            if deadline is not None:
+                wait = min(wait, deadline - loop.time())
+            waiter = self._async_waiter = loop.create_future()
+            timer = loop.call_later(max(wait, 0), _resolve_waiter, waiter)
+            try:
+                await waiter
+            finally:
+                timer.cancel()
+                self._async_waiter = None
+            delay *= 2
+        if close:
+            self.close()
+        return results
+
     # @_timeit
     def _read(self, timeout=None, timeout_key=TIMEOUT_KEY):
         """
@@ -1181,6 +1271,8 @@ class Window:
             self.auto_close_timer_needs_starting = True
         # add the window to the list of active windows
         Window._active_windows[self] = Window.hidden_master_root
+        if self._queued_thread_event_available():  # written before the window was active
+            self._add_to_ready_windows()
         return self
         # OLD CODE FOLLOWS
         if not self.Shown:
@@ -1359,81 +1451,30 @@ class Window:
     def _BuildKeyDict(self):
         """
         Used internally only! Not user callable
-        Builds a dictionary containing all elements with keys for this window.
+        Rebuilds the element index (and the dictionary of keys) for this window from scratch.
+        Normally not needed as the index is updated every time a row is added.
         """
-        dict = {}
-        self.AllKeysDict = self._BuildKeyDictForWindow(self, self, dict)
+        self._element_index = _ElementIndex(self)
+        self._element_index.add_children(self)
+        self.AllKeysDict = self._element_index.keys
 
     def _BuildKeyDictForWindow(self, top_window, window, key_dict):
         """
-        Loop through all Rows and all Container Elements for this window and create the keys for all of them.
-        Note that the calls are recursive as all pathes must be walked
+        Used internally only! Not user callable
+        Indexes the contents of a container element that were not added through Window.add_row.
+        Only the new elements are walked.
 
         :param top_window: The highest level of the window
         :type top_window:  (Window)
-        :param window:     The "sub-window" (container element) to be searched
+        :param window:     The "sub-window" (container element) whose contents are indexed
         :type window:      Column | Frame | FreeSimpleGUI.elements.tab.TabGroup | FreeSimpleGUI.elements.pane.Pane | FreeSimpleGUI.elements.tab.Tab
-        :param key_dict:   The dictionary as it currently stands.... used as part of recursive call
+        :param key_dict:   Not used. The window's own dictionary is always updated
         :type key_dict:
         :return:           (dict) Dictionary filled with all keys in the window
         :rtype:
         """
-        for row_num, row in enumerate(window.Rows):
-            for col_num, element in enumerate(row):
-                if element.Type == ELEM_TYPE_COLUMN:
-                    key_dict = self._BuildKeyDictForWindow(top_window, element, key_dict)
-                if element.Type == ELEM_TYPE_FRAME:
-                    key_dict = self._BuildKeyDictForWindow(top_window, element, key_dict)
-                if element.Type == ELEM_TYPE_TAB_GROUP:
-                    key_dict = self._BuildKeyDictForWindow(top_window, element, key_dict)
-                if element.Type == ELEM_TYPE_PANE:
-                    key_dict = self._BuildKeyDictForWindow(top_window, element, key_dict)
-                if element.Type == ELEM_TYPE_TAB:
-                    key_dict = self._BuildKeyDictForWindow(top_window, element, key_dict)
-                if element.Key is None:  # if no key has been assigned.... create one for input elements
-                    if element.Type == ELEM_TYPE_BUTTON:
-                        element.Key = element.ButtonText
-                    elif element.Type == ELEM_TYPE_TAB:
-                        element.Key = element.Title
-                    if element.Type in (
-                        ELEM_TYPE_MENUBAR,
-                        ELEM_TYPE_BUTTONMENU,
-                        ELEM_TYPE_INPUT_SLIDER,
-                        ELEM_TYPE_GRAPH,
-                        ELEM_TYPE_IMAGE,
-                        ELEM_TYPE_INPUT_CHECKBOX,
-                        ELEM_TYPE_INPUT_LISTBOX,
-                        ELEM_TYPE_INPUT_COMBO,
-                        ELEM_TYPE_INPUT_MULTILINE,
-                        ELEM_TYPE_INPUT_OPTION_MENU,
-                        ELEM_TYPE_INPUT_SPIN,
-                        ELEM_TYPE_INPUT_RADIO,
-                        ELEM_TYPE_INPUT_TEXT,
-                        ELEM_TYPE_PROGRESS_BAR,
-                        ELEM_TYPE_TABLE,
-                        ELEM_TYPE_TREE,
-                        ELEM_TYPE_TAB_GROUP,
-                        ELEM_TYPE_SEPARATOR,
-                    ):
-                        element.Key = top_window.DictionaryKeyCounter
-                        top_window.DictionaryKeyCounter += 1
-                if element.Key is not None:
-                    if element.Key in key_dict.keys():
-                        if element.Type == ELEM_TYPE_BUTTON and FreeSimpleGUI.WARN_DUPLICATE_BUTTON_KEY_ERRORS:  # for Buttons see if should complain
-                            warnings.warn(f'*** Duplicate key found in your layout {element.Key} ***', UserWarning)
-                            warnings.warn(f'*** Replaced new key with {str(element.Key) + str(self.UniqueKeyCounter)} ***')
-                            if not FreeSimpleGUI.SUPPRESS_ERROR_POPUPS:
-                                _error_popup_with_traceback(
-                                    'Duplicate key found in your layout',
-                                    f'Dupliate key: {element.Key}',
-                                    f'Is being replaced with: {str(element.Key) + str(self.UniqueKeyCounter)}',
-                                    'The line of code above shows you which layout, but does not tell you exactly where the element was defined',
-                                    f'The element type is {element.Type}',
-                                )
-                        element.Key = str(element.Key) + str(self.UniqueKeyCounter)
-                        self.UniqueKeyCounter += 1
-                    key_dict[element.Key] = element
-        return key_dict
+        self._element_index.add_children(window)
+        return self.AllKeysDict
 
     def element_list(self):
         """
@@ -1447,38 +1488,9 @@ class Window:
     def _build_element_list(self):
         """
         Used internally only! Not user callable
-        Builds a dictionary containing all elements with keys for this window.
-        """
-        elem_list = []
-        elem_list = self._build_element_list_for_form(self, self, elem_list)
-        return elem_list
-
-    def _build_element_list_for_form(self, top_window, window, elem_list):
+        Returns the elements of this window in layout order, taken from the element index.
         """
-        Loop through all Rows and all Container Elements for this window and create a list
-        Note that the calls are recursive as all pathes must be walked
-
-        :param top_window: The highest level of the window
-        :type top_window:  (Window)
-        :param window:     The "sub-window" (container element) to be searched
-        :type window:      Column | Frame | TabGroup | Pane | Tab
-        :param elem_list:  The element list as it currently stands.... used as part of recursive call
-        :type elem_list:   ???
-        :return:           List of all elements in this sub-window
-        :rtype:            List[Element]
-        """
-        for row_num, row in enumerate(window.Rows):
-            for col_num, element in enumerate(row):
-                elem_list.append(element)
-                if element.Type in (
-                    ELEM_TYPE_COLUMN,
-                    ELEM_TYPE_FRAME,
-                    ELEM_TYPE_TAB_GROUP,
-                    ELEM_TYPE_PANE,
-                    ELEM_TYPE_TAB,
-                ):
-                    elem_list = self._build_element_list_for_form(top_window, element, elem_list)
-        return elem_list
+        return list(self._element_index.order)
 
     def save_to_disk(self, filename):
         """
@@ -1828,6 +1840,10 @@ class Window:
             del Window._active_windows[self]  # will only be in the list if window was explicitly finalized
         except:
             pass
+        with Window._ready_lock:
+            if self._in_ready_windows:
+                self._in_ready_windows = False
+                Window._ready_windows.remove(self)
 
         try:
             self.TKroot.update()  # On Linux must call update if the user closed with X or else won't actually close the window
@@ -1838,6 +1854,7 @@ class Window:
         self._restore_stderr()
 
         _TimerPeriodic.stop_all_timers_for_window(self)
+        self._executor.shutdown()
 
         if self.TKrootDestroyed:
             return
@@ -1850,6 +1867,7 @@ class Window:
         self.TKrootDestroyed = True
 
         # Free up anything that was held in the layout and the root variables
+        self._results_engine = None
         self.Rows = None
         self.TKroot = None
 
@@ -2472,21 +2490,62 @@ class Window:
             else:
                 self.thread_strvar.trace_add('write', self._window_tkvar_changed_callback)
 
-    def write_event_value(self, key, value):
+    def write_event_value(self, key, value, coalesce=None):
         """
         Adds a key & value tuple to the queue that is used by threads to communicate with the window
 
-        :param key:   The key that will be returned as the event when reading the window
-        :type key:    Any
-        :param value: The value that will be in the values dictionary
-        :type value:  Any
+        A thread that writes faster than the window is read can coalesce its events.  Values written for a key that
+        hasn't been read yet are then combined into the event that's already waiting instead of adding another one:
+            EVENT_COALESCE_LATEST - only the newest value is returned.  Good for progress updates
+            EVENT_COALESCE_LIST   - a list of all of the values is returned.  Good for log lines
+        Either way the event is returned where the first of the values was written.
+
+        :param key:      The key that will be returned as the event when reading the window
+        :type key:       Any
+        :param value:    The value that will be in the values dictionary
+        :type value:     Any
+        :param coalesce: None to return every value as its own event, EVENT_COALESCE_LATEST or EVENT_COALESCE_LIST
+        :type coalesce:  (str | None)
+        """
+        self.write_event_values(((key, value),), coalesce)
+
+    def write_event_values(self, events, coalesce=None):
+        """
+        Adds several key & value tuples to the queue that is used by threads to communicate with the window.
+        Much faster than calling write_event_value for each of them as the window is only woken up once.
+
+        The window is only woken up if it's not already been woken up for events it hasn't read yet, so a thread
+        can write thousands of events a second without flooding tkinter.  They are still returned one per read.
+
+        :param events:   (key, value) tuples in the order they should be read
+        :type events:    List[Tuple[Any, Any]]
+        :param coalesce: None to return every value as its own event, EVENT_COALESCE_LATEST or EVENT_COALESCE_LIST.  See write_event_value
+        :type coalesce:  (str | None)
         """
 
         if self.thread_queue is None:
             print('*** Warning Window.write_event_value - no thread queue found ***')
             return
-        # self.thread_lock.acquire()  # first lock the critical section
-        self.thread_queue.put(item=(key, value))
+        with self.thread_lock:
+            for key, value in events:
+                if coalesce is None:
+                    self.thread_queue.put(item=(key, value))
+                    continue
+                waiting = self._coalesced_events.get(key)
+                if waiting is None:
+                    self._coalesced_events[key] = [coalesce, [value] if coalesce == EVENT_COALESCE_LIST else value]
+                    self.thread_queue.put(item=(key, _COALESCED))
+                elif waiting[0] == EVENT_COALESCE_LIST:
+                    waiting[1].append(value)
+                else:
+                    waiting[1] = value
+            self._add_to_ready_windows()
+            waiter = self._async_waiter
+            if waiter is not None:  # read_async is sleeping.  Wake it up, from whatever thread this is
+                waiter.get_loop().call_soon_threadsafe(_resolve_waiter, waiter)
+            if self._thread_wakeup_pending:
+                return
+            self._thread_wakeup_pending = True
         self.TKroot.tk.willdispatch()  # brilliant bit of code provided by Giuliano who I owe a million thank yous!
         self.thread_strvar.set('new item')
 
@@ -2494,12 +2553,74 @@ class Window:
         if self.thread_queue is None:
             return None
 
-        try:  # see if something has been posted to Queue
-            message = self.thread_queue.get_nowait()
-        except queue.Empty:  # get_nowait() will get exception when Queue is empty
-            return None
+        with self.thread_lock:
+            try:  # see if something has been posted to Queue
+                key, value = self.thread_queue.get_nowait()
+            except queue.Empty:  # get_nowait() will get exception when Queue is empty
+                self._thread_wakeup_pending = False
+                return None
+            if value is _COALESCED:
+                value = self._coalesced_events.pop(key)[1]
+            if self.thread_queue.empty():  # next write has to wake the window up again
+                self._thread_wakeup_pending = False
+
+        return key, value
+
+    def _add_to_ready_windows(self):
+        """
+        Puts the window at the back of the queue read_all_windows takes thread events from, unless it's already in it.
+        Only active windows go in.  finalize adds a window that had events written before it was active and close
+        takes it out again, so the queue never keeps a closed window alive.
+        """
+        with Window._ready_lock:
+            if not self._in_ready_windows and self in Window._active_windows:
+                self._in_ready_windows = True
+                Window._ready_windows.append(self)
+
+    @classmethod
+    def _next_ready_window(cls):
+        """
+        Takes the window at the front of the queue of windows with thread events waiting.  Windows that were closed
+        or that had their events read some other way are dropped as they come up.
+
+        :return: The active window that's been waiting the longest for its thread events to be read
+        :rtype:  (Window | None)
+        """
+        with cls._ready_lock:
+            while cls._ready_windows:
+                window = cls._ready_windows.popleft()
+                window._in_ready_windows = False
+                if window in cls._active_windows and window._queued_thread_event_available():
+                    return window
+        return None
 
-        return message
+    def _count_event(self):
+        """
+        Adds an event to the statistics returned by get_event_stats
+        """
+        now = time.perf_counter()
+        if self._event_rate_time is not None:
+            self._event_rate *= 0.5 ** ((now - self._event_rate_time) / 0.693)
+        self._event_rate += 1.0
+        self._event_rate_time = now
+        self._events_read += 1
+
+    def get_event_stats(self):
+        """
+        Returns how busy the window is.  Handy for finding the window that's keeping read_all_windows busy.
+
+            events            - the number of events reads of this window have returned (timeouts aren't counted)
+            events_per_second - the recent rate of events, averaged over about the last second
+            queued            - events written by threads that haven't been read yet
+
+        :return: Dictionary with the statistics
+        :rtype:  Dict[str, int | float]
+        """
+        rate = self._event_rate
+        if self._event_rate_time is not None:
+            rate *= 0.5 ** ((time.perf_counter() - self._event_rate_time) / 0.693)
+        queued = self.thread_queue.qsize() if self.thread_queue is not None else 0
+        return {'events': self._events_read, 'events_per_second': rate, 'queued': queued}
 
     def _queued_thread_event_available(self):
 
@@ -2600,6 +2721,7 @@ class Window:
         Starts a thread on your behalf.
 
         This is a way for you to "ease into" threading without learning the details of threading.
+        To run many functions with a limit on how many run at once, or to get a Future back, use submit.
         Your function will run, and when it returns 2 things will happen:
         1. The value you provide for end_key will be returned to you when you call window.read()
         2. If your function returns a value, then the value returned will also be included in your windows.read call in the values dictionary
@@ -2619,6 +2741,70 @@ class Window:
         thread.start()
         return thread
 
+    def submit(self, func, *args, end_key=None, error_key=None, progress_key=None, use_process=False, **kwargs):
+        """
+        Runs func(*args, **kwargs) in a pool of worker threads that belongs to this window and returns a
+        concurrent.futures.Future for it.  Like perform_long_operation but with a limit on how many run at once
+        (max_worker_threads when making the Window), so firing off hundreds of tasks queues them instead of
+        starting hundreds of threads.
+
+        When func returns, end_key is sent as an event with the returned value in the values dictionary.
+        If func raises an exception, error_key is sent with the exception as its value (end_key if there's no error_key).
+
+        If progress_key is set, func is called with an extra keyword argument named progress.  It's a function
+        to call with a value, like a percentage, that's sent as the progress_key event.  Progress updates that come
+        faster than the window reads them are combined so only the newest is returned.
+
+        use_process=True runs func in a separate process instead (max_worker_processes at once).  Good for long
+        calculations that would otherwise hold the GIL.  func, its arguments and what it returns must be picklable
+        and it can't report progress.
+
+        Closing the window cancels the functions that haven't started yet.  The ones already running finish but no
+        events are sent.  Call cancel() on the future to stop a function that hasn't started.
+
+        IMPORTANT - Like perform_long_operation, func must not make any FreeSimpleGUI calls other than
+        Window.write_event_value
+
+        :param func:         The function to run
+        :type func:          Callable
+        :param args:         Positional arguments to pass to func
+        :type args:          Any
+        :param end_key:      Event to send when func returns
+        :type end_key:       (Any | None)
+        :param error_key:    Event to send if func raises an exception
+        :type error_key:     (Any | None)
+        :param progress_key: Event to send when func calls progress
+        :type progress_key:  (Any | None)
+        :param use_process:  If True, run func in a worker process instead of a thread
+        :type use_process:   (bool)
+        :param kwargs:       Keyword arguments to pass to func
+        :type kwargs:        Any
+        :return:             The future for the result of func.  None if the window was closed
+        :rtype:              concurrent.futures.Future | None
+        """
+        if use_process and progress_key is not None:
+            _error_popup_with_traceback('Error in Window.submit', 'progress_key can only be used with threads, not with use_process=True')
+            return None
+        if self._executor.closed:
+            _error_popup_with_traceback('Error in Window.submit - The window was closed')
+            return None
+        try:
+            return self._executor.submit(func, args, kwargs, end_key, error_key, progress_key, use_process)
+        except RuntimeError:
+            if not self._executor.closed:  # a broken pool or the interpreter shutting down, not a closed window
+                raise
+            _error_popup_with_traceback('Error in Window.submit - The window was closed')
+            return None
+
+    def pending_tasks(self):
+        """
+        Returns how many of the functions given to submit haven't finished yet, counting the ones waiting to start
+
+        :return: Number of unfinished functions
+        :rtype:  (int)
+        """
+        return self._executor.pending()
+
     @property
     def key_dict(self):
         """
@@ -2721,7 +2907,7 @@ class Window:
         with the constants EVENT_TIMER or TIMER_KEY.  They both equal the same value.
         The values dictionary will contain the timer ID that is returned from this function.
 
-        :param frequency_ms:    How often to generate timer events in milliseconds
+        :param frequency_ms:    How often to generate timer events in milliseconds. Values of 0 or less are treated as 1
         :type frequency_ms:     int
         :param key:             Key to be returned as the timer event
         :type key:              str | int | tuple | object
@@ -0,0 +1,105 @@
+# -*- mode: python ; coding: utf-8 -*-
+# Startup-optimized build: onedir layout (nothing unpacked to a temp dir on
+# launch), optimized bytecode, no UPX, unused modules excluded and a
+# pre-parsed settings cache shipped next to the executable.
+#
+#   pyinstaller Mileage_fast.spec
+#   python startup_bench.py --exe dist/mileage/mileage.exe
+import json
+import os
+import shutil
+import sys
+
+# Stdlib / third-party packages that FreeSimpleGUI only imports on first use
+# (asyncio for Window.read_async, concurrent.futures for Window.submit) or not
+# at all, and that the calculator never touches. FreeSimpleGUI's own element modules are
+# all imported by FreeSimpleGUI/__init__.py, so only the Qt/Web/Wx ports go.
+EXCLUDES = [
+    'asyncio',
+    'concurrent',
+    'distutils',
+    'doctest',
+    'email',
+    'ftplib',
+    'html',
+    'http',
+    'idlelib',
+    'lib2to3',
+    'logging',
+    'multiprocessing',
+    'pdb',
+    'pydoc_data',
+    'setuptools',
+    'pkg_resources',
+    'sqlite3',
+    'ssl',
+    'test',
+    'tkinter.test',
+    'turtle',
+    'turtledemo',
+    'unittest',
+    'xml',
+    'xmlrpc',
+    'numpy',
+    'PIL',
+    'matplotlib',
+    'FreeSimpleGUIQt',
+    'FreeSimpleGUIWeb',
+    'FreeSimpleGUIWx',
+    'psgtray',
+]
+
+a = Analysis(
+    ['mileage_gui.py'],
+    pathex=[os.path.join(SPECPATH, 'FreeSimpleGUI-main')],
+    binaries=[],
+    datas=[],
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=EXCLUDES,
+    noarchive=False,
+    optimize=2,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='mileage',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='mileage',
+)
+
+# settings.json lives next to the executable (see BASE_DIR in mileage_gui.py);
+# ship it together with its pre-parsed cache so the first launch skips JSON.
+app_dir = os.path.join(DISTPATH, 'mileage')
+shutil.copy2(os.path.join(SPECPATH, 'settings.json'), os.path.join(app_dir, 'settings.json'))
+sys.path.insert(0, os.path.join(SPECPATH, 'FreeSimpleGUI-main'))
+sys.path.insert(0, SPECPATH)
+import mileage_gui  # noqa: E402
+
+mileage_gui.DATA_FILE = os.path.join(app_dir, 'settings.json')
+mileage_gui.SETTINGS_CACHE_FILE = os.path.join(app_dir, 'settings.cache')
+with open(mileage_gui.DATA_FILE, 'r', encoding='utf-8') as f:
+    mileage_gui.write_settings_cache(json.load(f))
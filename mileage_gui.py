@@ -6,13 +6,18 @@ Mileage Calculator – Local Python GUI
 - Always uses settings.json located next to this script
 - Distance-band engine + Business-Class city/region overrides
 - Adjustable ratio, transfer bonus, passengers, expiry date
+- Optional per-stage pipeline timings (GUI panel / --profile-json for batch)
 """
 import os
 import sys
+import csv
 import json
 import math
+import time
+import marshal
+import argparse
 from datetime import datetime
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, Callable
 
 # Use FreeSimpleGUI; fall back to your local folder if needed
 try:
@@ -24,8 +29,18 @@ except ImportError:
 APP_NAME = "Mileage Calculator (Local GUI)"
 
 # Always put settings.json in the same folder as this script
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# (or next to the executable when frozen by PyInstaller)
+if getattr(sys, "frozen", False):
+    BASE_DIR = os.path.dirname(os.path.abspath(sys.executable))
+else:
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_FILE = os.path.join(BASE_DIR, "settings.json")
+# Pre-parsed copy of settings.json, valid while the JSON file's mtime/size match
+SETTINGS_CACHE_FILE = os.path.join(BASE_DIR, "settings.cache")
+SETTINGS_CACHE_VERSION = 1
+
+# Set to a file path to have the app record when its first window is up, then exit
+STARTUP_PROBE_ENV = "MILEAGE_STARTUP_PROBE"
 
 # ------------------------------
 # Airports (expanded)
@@ -194,26 +209,182 @@ DEMO_RATE_TABLES = {
     },
 }
 
+# ------------------------------
+# Demo transfer partners – bank points → programs (replace with real ratios/promos)
+# rate = program miles per source point; min/increment in source points;
+# promos add a % bonus between start and end (inclusive, YYYY-MM-DD)
+# ------------------------------
+DEMO_TRANSFERS = [
+    {"from": "UOB UNI$", "to": "KrisFlyer", "rate": 2.0, "min": 5000, "increment": 5000, "promos": []},
+    {"from": "UOB UNI$", "to": "Asia Miles", "rate": 2.0, "min": 5000, "increment": 5000, "promos": []},
+    {"from": "UOB UNI$", "to": "Royal Orchid Plus", "rate": 2.0, "min": 5000, "increment": 5000, "promos": []},
+    {"from": "UOB UNI$", "to": "Avios", "rate": 2.0, "min": 5000, "increment": 5000, "promos": []},
+    {"from": "UOB UNI$", "to": "EVA", "rate": 2.0, "min": 5000, "increment": 5000, "promos": []},
+    {"from": "Avios", "to": "Qatar Privilege Club", "rate": 1.0, "min": 1, "increment": 1, "promos": []},
+    {"from": "Qatar Privilege Club", "to": "Avios", "rate": 1.0, "min": 1, "increment": 1, "promos": []},
+]
+
 DEFAULT_SETTINGS = {
     "programs": DEMO_RATE_TABLES,
     "airports": AIRPORTS,
     "origin": "BKK",
+    "transfers": DEMO_TRANSFERS,
 }
 
+# ------------------------------
+# Pipeline instrumentation
+# ------------------------------
+class _NullStage:
+    """Shared no-op context used while profiling is disabled."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_STAGE = _NullStage()
+
+class _Stage:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "PipelineProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+class PipelineProfiler:
+    """Per-stage timers and counters for the pricing pipeline.
+
+    Disabled by default. While disabled, stage() hands back a shared no-op
+    context and count() returns immediately, so calculate() only pays for
+    an attribute check per stage.
+    """
+    STAGES = ("settings_load", "parse", "override", "distance", "band", "totals", "transfer", "format")
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.reset()
+
+    def reset(self) -> None:
+        self.totals: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.last: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+
+    def stage(self, name: str):
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def record(self, name: str, elapsed: float) -> None:
+        self.totals[name] = self.totals.get(name, 0.0) + elapsed
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.last[name] = elapsed
+
+    def begin_quote(self) -> None:
+        """Start a new quote: clears the per-quote timings shown in the status bar."""
+        if self.enabled:
+            self.counters["quotes"] = self.counters.get("quotes", 0) + 1
+            self.last = {k: v for k, v in self.last.items() if k == "settings_load"}
+
+    def count(self, name: str, n: int = 1) -> None:
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def _ordered_stages(self) -> List[str]:
+        known = [n for n in self.STAGES if n in self.calls]
+        return known + sorted(n for n in self.calls if n not in self.STAGES)
+
+    def rows(self) -> List[List[Any]]:
+        """Table rows: stage, calls, last ms, avg ms, total ms."""
+        rows = []
+        for name in self._ordered_stages():
+            calls = self.calls[name]
+            total = self.totals[name]
+            last = f"{self.last[name] * 1000:.3f}" if name in self.last else "-"
+            rows.append([name, calls, last, f"{total / calls * 1000:.3f}", f"{total * 1000:.3f}"])
+        return rows
+
+    def status_line(self) -> str:
+        """Compact summary of the most recent quote for the status bar."""
+        parts = [f"{name} {self.last[name] * 1000:.2f}ms" for name in self._ordered_stages() if name in self.last and name != "settings_load"]
+        return " | ".join(parts)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "stages": {
+                name: {
+                    "calls": self.calls[name],
+                    "total_ms": round(self.totals[name] * 1000, 6),
+                    "avg_ms": round(self.totals[name] / self.calls[name] * 1000, 6),
+                    "last_ms": round(self.last[name] * 1000, 6) if name in self.last else None,
+                }
+                for name in self._ordered_stages()
+            },
+            "counters": dict(self.counters),
+        }
+
+    def dump_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+PROFILER = PipelineProfiler()
+
 # ------------------------------
 # Helpers
 # ------------------------------
+def _settings_stamp() -> Tuple[int, int, int]:
+    st = os.stat(DATA_FILE)
+    return (SETTINGS_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+
+def write_settings_cache(settings: Dict[str, Any]) -> None:
+    """Store a marshal'd copy of settings keyed on the current settings.json stamp.
+    Best effort: a read-only install folder simply means no cache."""
+    try:
+        data = marshal.dumps((_settings_stamp(), settings))
+        with open(SETTINGS_CACHE_FILE, "wb") as f:
+            f.write(data)
+    except (OSError, ValueError):
+        pass
+
+def _read_settings_cache() -> Optional[Dict[str, Any]]:
+    try:
+        with open(SETTINGS_CACHE_FILE, "rb") as f:
+            stamp, settings = marshal.loads(f.read())
+        if tuple(stamp) == _settings_stamp():
+            return settings
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    return None
+
 def load_settings() -> Dict[str, Any]:
     if not os.path.exists(DATA_FILE):
         with open(DATA_FILE, "w", encoding="utf-8") as f:
             json.dump(DEFAULT_SETTINGS, f, indent=2)
         return DEFAULT_SETTINGS
+    cached = _read_settings_cache()
+    if cached is not None:
+        return cached
     with open(DATA_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+        settings = json.load(f)
+    write_settings_cache(settings)
+    return settings
 
 def save_settings(settings: Dict[str, Any]) -> None:
+    invalidate_transfer_graph()
     with open(DATA_FILE, "w", encoding="utf-8") as f:
         json.dump(settings, f, indent=2)
+    write_settings_cache(settings)
 
 def haversine_miles(a: Dict[str, Any], b: Dict[str, Any]) -> float:
     R = 3958.7613
@@ -252,6 +423,352 @@ def override_business_miles(program: str, dest_iata: str) -> Optional[int]:
     prog_map = ROUTE_BC_OVERRIDES.get(program, {})
     return prog_map.get(label)
 
+# ------------------------------
+# Pricing core (shared by the calculator, batch path and planner)
+# ------------------------------
+def base_miles_per_person(programs: Dict[str, Any], program: str, cabin: str, origin: Dict[str, Any], dest: Dict[str, Any],
+                          airline: str, dist: Optional[float] = None) -> Tuple[int, str, Optional[float]]:
+    """Miles per person before the future ratio: fixed Business override first,
+    then the distance-band chart. Pass `dist` to reuse one distance across programs.
+    Returns (miles, source description, distance or None if not needed)."""
+    prof = PROFILER
+    # Priority 1: Check for fixed Business Class override
+    if cabin == "Business":
+        with prof.stage("override"):
+            fixed_miles = override_business_miles(program, dest["iata"])
+        if fixed_miles is not None:
+            prof.count("override_hits")
+            return fixed_miles, f"Fixed Business Class override for {program} ({find_dest_group(dest['iata'])})", dist
+
+    # Priority 2: Fallback to distance-based band calculation
+    if dist is None:
+        with prof.stage("distance"):
+            dist = haversine_miles(origin, dest)
+    with prof.stage("band"):
+        is_own_airline = (airline.lower() == programs[program].get("homeAirline", "").lower())
+        bands = programs[program]["own"] if is_own_airline else programs[program]["partner"]
+        Y, J = band_price(bands, dist)
+    prof.count("band_lookups")
+    source = (
+        f"Distance-based estimate: {origin['iata']}→{dest['iata']} "
+        f"~ {int(round(dist)):,} mi; {'own' if is_own_airline else 'partner'} chart"
+    )
+    return (J if cabin == "Business" else Y), source, dist
+
+def final_ratio_for(prog: Dict[str, Any], ratio_input: float) -> float:
+    return float(prog.get("ratio_multiplier", 1.0)) * (ratio_input if ratio_input > 0 else 1.0)
+
+def points_for_miles(miles: int, bonus_pct: float) -> int:
+    """Transfer bonus (points→miles): need fewer points with a bonus."""
+    bonus_factor = 1.0 + (bonus_pct / 100.0) if bonus_pct > 0 else 1.0
+    return math.ceil(miles / bonus_factor)
+
+# ------------------------------
+# Transfer graph (bank points → programs, possibly via other programs)
+# ------------------------------
+class TransferGraph:
+    """Directed currency → program transfer edges and cheapest-conversion search.
+
+    Each edge converts source points into target miles at `rate` (target per
+    source point), plus any promo bonus active on the exchange date, with a
+    minimum transfer and a transfer increment (both in source points).
+    Per-edge conversions and whole-path answers are memoized, so ranking every
+    program for a route only does the arithmetic once per distinct amount.
+    Each memo is emptied once it holds CACHE_LIMIT answers.
+    """
+    MAX_HOPS = 3
+    CACHE_LIMIT = 4096
+
+    def __init__(self, edges: List[Dict[str, Any]]):
+        self.edges = edges
+        self.edges_into: Dict[str, List[int]] = {}
+        for i, edge in enumerate(edges):
+            self.edges_into.setdefault(edge["to"], []).append(i)
+        self._edge_cache: Dict[Tuple[int, int, str], int] = {}
+        self._path_cache: Dict[Tuple[str, str, int, str], Optional[Tuple[int, List[str]]]] = {}
+
+    def currencies(self) -> List[str]:
+        """Source currencies that are not themselves programs (e.g. bank points)."""
+        return sorted({e["from"] for e in self.edges} - set(self.edges_into))
+
+    def edge_bonus(self, i: int, on: str) -> float:
+        return sum(float(p.get("bonus", 0)) for p in self.edges[i].get("promos", [])
+                   if p.get("start", "") <= on <= p.get("end", "9999-12-31"))
+
+    def source_points(self, i: int, out_amount: int, on: str) -> int:
+        """Fewest source points on edge i that deliver at least out_amount."""
+        key = (i, out_amount, on)
+        cached = self._edge_cache.get(key)
+        if cached is not None:
+            return cached
+        edge = self.edges[i]
+        rate = float(edge["rate"]) * (1.0 + self.edge_bonus(i, on) / 100.0)
+        points = max(math.ceil(out_amount / rate), int(edge.get("min", 0) or 0))
+        increment = int(edge.get("increment", 1) or 1)
+        points = math.ceil(points / increment) * increment
+        if len(self._edge_cache) >= self.CACHE_LIMIT:
+            self._edge_cache.clear()
+        self._edge_cache[key] = points
+        return points
+
+    def cheapest(self, source: str, target: str, amount: int, on: str) -> Optional[Tuple[int, List[str]]]:
+        """Fewest `source` points needed to end up with `amount` in `target`.
+
+        Works backwards from the target, relaxing edges for up to MAX_HOPS rounds
+        (conversion costs are monotone in the amount, so each node keeps the
+        smallest requirement found). Returns (points, path) or None if unreachable.
+        """
+        if source == target:
+            return amount, [target]
+        key = (source, target, amount, on)
+        if key in self._path_cache:
+            return self._path_cache[key]
+        need: Dict[str, Tuple[int, List[str]]] = {target: (amount, [target])}
+        frontier = [target]
+        for _ in range(self.MAX_HOPS):
+            changed = []
+            for node in frontier:
+                required, path = need[node]
+                for i in self.edges_into.get(node, []):
+                    upstream = self.edges[i]["from"]
+                    if upstream in path:
+                        continue
+                    cand = self.source_points(i, required, on)
+                    current = need.get(upstream)
+                    if current is None or cand < current[0]:
+                        need[upstream] = (cand, [upstream] + path)
+                        changed.append(upstream)
+            frontier = changed
+        result = need.get(source)
+        if len(self._path_cache) >= self.CACHE_LIMIT:
+            self._path_cache.clear()
+        self._path_cache[key] = result
+        return result
+
+_GRAPH_CACHE: Dict[str, Any] = {"edges": None, "graph": None}
+
+def transfer_graph(settings: Dict[str, Any]) -> TransferGraph:
+    """Graph for the current transfer edges, rebuilt only when the list changes."""
+    edges = settings.get("transfers", DEMO_TRANSFERS)
+    if _GRAPH_CACHE["edges"] is not edges:
+        _GRAPH_CACHE["edges"] = edges
+        _GRAPH_CACHE["graph"] = TransferGraph(edges)
+    return _GRAPH_CACHE["graph"]
+
+def invalidate_transfer_graph() -> None:
+    """Forget the graph and its memos, e.g. after the transfer settings were edited in place."""
+    _GRAPH_CACHE["edges"] = None
+    _GRAPH_CACHE["graph"] = None
+
+def rank_programs(settings: Dict[str, Any], costs: Dict[str, int], pax: int, source: str, on: str) -> List[Tuple[str, int, Optional[int], List[str]]]:
+    """(program, miles for all travelers, fewest source points or None, path), cheapest first."""
+    graph = transfer_graph(settings)
+    ranked = []
+    for name, miles in costs.items():
+        found = graph.cheapest(source, name, miles * pax, on)
+        ranked.append((name, miles * pax, found[0] if found else None, found[1] if found else []))
+    ranked.sort(key=lambda r: (r[2] is None, r[2] or 0, r[1]))
+    return ranked
+
+# ------------------------------
+# Redemption planner (N travelers across several programs)
+# ------------------------------
+def program_cost_vector(settings: Dict[str, Any], cabin: str, origin_iata: str, dest_iata: str,
+                        airline: str, ratio_input: float = 1.0, manual_miles: Optional[int] = None) -> Dict[str, int]:
+    """Miles per traveler (after each program's ratio) for every program on one route.
+    The great-circle distance is computed once and shared by all programs, so this
+    is one band/override lookup per program. Raises ValueError on unknown airports."""
+    programs = settings["programs"]
+    airports = settings["airports"]
+    costs = {}
+    if manual_miles is None:
+        origin = airports.get(origin_iata)
+        dest = airports.get(dest_iata)
+        if not (origin and dest):
+            raise ValueError("Please choose valid origin/destination IATA codes.")
+    dist = None
+    for name in sorted(programs):
+        if manual_miles is None:
+            base, _, dist = base_miles_per_person(programs, name, cabin, origin, dest, airline, dist)
+        else:
+            base = manual_miles
+        costs[name] = math.ceil(base * final_ratio_for(programs[name], ratio_input))
+    return costs
+
+def plan_redemption(costs: Dict[str, int], pax: int, balances: Optional[Dict[str, Dict[str, float]]] = None,
+                    bank_points: Optional[int] = None,
+                    convert: Optional[Callable[[str, int], Optional[Tuple[int, List[str]]]]] = None) -> Optional[Dict[str, Any]]:
+    """Cheapest way to ticket `pax` travelers, one program per ticket.
+
+    `costs` is the per-program miles-per-traveler vector from program_cost_vector().
+    `balances` maps program -> {"balance": miles already held, "bonus": transfer bonus %}.
+    Any shortfall in a program is transferred from the shared bank-points pool,
+    limited by `bank_points` (None = unlimited). `convert(program, miles)` prices
+    that transfer as (points, path), or None when the program is unreachable;
+    without it 1 point = (1 + bonus%) miles.
+
+    Solved exactly as a small integer program by dynamic programming over
+    (programs × travelers seated): O(programs × pax²). The objective is the fewest
+    bank points transferred, then the fewest balance miles consumed.
+    Returns None when the balances cannot cover every traveler.
+    """
+    balances = balances or {}
+    options: Dict[Tuple[str, int], Dict[str, Any]] = {}
+    # seated -> (bank points, balance miles used, {program: travelers})
+    best: Dict[int, Tuple[int, int, Dict[str, int]]] = {0: (0, 0, {})}
+    for name, miles in costs.items():
+        entry = balances.get(name, {})
+        held = int(entry.get("balance", 0) or 0)
+        bonus_pct = float(entry.get("bonus", 0) or 0)
+        # option n: seat n travelers on this program
+        for n in range(1, pax + 1):
+            need = n * miles
+            from_balance = min(held, need)
+            shortfall = need - from_balance
+            via: List[str] = []
+            if not shortfall:
+                bank_n = 0
+            elif convert is None:
+                bank_n = points_for_miles(shortfall, bonus_pct)
+            else:
+                found = convert(name, shortfall)
+                if found is None:
+                    break
+                bank_n, via = found
+            options[(name, n)] = {"bank_points": bank_n, "from_balance": from_balance, "via": via}
+        merged = dict(best)
+        for seated, (bank, used, assign) in best.items():
+            for n in range(1, pax - seated + 1):
+                option = options.get((name, n))
+                if option is None:
+                    break
+                cand = (bank + option["bank_points"], used + option["from_balance"])
+                if bank_points is not None and cand[0] > bank_points:
+                    break
+                current = merged.get(seated + n)
+                if current is None or cand < current[:2]:
+                    merged[seated + n] = (cand[0], cand[1], {**assign, name: n})
+        best = merged
+
+    if pax not in best:
+        return None
+    bank, used, assign = best[pax]
+    lines = []
+    for name, n in assign.items():
+        option = options[(name, n)]
+        lines.append({
+            "program": name,
+            "travelers": n,
+            "miles_per_traveler": costs[name],
+            "miles": n * costs[name],
+            "from_balance": option["from_balance"],
+            "bank_points": option["bank_points"],
+            "bonus": float(balances.get(name, {}).get("bonus", 0) or 0) if convert is None else 0.0,
+            "via": option["via"],
+        })
+    return {"pax": pax, "bank_points": bank, "balance_miles": used, "lines": lines}
+
+def format_plan(plan: Optional[Dict[str, Any]], costs: Dict[str, int], bank_points: Optional[int], currency: str = "bank points") -> str:
+    if plan is None:
+        limit = f"{bank_points:,} {currency}" if bank_points is not None else "the given balances"
+        return f"No combination of programs covers every traveler with {limit}."
+    lines = [f"Cheapest plan for {plan['pax']} traveler(s):", ""]
+    for line in plan["lines"]:
+        detail = f"{line['from_balance']:,} from balance"
+        if line["bank_points"]:
+            bonus = f" @ +{line['bonus']:.0f}%" if line["bonus"] > 0 else ""
+            via = f" via {' → '.join(line['via'])}" if len(line["via"]) > 2 else ""
+            detail += f" + {line['bank_points']:,} {currency}{bonus}{via}"
+        lines.append(f"  {line['travelers']} × {line['program']}: {line['miles']:,} miles ({line['miles_per_traveler']:,}/traveler; {detail})")
+    lines += [
+        "",
+        f"TOTAL {currency} to transfer: {plan['bank_points']:,}",
+        f"TOTAL balance miles used: {plan['balance_miles']:,}",
+        "",
+        "Miles per traveler by program:",
+    ]
+    lines += [f"  {name:<24}{miles:>10,}" for name, miles in sorted(costs.items(), key=lambda kv: kv[1])]
+    return "\n".join(lines)
+
+def format_ranking(ranked: List[Tuple[str, int, Optional[int], List[str]]], source: str, pax: int) -> str:
+    lines = [f"Programs ranked by {source} needed for {pax} traveler(s):", ""]
+    for name, miles, points, path in ranked:
+        if points is None:
+            lines.append(f"  {name:<24}{miles:>10,} miles   (no transfer path from {source})")
+        else:
+            lines.append(f"  {name:<24}{miles:>10,} miles   {points:>10,} {source}   {' → '.join(path)}")
+    return "\n".join(lines)
+
+def planner_rows(settings: Dict[str, Any]) -> List[List[Any]]:
+    balances = settings.get("balances", {})
+    return [[name, balances.get(name, {}).get("balance", 0), balances.get(name, {}).get("bonus", 0)] for name in sorted(settings["programs"].keys())]
+
+def trip_inputs(values: Dict[str, Any]):
+    """Passengers, future ratio and exchange date, checked the same way for the
+    calculator, batch, Plan and Rank. Returns (pax, ratio, date) or an error string."""
+    try:
+        pax = int(str(values["-PAX-"]).strip())
+    except ValueError:
+        pax = 0
+    if pax < 1:
+        return "Passengers must be a whole number of 1 or more."
+    try:
+        ratio_input = float(str(values.get("-RATIO-", "1.00") or 1.0).strip())
+    except ValueError:
+        ratio_input = math.nan
+    if not (math.isfinite(ratio_input) and ratio_input > 0):
+        return "Future ratio must be a number greater than 0."
+    try:
+        dt = datetime.strptime(str(values.get("-DATE-") or "").strip(), "%Y-%m-%d")
+    except ValueError:
+        return "Exchange date must be YYYY-MM-DD."
+    return pax, ratio_input, dt
+
+def _planner_inputs(settings: Dict[str, Any], values: Dict[str, Any]):
+    """Shared parsing for Plan / Rank: returns (costs, pax, bank_points, exchange date) or an error string."""
+    trip = trip_inputs(values)
+    if isinstance(trip, str):
+        return trip
+    pax, ratio_input, dt = trip
+    try:
+        bank_str = (values.get("-BANK_POINTS-", "") or "").replace(",", "").strip()
+        bank_points = int(bank_str) if bank_str else None
+        manual_miles = None
+        if not values["-USE_DIST-"]:
+            manual_miles = int(values["-MILES_MANUAL-"].replace(",", "").strip())
+    except ValueError:
+        return "Bank points and manual miles must be numbers."
+    airline = (values.get("-AIRLINE-", "") or "").strip()
+    try:
+        costs = program_cost_vector(settings, values["-CABIN-"], values.get("-ORIGIN-"), values.get("-DEST-"), airline, ratio_input, manual_miles)
+    except ValueError as e:
+        return str(e)
+    return costs, pax, bank_points, dt.strftime("%Y-%m-%d")
+
+def plan(settings: Dict[str, Any], values: Dict[str, Any]) -> str:
+    """Planner tab: route/cabin/passengers/ratio/source come from the Calculator tab."""
+    parsed = _planner_inputs(settings, values)
+    if isinstance(parsed, str):
+        return parsed
+    costs, pax, bank_points, on = parsed
+    source = values.get("-SOURCE-") or ""
+    convert = None
+    if source:
+        graph = transfer_graph(settings)
+        convert = lambda program, miles: graph.cheapest(source, program, miles, on)
+    result = plan_redemption(costs, pax, settings.get("balances", {}), bank_points, convert)
+    return format_plan(result, costs, bank_points, source or "bank points")
+
+def rank(settings: Dict[str, Any], values: Dict[str, Any]) -> str:
+    source = values.get("-SOURCE-") or ""
+    if not source:
+        return "Choose what you pay with ('Pay with' on the Calculator tab) to rank programs."
+    parsed = _planner_inputs(settings, values)
+    if isinstance(parsed, str):
+        return parsed
+    costs, pax, _, on = parsed
+    return format_ranking(rank_programs(settings, costs, pax, source, on), source, pax)
+
 # ------------------------------
 # UI
 # ------------------------------
@@ -259,6 +776,7 @@ def build_layout(settings: Dict[str, Any]):
     programs = sorted(settings["programs"].keys())
     airports = settings["airports"]
     airport_keys = sorted(airports.keys())
+    currencies = transfer_graph(settings).currencies()
 
     calc_col = [
         [sg.Text("Program", size=(12,1)), sg.Combo(programs, default_value=programs[0] if programs else "", key="-PROGRAM-", readonly=True, size=(28,1))],
@@ -267,6 +785,7 @@ def build_layout(settings: Dict[str, Any]):
         [sg.Text("Passengers", size=(12,1)), sg.Spin([i for i in range(1,10)], initial_value=1, key="-PAX-", size=(6,1))],
         [sg.Text("Transfer bonus %", size=(12,1)), sg.Input(key="-BONUS-", size=(10,1), default_text="0"), sg.Text(" (e.g., 20 = +20%)")],
         [sg.Text("Future ratio ×", size=(12,1)), sg.Input(key="-RATIO-", size=(10,1), default_text="1.00"), sg.Text(" (multiplier)")],
+        [sg.Text("Pay with", size=(12,1)), sg.Combo([""] + currencies, default_value="", key="-SOURCE-", readonly=True, size=(20,1)), sg.Text(" (bank points, via transfer partners)")],
         [sg.HorizontalSeparator()],
         [sg.Text("Origin IATA", size=(12,1)), sg.Combo(airport_keys, default_value=settings.get("origin","BKK"), key="-ORIGIN-", readonly=True, size=(10,1))],
         [sg.Text("Destination IATA", size=(12,1)), sg.Combo(airport_keys, default_value="HND", key="-DEST-", readonly=False, size=(10,1))],
@@ -275,10 +794,20 @@ def build_layout(settings: Dict[str, Any]):
         [sg.HorizontalSeparator()],
         [sg.Text("Operating airline", size=(12,1)), sg.Input(key="-AIRLINE-", size=(20,1), default_text="Thai Airways")],
         [sg.Text("Exchange date", size=(12,1)), sg.Input(key="-DATE-", size=(12,1), default_text=datetime.now().strftime("%Y-%m-%d")), sg.Text("YYYY-MM-DD")],
-        [sg.Button("Calculate", key="-CALC-", bind_return_key=True), sg.Button("Reset"), sg.Push(), sg.Button("Quit")],
+        [sg.Button("Calculate", key="-CALC-", bind_return_key=True), sg.Button("Export"), sg.Button("Reset"), sg.Push(), sg.Button("Quit")],
         [sg.HorizontalSeparator()],
         [sg.Text("Results")],
         [sg.Multiline("", key="-RESULT-", size=(90,14), disabled=True, autoscroll=True)],
+        [sg.Checkbox("Show pipeline timings", default=False, key="-PROFILE-", enable_events=True)],
+        [sg.pin(sg.Column([[sg.Table(
+            values=[],
+            headings=["Stage", "Calls", "Last ms", "Avg ms", "Total ms"],
+            auto_size_columns=False,
+            col_widths=[14, 8, 10, 10, 10],
+            justification="right",
+            key="-PROFILE_TABLE-",
+            num_rows=len(PipelineProfiler.STAGES),
+        )]], key="-PROFILE_PANEL-", visible=False))],
     ]
 
     settings_col = [
@@ -299,122 +828,286 @@ def build_layout(settings: Dict[str, Any]):
         [sg.Button("Apply Change"), sg.Push(), sg.Button("Save Settings")],
     ]
 
+    planner_col = [
+        [sg.Text("Cover all passengers as cheaply as possible across your programs.")],
+        [sg.Text("Route, cabin, passengers, airline and ratio are taken from the Calculator tab.")],
+        [sg.Text("Bank points available", size=(18,1)), sg.Input(key="-BANK_POINTS-", size=(14,1), default_text=""), sg.Text(" (in 'Pay with' currency; blank = unlimited)")],
+        [sg.Table(
+            values=planner_rows(settings),
+            headings=["Program", "Balance (miles)", "Transfer bonus %"],
+            auto_size_columns=False,
+            col_widths=[28, 16, 16],
+            justification="left",
+            key="-PLAN_TABLE-",
+            enable_events=True,
+            num_rows=min(10, len(programs)) or 5,
+        )],
+        [sg.Text("Selected Program:"), sg.Input(key="-PLAN_NAME-", size=(28,1), disabled=True)],
+        [sg.Text("Balance (miles)"), sg.Input(key="-PLAN_BAL-", size=(12,1)), sg.Text("Transfer bonus %"), sg.Input(key="-PLAN_BONUS-", size=(6,1)), sg.Button("Set Balance")],
+        [sg.Button("Plan", key="-PLAN-"), sg.Button("Rank Programs", key="-RANK-")],
+        [sg.Multiline("", key="-PLAN_RESULT-", size=(90,14), disabled=True, autoscroll=False)],
+    ]
+
     layout = [
-        [sg.TabGroup([[sg.Tab("Calculator", calc_col), sg.Tab("Settings", settings_col)]], expand_x=True, expand_y=True)],
+        [sg.TabGroup([[sg.Tab("Calculator", calc_col), sg.Tab("Planner", planner_col), sg.Tab("Settings", settings_col)]], expand_x=True, expand_y=True)],
         [sg.StatusBar("Ready", key="-STATUS-")]
     ]
     return layout
 
+# ------------------------------
+# Quote results and rendering
+# ------------------------------
+class Quote:
+    """Structured result of one pricing request. Text is rendered lazily
+    (see `text`), so batch/JSON/CSV callers never pay for string formatting."""
+    FIELDS = (
+        "program", "cabin", "pax", "airline", "final_ratio", "source",
+        "miles_per_person", "bonus_pct", "points_per_person", "total_miles", "total_points",
+        "pay_with", "transfer_points", "transfer_path",
+        "exchange_date", "validity_months", "expiry", "error",
+    )
+    __slots__ = FIELDS + ("_text",)
+
+    def __init__(self, **fields):
+        for name in self.FIELDS:
+            setattr(self, name, fields.get(name))
+        self._text = None
+
+    @classmethod
+    def failed(cls, message: str) -> "Quote":
+        return cls(error=message)
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = render_text(self)
+        return self._text
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+# One entry per output line; a line is skipped when its condition is false.
+TEXT_TEMPLATE = [
+    (None, "Program: {program}   Cabin: {cabin}   Passengers: {pax}"),
+    (None, "Airline: {airline_label}   Future ratio ×: {final_ratio:.2f}"),
+    (None, "{source}"),
+    (None, ""),
+    (None, "Miles per person (after ratio): {miles_per_person:,}"),
+    ("has_bonus", "Transfer bonus: +{bonus_pct:.0f}% → Points per person needed: {points_per_person:,}"),
+    ("no_bonus", "Points per person needed: {points_per_person:,}"),
+    (None, ""),
+    (None, "TOTAL miles:  {total_miles:,}"),
+    (None, "TOTAL points: {total_points:,}"),
+    ("has_transfer", "{pay_with} needed: {transfer_points:,} via {transfer_route}"),
+    ("no_transfer_path", "{pay_with}: no transfer path to {program}"),
+    (None, ""),
+    (None, "Exchange date: {exchange_date} → Expiry in {validity_months} months: {expiry}"),
+    (None, "(Note: real expiry rules can be more complex. You can change validity in Settings.)"),
+]
+
+def render_text(quote: Quote) -> str:
+    if quote.error:
+        return quote.error
+    with PROFILER.stage("format"):
+        fields = quote.as_dict()
+        fields["airline_label"] = quote.airline or "(unspecified)"
+        fields["has_bonus"] = quote.bonus_pct > 0
+        fields["no_bonus"] = not fields["has_bonus"]
+        fields["has_transfer"] = quote.transfer_points is not None
+        fields["no_transfer_path"] = bool(quote.pay_with) and not fields["has_transfer"]
+        fields["transfer_route"] = " → ".join(quote.transfer_path or [])
+        return "\n".join(line.format_map(fields) for cond, line in TEXT_TEMPLATE if cond is None or fields[cond])
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return " → ".join(value)
+    return "" if value is None else value
+
+def write_quotes_csv(quotes: List[Quote], out) -> None:
+    writer = csv.writer(out)
+    writer.writerow(Quote.FIELDS)
+    for q in quotes:
+        writer.writerow([_csv_value(getattr(q, name)) for name in Quote.FIELDS])
+
+def write_quotes_json(quotes: List[Quote], out) -> None:
+    json.dump([q.as_dict() for q in quotes], out, indent=2, ensure_ascii=False)
+    out.write("\n")
+
 # Important CAL ------------------------------
-def calculate(settings: Dict[str, Any], values: Dict[str, Any]) -> str:
+def quote(settings: Dict[str, Any], values: Dict[str, Any]) -> Quote:
+    prof = PROFILER
+    prof.begin_quote()
     programs = settings["programs"]
     airports = settings["airports"]
 
-    program = values["-PROGRAM-"]
-    cabin = values["-CABIN-"]
-    pax = int(values["-PAX-"])
-    bonus_pct = float(values.get("-BONUS-", "0") or 0)
-    ratio_input = float(values.get("-RATIO-", "1.00") or 1.0)
-    airline = (values.get("-AIRLINE-", "") or "").strip()
-    use_dist = values["-USE_DIST-"]
-    miles_manual = values["-MILES_MANUAL-"].strip()
-    exchange_date_str = values["-DATE-"]
-    
+    with prof.stage("parse"):
+        program = values["-PROGRAM-"]
+        cabin = values["-CABIN-"]
+        bonus_str = str(values.get("-BONUS-", "0") or 0).strip()
+        airline = (values.get("-AIRLINE-", "") or "").strip()
+        use_dist = values["-USE_DIST-"]
+        miles_manual = values["-MILES_MANUAL-"].strip()
+        exchange_date_str = values["-DATE-"]
+        pay_with = values.get("-SOURCE-") or ""
+
     # Input validation
     if not program:
-        return "Please select a program."
-    
+        prof.count("errors")
+        return Quote.failed("Please select a program.")
+    if program not in programs:
+        prof.count("errors")
+        return Quote.failed(f"Unknown program: {program}.")
+
+    trip = trip_inputs(values)
+    if isinstance(trip, str):
+        prof.count("errors")
+        return Quote.failed(trip)
+    pax, ratio_input, dt = trip
     try:
-        dt = datetime.strptime(exchange_date_str, "%Y-%m-%d")
+        bonus_pct = float(bonus_str)
     except ValueError:
-        return "Exchange date must be YYYY-MM-DD."
+        bonus_pct = math.nan
+    if not math.isfinite(bonus_pct):
+        prof.count("errors")
+        return Quote.failed("Transfer bonus % must be a number.")
 
     # Determine miles per person based on user choice
-    base_per_person = 0
-    source = ""
-
     if use_dist:
-        origin_iata = values.get("-ORIGIN-")
-        dest_iata = values.get("-DEST-")
-        origin = airports.get(origin_iata)
-        dest = airports.get(dest_iata)
+        origin = airports.get(values.get("-ORIGIN-"))
+        dest = airports.get(values.get("-DEST-"))
         if not (origin and dest):
-            return "Please choose valid origin/destination IATA codes."
-        
-        # Priority 1: Check for fixed Business Class override
-        if cabin == "Business":
-            fixed_miles = override_business_miles(program, dest["iata"])
-            if fixed_miles is not None:
-                base_per_person = fixed_miles
-                source = f"Fixed Business Class override for {program} ({find_dest_group(dest['iata'])})"
-            
-        # Priority 2: Fallback to distance-based band calculation
-        if base_per_person == 0:
-            dist = haversine_miles(origin, dest)
-            is_own_airline = (airline.lower() == programs[program].get("homeAirline", "").lower())
-            
-            bands = programs[program]["own"] if is_own_airline else programs[program]["partner"]
-            Y, J = band_price(bands, dist)
-            base_per_person = J if cabin == "Business" else Y
-            
-            source = (
-                f"Distance-based estimate: {origin['iata']}→{dest['iata']} "
-                f"~ {int(round(dist)):,} mi; {'own' if is_own_airline else 'partner'} chart"
-            )
-            
+            prof.count("errors")
+            return Quote.failed("Please choose valid origin/destination IATA codes.")
+        base_per_person, source, _ = base_miles_per_person(programs, program, cabin, origin, dest, airline)
     else:  # Manual miles entered
         if not miles_manual:
-            return "Enter 'miles per person' or enable distance-based estimate."
+            prof.count("errors")
+            return Quote.failed("Enter 'miles per person' or enable distance-based estimate.")
         try:
             base_per_person = int(miles_manual.replace(",", "").strip())
         except ValueError:
-            return "Miles per person must be a number."
+            prof.count("errors")
+            return Quote.failed("Miles per person must be a number.")
         source = "Manual miles per person"
 
-    # All calculations now proceed from a single, determined `base_per_person` value.
-    prog = programs[program]
-    final_ratio = (float(prog.get("ratio_multiplier", 1.0))) * (ratio_input if ratio_input > 0 else 1.0)
-    validity_months = int(prog.get("validity_months", 36))
-    
-    # Apply future ratio (increase)
-    adj_per_person = math.ceil(base_per_person * final_ratio)
-    
-    # Transfer bonus (points→miles): need fewer points with a bonus
-    bonus_factor = 1.0 + (bonus_pct / 100.0) if bonus_pct > 0 else 1.0
-    points_needed_per_person = math.ceil(adj_per_person / bonus_factor)
-    
-    total_miles = adj_per_person * pax
-    total_points = points_needed_per_person * pax
-    
-    # Calculate expiry date
-    expiry_dt = add_months(dt, validity_months)
-    expiry_str = expiry_dt.strftime("%Y-%m-%d")
-
-    # Format output
-    lines = [
-        f"Program: {program}   Cabin: {cabin}   Passengers: {pax}",
-        f"Airline: {airline or '(unspecified)'}   Future ratio ×: {final_ratio:.2f}",
-        source,
-        "",
-        f"Miles per person (after ratio): {adj_per_person:,}",
-        f"Transfer bonus: +{bonus_pct:.0f}% → Points per person needed: {points_needed_per_person:,}" if bonus_pct > 0 else f"Points per person needed: {points_needed_per_person:,}",
-        "",
-        f"TOTAL miles:  {total_miles:,}",
-        f"TOTAL points: {total_points:,}",
-        "",
-        f"Exchange date: {exchange_date_str} → Expiry in {validity_months} months: {expiry_str}",
-        "(Note: real expiry rules can be more complex. You can change validity in Settings.)"
-    ]
-    
-    return "\n".join(lines)
+    with prof.stage("totals"):
+        # All calculations now proceed from a single, determined `base_per_person` value.
+        prog = programs[program]
+        final_ratio = final_ratio_for(prog, ratio_input)
+        validity_months = int(prog.get("validity_months", 36))
+
+        # Apply future ratio (increase)
+        adj_per_person = math.ceil(base_per_person * final_ratio)
+        points_needed_per_person = points_for_miles(adj_per_person, bonus_pct)
+
+        total_miles = adj_per_person * pax
+        total_points = points_needed_per_person * pax
+
+        # Calculate expiry date
+        expiry_dt = add_months(dt, validity_months)
+
+    transfer_points, transfer_path = None, None
+    if pay_with:
+        with prof.stage("transfer"):
+            found = transfer_graph(settings).cheapest(pay_with, program, total_miles, dt.strftime("%Y-%m-%d"))
+        if found is not None:
+            transfer_points, transfer_path = found
+
+    return Quote(
+        program=program, cabin=cabin, pax=pax, airline=airline, final_ratio=final_ratio, source=source,
+        miles_per_person=adj_per_person, bonus_pct=bonus_pct, points_per_person=points_needed_per_person,
+        total_miles=total_miles, total_points=total_points,
+        pay_with=pay_with, transfer_points=transfer_points, transfer_path=transfer_path,
+        exchange_date=exchange_date_str, validity_months=validity_months, expiry=expiry_dt.strftime("%Y-%m-%d"),
+    )
+
+def calculate(settings: Dict[str, Any], values: Dict[str, Any]) -> str:
+    """Price one request and render it as the text shown in the Results box."""
+    return quote(settings, values).text
 
 def build_window(settings: Dict[str, Any]):
     layout = build_layout(settings)
     return sg.Window(APP_NAME, layout, resizable=True, finalize=True)
 
-def main():
-    settings = load_settings()
+# ------------------------------
+# Batch / CLI
+# ------------------------------
+def batch_values(settings: Dict[str, Any], row: Dict[str, str]) -> Dict[str, Any]:
+    """Map one CSV row onto the same values dict the GUI hands to calculate()."""
+    miles = (row.get("miles") or "").strip()
+    return {
+        "-PROGRAM-": (row.get("program") or "").strip(),
+        "-CABIN-": (row.get("cabin") or "Economy").strip(),
+        "-PAX-": row.get("pax") or 1,
+        "-BONUS-": row.get("bonus") or "0",
+        "-RATIO-": row.get("ratio") or "1.00",
+        "-ORIGIN-": (row.get("origin") or settings.get("origin", "BKK")).strip().upper(),
+        "-DEST-": (row.get("dest") or "").strip().upper(),
+        "-USE_DIST-": not miles,
+        "-MILES_MANUAL-": miles,
+        "-AIRLINE-": row.get("airline") or "",
+        "-DATE-": (row.get("date") or datetime.now().strftime("%Y-%m-%d")).strip(),
+        "-SOURCE-": (row.get("source") or "").strip(),
+    }
+
+def run_batch(settings: Dict[str, Any], path: str, out=None, fmt: str = "text") -> int:
+    """Price every row of a CSV file (columns: program, cabin, pax, origin, dest,
+    airline, date, bonus, ratio, miles, source) and write the results to `out`
+    as text, JSON or CSV. JSON/CSV never render the text form."""
+    out = out or sys.stdout
+    quotes = []
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for line_no, row in enumerate(csv.DictReader(f), start=2):
+            # One unexpected failure must not cost the other rows their results
+            try:
+                quotes.append(quote(settings, batch_values(settings, row)))
+            except Exception as e:
+                PROFILER.count("errors")
+                quotes.append(Quote.failed(f"Row {line_no}: {e!r}"))
+    if fmt == "json":
+        write_quotes_json(quotes, out)
+    elif fmt == "csv":
+        write_quotes_csv(quotes, out)
+    else:
+        out.write("\n\n".join(q.text for q in quotes) + ("\n" if quotes else ""))
+    return len(quotes)
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=APP_NAME)
+    parser.add_argument("--batch", metavar="CSV", help="price every row of CSV without opening the GUI")
+    parser.add_argument("--format", choices=("text", "json", "csv"), default="text", help="batch output format (default text)")
+    parser.add_argument("--profile", action="store_true", help="enable per-stage pipeline timings")
+    parser.add_argument("--profile-json", metavar="PATH", help="write pipeline timings to PATH as JSON (implies --profile)")
+    return parser.parse_args(argv)
+
+def refresh_profile_panel(window) -> None:
+    window["-PROFILE_TABLE-"].update(values=PROFILER.rows())
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    PROFILER.enabled = bool(args.profile or args.profile_json)
+
+    with PROFILER.stage("settings_load"):
+        settings = load_settings()
+
+    if args.batch:
+        run_batch(settings, args.batch, fmt=args.format)
+        if args.profile_json:
+            PROFILER.dump_json(args.profile_json)
+        return
+
     window = build_window(settings)
+    probe_path = os.environ.get(STARTUP_PROBE_ENV)
+    if probe_path:
+        # Startup benchmark run (see startup_bench.py): report and leave
+        with open(probe_path, "w", encoding="utf-8") as f:
+            f.write(f"{time.time():.6f}\n")
+        window.close()
+        return
+    if PROFILER.enabled:
+        window["-PROFILE-"].update(True)
+        window["-PROFILE_PANEL-"].update(visible=True)
+        refresh_profile_panel(window)
 
     # Preselect first row in settings table
     if settings["programs"]:
@@ -424,6 +1117,7 @@ def main():
         window["-EDIT_VALID-"].update(str(settings["programs"][first].get("validity_months", 36)))
         window["-EDIT_RATIO-"].update(str(settings["programs"][first].get("ratio_multiplier", 1.0)))
 
+    last_quote = None
     while True:
         event, values = window.read()
         if event in (sg.WINDOW_CLOSED, "Quit"):
@@ -435,12 +1129,47 @@ def main():
             window["-PAX-"].update(1)
             window["-MILES_MANUAL-"].update("")
             window["-RESULT-"].update("")
+            last_quote = None
             window["-STATUS-"].update("Reset complete.")
 
         if event == "-CALC-":
-            result = calculate(settings, values)
-            window["-RESULT-"].update(result)
-            window["-STATUS-"].update("Calculated.")
+            if PROFILER.enabled:
+                start = time.perf_counter()
+                last_quote = quote(settings, values)
+                window["-RESULT-"].update(last_quote.text)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                window["-STATUS-"].update(f"Calculated in {elapsed_ms:.2f}ms: {PROFILER.status_line()}")
+                refresh_profile_panel(window)
+            else:
+                last_quote = quote(settings, values)
+                window["-RESULT-"].update(last_quote.text)
+                window["-STATUS-"].update("Calculated.")
+
+        if event == "Export":
+            if last_quote is None or last_quote.error:
+                sg.popup_error("Calculate a quote first.")
+                continue
+            path = sg.popup_get_file("Export quote as", save_as=True, default_extension=".json",
+                                     file_types=(("JSON", "*.json"), ("CSV", "*.csv")))
+            if path:
+                try:
+                    with open(path, "w", encoding="utf-8", newline="") as f:
+                        if path.lower().endswith(".csv"):
+                            write_quotes_csv([last_quote], f)
+                        else:
+                            write_quotes_json([last_quote], f)
+                except OSError as e:
+                    sg.popup_error(f"Could not export to {path}:\n{e}")
+                    window["-STATUS-"].update("Export failed.")
+                    continue
+                window["-STATUS-"].update(f"Exported to {os.path.basename(path)}.")
+
+        if event == "-PROFILE-":
+            PROFILER.enabled = values["-PROFILE-"]
+            PROFILER.reset()
+            window["-PROFILE_PANEL-"].update(visible=PROFILER.enabled)
+            refresh_profile_panel(window)
+            window["-STATUS-"].update("Pipeline timings on." if PROFILER.enabled else "Pipeline timings off.")
 
         if event == "-PROG_TABLE-":
             try:
@@ -453,6 +1182,40 @@ def main():
             except Exception:
                 pass
 
+        if event == "-PLAN_TABLE-":
+            try:
+                selected = values["-PLAN_TABLE-"][0]
+                name = sorted(settings["programs"].keys())[selected]
+                entry = settings.get("balances", {}).get(name, {})
+                window["-PLAN_NAME-"].update(name)
+                window["-PLAN_BAL-"].update(str(entry.get("balance", 0)))
+                window["-PLAN_BONUS-"].update(str(entry.get("bonus", 0)))
+            except Exception:
+                pass
+
+        if event == "Set Balance":
+            name = values["-PLAN_NAME-"]
+            if not name or name not in settings["programs"]:
+                sg.popup_error("Select a program first from the table.")
+                continue
+            try:
+                balance = int(values["-PLAN_BAL-"].replace(",", "") or 0)
+                bonus = float(values["-PLAN_BONUS-"] or 0)
+            except ValueError:
+                sg.popup_error("Balance must be whole miles; bonus must be a number.")
+                continue
+            settings.setdefault("balances", {})[name] = {"balance": balance, "bonus": bonus}
+            window["-PLAN_TABLE-"].update(values=planner_rows(settings))
+            window["-STATUS-"].update(f"Updated balance for {name}.")
+
+        if event == "-RANK-":
+            window["-PLAN_RESULT-"].update(rank(settings, values))
+            window["-STATUS-"].update("Ranked.")
+
+        if event == "-PLAN-":
+            window["-PLAN_RESULT-"].update(plan(settings, values))
+            window["-STATUS-"].update("Planned.")
+
         if event == "Apply Change":
             name = values["-EDIT_NAME-"]
             if not name or name not in settings["programs"]:
@@ -475,6 +1238,8 @@ def main():
             window["-STATUS-"].update("Settings saved to settings.json.")
 
     window.close()
+    if args.profile_json:
+        PROFILER.dump_json(args.profile_json)
 
 if __name__ == "__main__":
     main()
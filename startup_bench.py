@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Startup benchmark – time-to-first-window for the Mileage Calculator
+- Launches the app (script or frozen exe) several times
+- The app writes a timestamp once its window is finalized, then exits
+  (MILEAGE_STARTUP_PROBE, see mileage_gui.main)
+- Reports min / median / max milliseconds from process launch
+
+    python startup_bench.py                                  # python mileage_gui.py
+    python startup_bench.py --exe dist\\mileage\\mileage.exe    # Mileage_fast.spec build
+    python startup_bench.py --exe dist\\mileage.exe            # Mileage.spec (onefile) build
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+from typing import List, Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_SCRIPT = os.path.join(BASE_DIR, "mileage_gui.py")
+PROBE_ENV = "MILEAGE_STARTUP_PROBE"
+
+def measure_once(cmd: List[str], timeout: float) -> float:
+    """Run the app once and return milliseconds from launch to first window."""
+    fd, probe_path = tempfile.mkstemp(prefix="mileage_probe_", suffix=".txt")
+    os.close(fd)
+    env = dict(os.environ)
+    env[PROBE_ENV] = probe_path
+    env.setdefault("PYTHONPATH", os.path.join(BASE_DIR, "FreeSimpleGUI-main"))
+    try:
+        start = time.time()
+        proc = subprocess.run(cmd, env=env, timeout=timeout, capture_output=True)
+        with open(probe_path, "r", encoding="utf-8") as f:
+            stamp = f.read().strip()
+        if not stamp:
+            err = proc.stderr.decode(errors="replace").strip()
+            raise RuntimeError(f"app exited ({proc.returncode}) without opening a window{': ' + err if err else ''}")
+        return (float(stamp) - start) * 1000
+    finally:
+        os.remove(probe_path)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure Mileage Calculator time-to-first-window")
+    parser.add_argument("--exe", help="frozen executable to launch (default: run mileage_gui.py with this Python)")
+    parser.add_argument("--runs", type=int, default=5, help="number of launches (default 5)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds to wait for each launch")
+    args = parser.parse_args(argv)
+
+    cmd = [args.exe] if args.exe else [sys.executable, APP_SCRIPT]
+    times = [measure_once(cmd, args.timeout) for _ in range(args.runs)]
+    print(f"{' '.join(cmd)}")
+    print(f"  runs: {len(times)}")
+    print(f"  first window (ms): min {min(times):.0f}   median {statistics.median(times):.0f}   max {max(times):.0f}")
+    print(f"  first launch (ms): {times[0]:.0f}")
+
+if __name__ == "__main__":
+    main()